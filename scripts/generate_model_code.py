@@ -0,0 +1,392 @@
+"""Generate optimized NumPy modules evaluating parametric models and their Jacobians.
+
+Each model is specified symbolically, as a sequence of intermediate definitions (such as h1 = exp(logh1), or the rate
+of a state transition) leading to the model's effect. The effect and its derivative with respect to every fit
+parameter are then differentiated through those definitions by the chain rule, and common subexpressions are
+eliminated across all of them, so each generated module computes every shared intermediate only once.
+
+Usage (requires sympy, and black to format the output; install them with ``pip install -e ".[codegen]"``):
+
+    python scripts/generate_model_code.py            # regenerate every module
+    python scripts/generate_model_code.py musyc      # regenerate the named modules
+
+To support another model, write a function returning its ModelSpec and add it to SPECS.
+"""
+
+import argparse
+import textwrap
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import sympy
+from sympy.printing.numpy import NumPyPrinter
+from sympy.printing.precedence import PRECEDENCE
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+HEADER = '''#    Copyright (C) 2020 David J. Wooten
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# This file is generated by scripts/generate_model_code.py. Do not edit it by hand.
+
+"""{description}"""
+
+import numpy as np
+'''
+
+
+class ModelSpec:
+    """Symbolic specification of a model, from which its module is generated."""
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        description: str,
+        arguments: Sequence[sympy.Symbol],
+        parameters: Sequence[sympy.Symbol],
+        definitions: Sequence[Tuple[sympy.Symbol, sympy.Expr]],
+        effect: sympy.Expr,
+        logarithms: Sequence[Tuple[sympy.Symbol, sympy.Symbol]] = (),
+    ):
+        """Ctor.
+
+        :param str name: Short name used to select the model from the command line
+        :param str path: Path of the generated module, relative to the repository root
+        :param str description: Module docstring
+        :param Sequence[sympy.Symbol] arguments: Arguments of the generated functions, in order
+        :param Sequence[sympy.Symbol] parameters: Fit parameters, in the order of the Jacobian's columns
+        :param Sequence[Tuple[sympy.Symbol, sympy.Expr]] definitions: Intermediate quantities, each defined in terms
+            of the arguments and earlier definitions
+        :param sympy.Expr effect: The model's effect, in terms of the arguments and definitions
+        :param Sequence[Tuple[sympy.Symbol, sympy.Symbol]] logarithms: (argument, name) pairs of arguments whose
+            logarithms the Jacobian can be passed precomputed, such as (d1, logd1)
+        """
+        self.name = name
+        self.path = path
+        self.description = description
+        self.arguments = list(arguments)
+        self.parameters = list(parameters)
+        self.definitions = list(definitions)
+        self.effect = effect
+        self.logarithms = list(logarithms)
+
+    def jacobian(self) -> List[sympy.Expr]:
+        """Derivatives of the effect with respect to each parameter, by the chain rule through the definitions."""
+        derivatives: Dict[sympy.Symbol, List[sympy.Expr]] = {}
+        for symbol, expression in self.definitions:
+            derivatives[symbol] = self._total_derivatives(expression, derivatives)
+        # Differentiation re-expands definitions (such as d/dlogh1 exp(logh1) = exp(logh1)), so refer back to them
+        defined = [(expression, symbol) for symbol, expression in reversed(self.definitions)]
+        # Split logarithms of products (log(alpha*d) = log(alpha) + log(d)), so those of exponentiated parameters
+        # (log(alpha) = logalpha) and of arguments with precomputed logarithms need not be evaluated
+        logarithms = {
+            sympy.log(symbol): expression.args[0]
+            for symbol, expression in self.definitions
+            if isinstance(expression, sympy.exp)
+        }
+        logarithms.update((sympy.log(argument), name) for argument, name in self.logarithms)
+        return [
+            sympy.expand_log(derivative.subs(defined), force=True).xreplace(logarithms)
+            for derivative in self._total_derivatives(self.effect, derivatives)
+        ]
+
+    def _total_derivatives(
+        self, expression: sympy.Expr, derivatives: Dict[sympy.Symbol, List[sympy.Expr]]
+    ) -> List[sympy.Expr]:
+        """Derivatives of an expression with respect to each parameter, given those of the definitions it uses."""
+        total = [sympy.diff(expression, parameter) for parameter in self.parameters]
+        for symbol in expression.free_symbols & derivatives.keys():
+            partial = sympy.diff(expression, symbol)
+            total = [t + partial * d for t, d in zip(total, derivatives[symbol])]
+        return total
+
+
+class _Printer(NumPyPrinter):
+    """Prints numpy code using the ``np`` alias, and ``np.float_power`` for non-integer powers.
+
+    float_power avoids integer overflow and invalid integer powers when doses are passed as integer arrays.
+    """
+
+    def _print_Pow(self, expr, rational=False):
+        if expr.exp.is_Integer:
+            if expr.exp == -1:
+                return f"1 / ({self._print(expr.base)})"
+            return f"({self._print(expr.base)}) ** {self._print(expr.exp)}"
+        return f"np.float_power({self._print(expr.base)}, {self._print(expr.exp)})"
+
+    def _module_format(self, fqn, register=True):
+        return fqn.replace("numpy.", "np.")
+
+
+class _ScalarPrinter(_Printer):
+    """Prints code for scalar arguments, using ``**`` for every power so that it compiles with numba."""
+
+    def _print_Pow(self, expr, rational=False):
+        if expr.exp.is_Integer:
+            return super()._print_Pow(expr, rational=rational)
+        base = self.parenthesize(expr.base, PRECEDENCE["Pow"], strict=True)
+        exponent = self.parenthesize(expr.exp, PRECEDENCE["Pow"], strict=True)
+        return f"{base} ** {exponent}"
+
+
+def _common_subexpressions(
+    outputs: Sequence[sympy.Expr], prefix: str = "x", printer: Optional[NumPyPrinter] = None
+) -> Tuple[List[str], List[sympy.Expr]]:
+    """Lines assigning the common subexpressions of the outputs, and the outputs in terms of them."""
+    if printer is None:
+        printer = _Printer()
+    replacements, reduced = sympy.cse(outputs, symbols=sympy.numbered_symbols(prefix), optimizations="basic")
+    lines = [f"{printer.doprint(symbol)} = {printer.doprint(expression)}" for symbol, expression in replacements]
+    return lines, reduced
+
+
+def generate(spec: ModelSpec) -> str:
+    """Source of the module evaluating the model's effect and Jacobian.
+
+    The definitions are evaluated by ``evaluate_intermediates()``. ``model()`` and ``jacobian()`` call it unless they
+    are passed its result, so a caller evaluating both at the same arguments can evaluate the definitions once.
+
+    ``model_point()`` and ``jacobian_point()`` evaluate the same expressions at a single dose, with scalar arguments.
+    They are compiled into loops over doses by the numba backend (see ``synergy.utils.kernels``).
+    """
+    printer = _Printer()
+    signature = ", ".join(str(argument) for argument in spec.arguments)
+    defined = ", ".join(str(symbol) for symbol, _ in spec.definitions)
+    indent = "    "
+    intermediates_docstring = [
+        "",
+        f"{indent}:param tuple intermediates: evaluate_intermediates() of the same arguments, if it was already called",
+    ]
+    unpack_intermediates = [
+        f"{indent}if intermediates is None:",
+        f"{2 * indent}intermediates = evaluate_intermediates({signature})",
+        f"{indent}{defined} = intermediates",
+    ]
+
+    intermediates = [
+        f"def evaluate_intermediates({signature}):",
+        f'{indent}"""Evaluates the quantities shared by model() and jacobian()."""',
+        *(
+            f"{indent}{printer.doprint(symbol)} = {printer.doprint(expression)}"
+            for symbol, expression in spec.definitions
+        ),
+        f"{indent}return {defined}",
+    ]
+
+    model = [
+        f"def model({signature}, intermediates=None):",
+        f'{indent}"""Evaluates the model\'s effect.',
+        *intermediates_docstring,
+        f'{indent}"""',
+        *unpack_intermediates,
+        f"{indent}return {printer.doprint(spec.effect)}",
+    ]
+
+    names = ", ".join(f"j_{parameter}" for parameter in spec.parameters)
+    jacobian_lines, columns = _common_subexpressions(spec.jacobian())
+    description = (
+        "Returns an array whose last axis holds the derivatives with respect to "
+        f"{', '.join(map(str, spec.parameters))}."
+        " Derivatives that are undefined at zero dose (such as d**h * log(d)) are set to 0."
+    )
+    logarithms = "".join(f", {name}=None" for _, name in spec.logarithms)
+    jacobian = [
+        f"def jacobian({signature}, intermediates=None{logarithms}):",
+        f'{indent}"""Evaluates the Jacobian of the model.',
+        "",
+        *textwrap.wrap(description, width=116, initial_indent=indent, subsequent_indent=indent),
+        *intermediates_docstring,
+        *(
+            f"{indent}:param ArrayLike {name}: np.log({argument}), if it was already calculated"
+            for argument, name in spec.logarithms
+        ),
+        f'{indent}"""',
+        *unpack_intermediates,
+        f'{indent}with np.errstate(divide="ignore", invalid="ignore"):',
+        *(
+            line
+            for argument, name in spec.logarithms
+            for line in (f"{2 * indent}if {name} is None:", f"{3 * indent}{name} = np.log({argument})")
+        ),
+        *(2 * indent + line for line in jacobian_lines),
+        *(
+            f"{2 * indent}j_{parameter} = {printer.doprint(column)}"
+            for parameter, column in zip(spec.parameters, columns)
+        ),
+        f"{indent}jac = np.stack(np.broadcast_arrays({names}), axis=-1)",
+        f"{indent}jac[np.isnan(jac)] = 0",
+        f"{indent}return jac",
+    ]
+
+    scalar_printer = _ScalarPrinter()
+    scalar_definitions = [
+        f"{indent}{scalar_printer.doprint(symbol)} = {scalar_printer.doprint(expression)}"
+        for symbol, expression in spec.definitions
+    ]
+    model_point = [
+        f"def model_point({signature}):",
+        f'{indent}"""Evaluates the model\'s effect at a single dose."""',
+        *scalar_definitions,
+        f"{indent}return {scalar_printer.doprint(spec.effect)}",
+    ]
+
+    scalar_jacobian_lines, scalar_columns = _common_subexpressions(spec.jacobian(), printer=scalar_printer)
+    logarithm_names = "".join(f"{name}, " for _, name in spec.logarithms)
+    jacobian_point = [
+        f"def jacobian_point(out, {logarithm_names}{signature}):",
+        f'{indent}"""Writes the Jacobian of the model at a single dose to the 1D array out, as a row of jacobian().',
+        "",
+        *(f"{indent}:param float {name}: np.log({argument})" for argument, name in spec.logarithms),
+        f'{indent}"""',
+        *scalar_definitions,
+        *(indent + line for line in scalar_jacobian_lines),
+        *(f"{indent}out[{index}] = {scalar_printer.doprint(column)}" for index, column in enumerate(scalar_columns)),
+        f"{indent}for index in range({len(scalar_columns)}):",
+        f"{2 * indent}if np.isnan(out[index]):",
+        f"{3 * indent}out[index] = 0",
+    ]
+
+    functions = ["\n".join(function) for function in (intermediates, model, jacobian, model_point, jacobian_point)]
+    source = HEADER.format(description=spec.description) + "\n\n" + "\n\n\n".join(functions)
+    return _format(source + "\n")
+
+
+def _format(source: str) -> str:
+    try:
+        import black
+    except ImportError:
+        return source
+    return black.format_str(source, mode=black.Mode(line_length=120))
+
+
+def musyc_2d(fit_gamma: bool = True) -> ModelSpec:
+    """The 2-drug MuSyC model, with parameters fit on log scale (except E).
+
+    MuSyC's population has four states: unaffected (U), affected by drug 1 (A1), drug 2 (A2), or both (A3). The
+    effect is the occupancy-weighted sum of each state's E, with occupancies from the steady state of the transitions
+    between states.
+
+    :param bool fit_gamma: If False, gamma12 and gamma21 are fixed at 1, so neither they nor their derivatives appear
+        in the generated code
+    """
+    d1, d2, r1r, r2r = sympy.symbols("d1 d2 r1r r2r", positive=True)
+    E0, E1, E2, E3 = sympy.symbols("E0 E1 E2 E3", real=True)
+    logh1, logh2, logC1, logC2, logalpha12, logalpha21, loggamma12, loggamma21 = sympy.symbols(
+        "logh1 logh2 logC1 logC2 logalpha12 logalpha21 loggamma12 loggamma21", real=True
+    )
+    h1, h2, r1, r2, alpha12, alpha21, gamma12, gamma21 = sympy.symbols(
+        "h1 h2 r1 r2 alpha12 alpha21 gamma12 gamma21", positive=True
+    )
+    # Transition rates: k1 (U -> A1), k2 (U -> A2), k12 (A1 -> A3), k21 (A2 -> A3), and their reverses
+    k1, k2, k12, k21 = sympy.symbols("k1 k2 k12 k21", nonnegative=True)
+
+    definitions = [
+        (h1, sympy.exp(logh1)),
+        (h2, sympy.exp(logh2)),
+        (r1, r1r * sympy.exp(-h1 * logC1)),
+        (r2, r2r * sympy.exp(-h2 * logC2)),
+        (alpha12, sympy.exp(logalpha12)),
+        (alpha21, sympy.exp(logalpha21)),
+        (k1, r1 * d1**h1),
+        (k2, r2 * d2**h2),
+    ]
+    if fit_gamma:
+        k12r, k21r = sympy.symbols("k12r k21r", nonnegative=True)
+        definitions += [
+            (gamma12, sympy.exp(loggamma12)),
+            (gamma21, sympy.exp(loggamma21)),
+            (k12, r2**gamma12 * (alpha12 * d2) ** (gamma12 * h2)),
+            (k21, r1**gamma21 * (alpha21 * d1) ** (gamma21 * h1)),
+            (k12r, r2r**gamma12),
+            (k21r, r1r**gamma21),
+        ]
+    else:
+        k12r, k21r = r2r, r1r
+        definitions += [
+            (k12, r2 * (alpha12 * d2) ** h2),
+            (k21, r1 * (alpha21 * d1) ** h1),
+        ]
+    # Unnormalized occupancies of U, A1, A2, and A3, and their sum
+    weights = sympy.symbols("w0 w1 w2 w3", nonnegative=True)
+    total = sympy.Symbol("w", positive=True)
+    balance = [
+        [-(k1 + k2), r1r, r2r, 0],
+        [k1, -(r1r + k12), 0, k12r],
+        [k2, 0, -(r2r + k21), k21r],
+    ]
+    definitions += list(zip(weights, _steady_state_weights(balance)))
+    definitions.append((total, sum(weights)))
+    logd1, logd2 = sympy.symbols("logd1 logd2", real=True)
+    parameters = [E0, E1, E2, E3, logh1, logh2, logC1, logC2, logalpha12, logalpha21]
+    if fit_gamma:
+        name = "musyc"
+        description = "Effect and Jacobian of the 2-drug MuSyC model, with h, C, alpha, and gamma on log scale."
+        parameters += [loggamma12, loggamma21]
+    else:
+        name = "musyc_no_gamma"
+        description = (
+            "Effect and Jacobian of the 2-drug MuSyC model with gamma fixed at 1, and h, C, alpha on log scale."
+        )
+    return ModelSpec(
+        name=name,
+        path=f"synergy/combination/generated/{name}.py",
+        description=description,
+        arguments=[d1, d2] + parameters[:8] + [r1r, r2r] + parameters[8:],
+        parameters=parameters,
+        definitions=definitions,
+        effect=(E0 * weights[0] + E1 * weights[1] + E2 * weights[2] + E3 * weights[3]) / total,
+        logarithms=[(d1, logd1), (d2, logd2)],
+    )
+
+
+def musyc_2d_no_gamma() -> ModelSpec:
+    """The 2-drug MuSyC model with gamma12 = gamma21 = 1."""
+    return musyc_2d(fit_gamma=False)
+
+
+def _steady_state_weights(balance: Sequence[Sequence[sympy.Expr]]) -> List[sympy.Expr]:
+    """Unnormalized steady-state occupancies of a chain, given all but one of its balance equations (as matrix rows).
+
+    The missing balance equation is replaced by the constraint that occupancies sum to 1. By Cramer's rule, each
+    occupancy is then a cofactor of the constraint row divided by the determinant, which is the sum of those cofactors.
+    """
+    n_states = len(balance[0])
+    matrix = sympy.Matrix([list(row) for row in balance] + [[1] * n_states])
+    # The sign makes each weight a sum of (positive) products of rates
+    sign = (-1) ** (n_states - 1)
+    return [sympy.expand(sign * matrix.cofactor(n_states - 1, state)) for state in range(n_states)]
+
+
+SPECS: Dict[str, Callable[[], ModelSpec]] = {
+    "musyc": musyc_2d,
+    "musyc_no_gamma": musyc_2d_no_gamma,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("models", nargs="*", choices=[[]] + list(SPECS), help="Models to generate (default: all)")
+    names = parser.parse_args().models or list(SPECS)
+    for name in names:
+        spec = SPECS[name]()
+        path = REPO_ROOT / spec.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(generate(spec))
+        print(f"Wrote {path.relative_to(REPO_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
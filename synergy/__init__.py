@@ -1,3 +1,4 @@
+from .utils.backend import get_backend, set_backend
 from .version import VERSION, VERSION_SHORT
 
 __author__ = "David J. Wooten"
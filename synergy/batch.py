@@ -0,0 +1,231 @@
+"""Fit a synergy model independently to each block of a grouped dataset, such as every combination on a plate."""
+
+import copy
+import math
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from synergy.combination.synergy_model_2d import (
+    ParametricSynergyModel2D,
+    SynergyModel2D,
+)
+from synergy.higher.synergy_model_Nd import ParametricSynergyModelND
+from synergy.utils.model_mixins import _get_executor
+
+try:
+    import pandas as pd
+
+    pandas_installed = True
+except ImportError:
+    pandas_installed = False
+
+# When chunk_size is not given, blocks are split into about this many chunks per worker, which balances the overhead
+# of dispatching each chunk against idle workers waiting on the last, slowest chunks
+_CHUNKS_PER_WORKER = 4
+
+# Scores recorded for parametric models, in column order
+SCORES = ("r_squared", "aic", "bic")
+
+
+class BatchFitResult:
+    """Results of fitting a model to each block of a grouped dataset, as returned by ``synergy.batch.fit_blocks()``.
+
+    ``columns`` is a columnar table with one row per block (in the order of ``groups``):
+
+    - "group": The block's label
+    - "converged": Whether the fit succeeded
+    - "error": The exception raised while fitting the block, formatted as "ExceptionType: message", or "" if none
+    - For parametric models, one column per model parameter, followed by "r_squared", "aic", and "bic". These are nan
+      for blocks that failed to fit, or that have too few data points to be scored.
+
+    For dose-dependent models (such as Bliss or Loewe), ``synergy`` and ``reference`` hold the synergy and reference
+    effect at every input data point, aligned with the input rows (nan for blocks that failed to fit). They are None
+    for parametric models.
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        synergy: Optional[np.ndarray] = None,
+        reference: Optional[np.ndarray] = None,
+    ):
+        """Ctor.
+
+        :param Dict[str, np.ndarray] columns: Per-block columns, keyed by column name
+        :param Optional[np.ndarray] synergy: Per-data point synergy, for dose-dependent models
+        :param Optional[np.ndarray] reference: Per-data point reference effect, for dose-dependent models
+        """
+        self.columns = columns
+        self.synergy = synergy
+        self.reference = reference
+
+    @property
+    def groups(self) -> np.ndarray:
+        """Label of each block."""
+        return self.columns["group"]
+
+    @property
+    def converged(self) -> np.ndarray:
+        """Whether each block's fit succeeded."""
+        return self.columns["converged"]
+
+    @property
+    def failures(self) -> Dict[Any, str]:
+        """Error raised by each block that failed with an exception, keyed by group."""
+        return {group: error for group, error in zip(self.columns["group"], self.columns["error"]) if error}
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def __len__(self) -> int:
+        return len(self.columns["group"])
+
+    def to_dataframe(self):
+        """Get the per-block columns as a pandas DataFrame.
+
+        :return pandas.DataFrame: One row per block
+        """
+        if not pandas_installed:
+            raise ImportError("pandas is required to convert batch results to a DataFrame")
+        return pd.DataFrame(self.columns)
+
+    def __repr__(self):
+        return f"BatchFitResult(n_blocks={len(self)}, n_converged={int(np.sum(self.converged))})"
+
+
+def fit_blocks(
+    model,
+    d: Union[Tuple[Any, Any], Any],
+    E,
+    groups,
+    model_kwargs: Optional[Dict[str, Any]] = None,
+    fit_kwargs: Optional[Dict[str, Any]] = None,
+    n_jobs: int = 1,
+    executor: Union[str, Executor] = "process",
+    chunk_size: Optional[int] = None,
+) -> BatchFitResult:
+    """Fit a model independently to each block of a grouped dataset.
+
+    Each block is the set of rows sharing a label in ``groups``. Blocks are dispatched to workers in chunks, so that
+    plates with many small blocks are not dominated by per-task overhead. Errors raised while fitting a block are
+    recorded in the result, rather than raised, so one bad block cannot abort the whole batch.
+
+    :param model: The model spec - either a model class from ``synergy.combination`` or ``synergy.higher`` (which is
+        instantiated with ``model_kwargs`` for every block), or a model instance (which is copied for every block)
+    :param d: Doses. For 2-drug models, a tuple (d1, d2) of arrays of length M. For N-drug models, an array of shape
+        (M, N).
+    :param ArrayLike E: Measured effects, length M
+    :param ArrayLike groups: Block label of each row, length M
+    :param Optional[Dict[str, Any]] model_kwargs: Keyword arguments used to instantiate the model, if ``model`` is a
+        class
+    :param Optional[Dict[str, Any]] fit_kwargs: Keyword arguments passed to ``model.fit()`` for every block
+    :param int n_jobs: Number of workers. 1 fits serially, -1 uses one worker per CPU.
+    :param Union[str, Executor] executor: "process", "thread", or an existing ``concurrent.futures.Executor``
+    :param Optional[int] chunk_size: Number of blocks sent to a worker at a time. By default, blocks are split into a
+        few chunks per worker.
+    :return BatchFitResult: Per-block parameters, scores, and convergence flags
+    """
+    if model_kwargs and not isinstance(model, type):
+        raise ValueError("model_kwargs can only be used when model is a class")
+    template = model(**(model_kwargs or {})) if isinstance(model, type) else model
+    fit_kwargs = fit_kwargs or {}
+    is_2d = isinstance(template, SynergyModel2D)
+
+    E = np.asarray(E)
+    groups = np.asarray(groups)
+    if is_2d:
+        if len(d) != 2:
+            raise ValueError("d must be a tuple (d1, d2) for 2-drug models")
+        d = (np.asarray(d[0]), np.asarray(d[1]))
+        n_rows = [len(d[0]), len(d[1])]
+    else:
+        d = np.asarray(d)
+        n_rows = [d.shape[0]]
+    if any(n != len(E) for n in n_rows) or len(groups) != len(E):
+        raise ValueError("d, E, and groups must all have the same number of rows")
+
+    labels, inverse = np.unique(groups, return_inverse=True)
+    rows = [np.flatnonzero(inverse == idx) for idx in range(len(labels))]
+    blocks = [((d[0][r], d[1][r]) if is_2d else d[r], E[r]) for r in rows]
+
+    pool, n_workers, owns_pool = _get_executor(n_jobs, executor)
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(len(blocks) / (_CHUNKS_PER_WORKER * n_workers)))
+    chunks = [blocks[start : start + chunk_size] for start in range(0, len(blocks), chunk_size)]
+    try:
+        if pool is None:
+            chunk_results = [_fit_chunk(template, chunk, fit_kwargs) for chunk in chunks]
+        else:
+            futures = [pool.submit(_fit_chunk, template, chunk, fit_kwargs) for chunk in chunks]
+            chunk_results = [future.result() for future in futures]
+    finally:
+        if owns_pool:
+            pool.shutdown()  # type: ignore
+
+    results = [result for chunk_result in chunk_results for result in chunk_result]
+    return _make_result(template, labels, rows, results, len(E))
+
+
+def _fit_chunk(template, blocks: Sequence[Tuple[Any, np.ndarray]], fit_kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Fit a copy of the template model to each block in a chunk."""
+    return [_fit_block(template, d, E, fit_kwargs) for d, E in blocks]
+
+
+def _fit_block(template, d, E: np.ndarray, fit_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Fit a copy of the template model to one block, recording rather than raising any error."""
+    model = copy.deepcopy(template)
+    result: Dict[str, Any] = dict(converged=False, error="")
+    try:
+        if isinstance(model, SynergyModel2D):
+            model.fit(d[0], d[1], E, **fit_kwargs)
+        else:
+            model.fit(d, E, **fit_kwargs)
+    except Exception as e:  # noqa: BLE001 - any failure in one block is recorded, and must not abort the batch
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    if _is_parametric(model):
+        result["converged"] = model.is_converged
+        if model.is_converged:
+            result["parameters"] = model.get_parameters()
+            result["scores"] = {score: getattr(model, score, np.nan) for score in SCORES}
+    else:
+        result["converged"] = model.is_fit
+        result["synergy"] = np.asarray(model.synergy, dtype=float)
+        result["reference"] = np.asarray(model.reference, dtype=float)
+    return result
+
+
+def _make_result(template, labels: np.ndarray, rows: List[np.ndarray], results: List[Dict[str, Any]], n: int):
+    """Assemble per-block fit results into a columnar table."""
+    columns: Dict[str, np.ndarray] = {
+        "group": labels,
+        "converged": np.asarray([result["converged"] for result in results], dtype=bool),
+        "error": np.asarray([result["error"] for result in results], dtype=object),
+    }
+
+    if _is_parametric(template):
+        for name in list(template._parameter_names) + list(SCORES):
+            key = "scores" if name in SCORES else "parameters"
+            columns[name] = np.asarray(
+                [_to_float(result[key].get(name)) if key in result else np.nan for result in results]
+            )
+        return BatchFitResult(columns)
+
+    synergy = np.full(n, np.nan)
+    reference = np.full(n, np.nan)
+    for block_rows, result in zip(rows, results):
+        if "synergy" in result:
+            synergy[block_rows] = result["synergy"]
+            reference[block_rows] = result["reference"]
+    return BatchFitResult(columns, synergy=synergy, reference=reference)
+
+
+def _is_parametric(model) -> bool:
+    return isinstance(model, (ParametricSynergyModel2D, ParametricSynergyModelND))
+
+
+def _to_float(value) -> float:
+    return np.nan if value is None else float(value)
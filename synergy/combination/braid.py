@@ -16,12 +16,13 @@
 from typing import Dict, Tuple, Type
 
 import numpy as np
+from scipy.special import xlogy
 
 from synergy.combination.synergy_model_2d import ParametricSynergyModel2D
 from synergy.exceptions import ModelNotParameterizedError
 from synergy.single.dose_response_model_1d import DoseResponseModel1D
 from synergy.single.hill import Hill
-from synergy.utils import format_table
+from synergy.utils import backend, format_table
 from synergy.utils.model_mixins import ParametricModelMixins
 
 
@@ -59,14 +60,15 @@ class BRAID(ParametricSynergyModel2D):
 
         if mode == "kappa":
             self.fit_function = self._model_to_fit_kappa
+            self.jacobian_function = self._jacobian_kappa
 
         elif mode == "delta":
             self.fit_function = self._model_to_fit_delta
+            self.jacobian_function = self._jacobian_delta
 
         elif mode == "both":
             self.fit_function = self._model_to_fit_both
-
-        self.jacobian_function = None  # TODO
+            self.jacobian_function = self._jacobian_both
 
     @property
     def _parameter_names(self):
@@ -92,17 +94,42 @@ class BRAID(ParametricSynergyModel2D):
         return bounds
 
     def _model_to_fit_kappa(self, d, E0, E1, E2, E3, logh1, logh2, logC1, logC2, kappa):
-        return self._model(
-            d[0], d[1], E0, E1, E2, E3, np.exp(logh1), np.exp(logh2), np.exp(logC1), np.exp(logC2), kappa, 1
-        )
+        params = (E0, E1, E2, E3, logh1, logh2, logC1, logC2, kappa)
+        return self._fit_model(d, params, kappa, 0)
 
     def _model_to_fit_delta(self, d, E0, E1, E2, E3, logh1, logh2, logC1, logC2, logdelta):
-        return self._model(
-            d[0], d[1], E0, E1, E2, E3, np.exp(logh1), np.exp(logh2), np.exp(logC1), np.exp(logC2), 0, np.exp(logdelta)
-        )
+        params = (E0, E1, E2, E3, logh1, logh2, logC1, logC2, logdelta)
+        return self._fit_model(d, params, 0, logdelta)
 
     def _model_to_fit_both(self, d, E0, E1, E2, E3, logh1, logh2, logC1, logC2, kappa, logdelta):
-        return self._model(
+        params = (E0, E1, E2, E3, logh1, logh2, logC1, logC2, kappa, logdelta)
+        return self._fit_model(d, params, kappa, logdelta)
+
+    def _jacobian_kappa(self, d, E0, E1, E2, E3, logh1, logh2, logC1, logC2, kappa):
+        params = (E0, E1, E2, E3, logh1, logh2, logC1, logC2, kappa)
+        return self._jacobian(d, params, kappa, 0)
+
+    def _jacobian_delta(self, d, E0, E1, E2, E3, logh1, logh2, logC1, logC2, logdelta):
+        params = (E0, E1, E2, E3, logh1, logh2, logC1, logC2, logdelta)
+        return self._jacobian(d, params, 0, logdelta)
+
+    def _jacobian_both(self, d, E0, E1, E2, E3, logh1, logh2, logC1, logC2, kappa, logdelta):
+        params = (E0, E1, E2, E3, logh1, logh2, logC1, logC2, kappa, logdelta)
+        return self._jacobian(d, params, kappa, logdelta)
+
+    def _fit_terms(self, d, params, kappa, logdelta):
+        """Evaluate _model_terms() for the fit parameters, reusing them between fit_function and jacobian_function.
+
+        :param d: Doses, as passed to fit_function
+        :param Sequence params: Fit parameters, in the order of self._parameter_names
+        :param float kappa: kappa (0 if it is not fit)
+        :param float logdelta: log(delta) (0 if it is not fit)
+        """
+        E0, E1, E2, E3, logh1, logh2, logC1, logC2 = params[:8]
+        return self._shared_intermediates(
+            self._model_terms,
+            d,
+            params,
             d[0],
             d[1],
             E0,
@@ -117,6 +144,79 @@ class BRAID(ParametricSynergyModel2D):
             np.exp(logdelta),
         )
 
+    def _fit_model(self, d, params, kappa, logdelta):
+        """Evaluate the model at the fit parameters."""
+        kernels = backend.numba_kernels((d[0], d[1]), (*params, kappa, logdelta))
+        if kernels is not None:
+            E0, E1, E2, E3, logh1, logh2, logC1, logC2 = params[:8]
+            h1, h2, C1, C2, delta = np.exp([logh1, logh2, logC1, logC2, logdelta])
+            return kernels.braid(d[0], d[1], E0, E1, E2, E3, h1, h2, C1, C2, kappa, delta)
+        terms = self._fit_terms(d, params, kappa, logdelta)
+        return params[0] + terms["max_delta_E"] / (1 + terms["S"])
+
+    def _jacobian(self, d, params, kappa, logdelta):
+        """Jacobian of the model with respect to the fit parameters.
+
+        Columns are ordered as self._parameter_names, with h, C, and delta in log scale. The index of max_delta_E is
+        piecewise constant in the parameters, so within each piece E depends on E0 and the E it selects through
+        max_delta_E = E_k - E0, and on E1 and E2 through the ratios a_i = (E_i - E0) / max_delta_E.
+
+        :param d: Doses, as passed to jacobian_function
+        :param Sequence params: Fit parameters, in the order of self._parameter_names
+        :param float kappa: kappa (0 if it is not fit)
+        :param float logdelta: log(delta) (0 if it is not fit)
+        """
+        kernels = backend.numba_kernels((d[0], d[1]), (*params, kappa, logdelta))
+        if kernels is not None:
+            fit_kappa = self.mode in ["kappa", "both"]
+            fit_delta = self.mode in ["delta", "both"]
+            return kernels.braid_jacobian(d[0], d[1], *params[:8], kappa, logdelta, fit_kappa, fit_delta)
+
+        terms = self._fit_terms(d, params, kappa, logdelta)
+        E0, E1, E2, E3, logh1, logh2, logC1, logC2 = params[:8]
+        h1, h2 = np.exp(logh1), np.exp(logh2)
+        M, D, R = terms["max_delta_E"], terms["D"], terms["R"]
+        u1, u2, B1, B2 = terms["u1"], terms["u2"], terms["B1"], terms["B2"]
+        q = np.exp(logdelta) * np.sqrt(h1 * h2)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # With F = 1 / (1 + S), dE = M * F * (1 - F) * (q * dlog(D) + log(D) * dq), and dlog(D) splits into the
+            # contributions of D1 and D2 weighted by w1 and w2. Where a drug is absent its weight is 0, which must also
+            # zero its log terms.
+            F = 1 / (1 + terms["S"])
+            MG = M * F * (1 - F)
+            w1 = np.where(D > 0, (terms["P1"] + kappa * R / 2) / D, 0)
+            w2 = np.where(D > 0, (terms["P2"] + kappa * R / 2) / D, 0)
+            T = q * np.log(D) - xlogy(w1, terms["D1"]) - xlogy(w2, terms["D2"])
+            v1, v2 = w1 / B1, w2 / B2
+
+            # Coefficients of dlog(a1) and dlog(a2), and the total coefficient of d(max_delta_E)
+            c1 = MG * v1 * (1 + u1)
+            c2 = MG * v2 * (1 + u2)
+            K = F - (c1 + c2) / M
+            g1 = c1 / (E1 - E0)
+            g2 = c2 / (E2 - E0)
+
+            index = terms["max_delta_E_index"]
+            columns = [
+                1 - g1 - g2 - K,
+                g1 + K * (index == 0),
+                g2 + K * (index == 1),
+                K * (index == 2),
+                MG * (T / 2 + xlogy(v1, u1)),
+                MG * (T / 2 + xlogy(v2, u2)),
+                -MG * v1 * h1,
+                -MG * v2 * h2,
+            ]
+            if self.mode in ["kappa", "both"]:
+                columns.append(MG * q * R / D)
+            if self.mode in ["delta", "both"]:
+                columns.append(MG * T)
+
+        jac = np.stack(columns, axis=-1)
+        jac[np.isnan(jac)] = 0
+        return jac
+
     @property
     def _required_single_drug_class(self) -> Type[DoseResponseModel1D]:
         return Hill
@@ -292,6 +392,18 @@ class BRAID(ParametricSynergyModel2D):
           |E3-E0|>=|E1-E0|, and
           |E3-E0|>=|E2-E0|.
         """
+        kernels = backend.numba_kernels((d1, d2), (E0, E1, E2, E3, h1, h2, C1, C2, kappa, delta))
+        if kernels is not None:
+            return kernels.braid(d1, d2, E0, E1, E2, E3, h1, h2, C1, C2, kappa, delta)
+        terms = self._model_terms(d1, d2, E0, E1, E2, E3, h1, h2, C1, C2, kappa, delta)
+        return E0 + terms["max_delta_E"] / (1 + terms["S"])
+
+    @staticmethod
+    def _model_terms(d1, d2, E0, E1, E2, E3, h1, h2, C1, C2, kappa, delta) -> Dict[str, np.ndarray]:
+        """Intermediate terms of the BRAID model, shared by _model() and _jacobian().
+
+        E = E0 + max_delta_E / (1 + S), where S = D^(-delta*h).
+        """
         delta_Es = [E1 - E0, E2 - E0, E3 - E0]
         max_delta_E_index = np.argmax(np.abs(delta_Es))
         max_delta_E = delta_Es[max_delta_E_index]
@@ -299,27 +411,35 @@ class BRAID(ParametricSynergyModel2D):
         h = np.sqrt(h1 * h2)
         power = 1 / (delta * h)
 
-        D1 = (
-            (E1 - E0)
-            / max_delta_E
-            * np.float_power(d1 / C1, h1)
-            / (1 + (1 - (E1 - E0) / max_delta_E) * np.float_power(d1 / C1, h1))
-        )
-
-        D2 = (
-            (E2 - E0)
-            / max_delta_E
-            * np.float_power(d2 / C2, h2)
-            / (1 + (1 - (E2 - E0) / max_delta_E) * np.float_power(d2 / C2, h2))
-        )
-
-        D = (
-            np.float_power(D1, power)
-            + np.float_power(D2, power)
-            + kappa * np.sqrt(np.float_power(D1, power) * np.float_power(D2, power))
-        )
+        u1 = np.float_power(d1 / C1, h1)
+        u2 = np.float_power(d2 / C2, h2)
+        B1 = 1 + (1 - (E1 - E0) / max_delta_E) * u1
+        B2 = 1 + (1 - (E2 - E0) / max_delta_E) * u2
+        D1 = (E1 - E0) / max_delta_E * u1 / B1
+        D2 = (E2 - E0) / max_delta_E * u2 / B2
+
+        P1 = np.float_power(D1, power)
+        P2 = np.float_power(D2, power)
+        R = np.sqrt(P1 * P2)
+        D = P1 + P2 + kappa * R
         with np.errstate(divide="ignore", invalid="ignore"):
-            return E0 + max_delta_E / (1 + np.float_power(D, -delta * h))
+            S = np.float_power(D, -delta * h)
+
+        return {
+            "max_delta_E_index": max_delta_E_index,
+            "max_delta_E": max_delta_E,
+            "u1": u1,
+            "u2": u2,
+            "B1": B1,
+            "B2": B2,
+            "D1": D1,
+            "D2": D2,
+            "P1": P1,
+            "P2": P2,
+            "R": R,
+            "D": D,
+            "S": S,
+        }
 
     def _get_parameters(self):
         if self.mode == "kappa":
@@ -334,7 +454,7 @@ class BRAID(ParametricSynergyModel2D):
 
         header = ["Parameter", "Value", "Comparison", "Synergy"]
         ci: Dict[str, Tuple[float, float]] = {}
-        if self.bootstrap_parameters is not None:
+        if self.bootstrap_parameters is not None or self.parameter_covariance is not None:
             ci = self.get_confidence_intervals(confidence_interval=confidence_interval)
             header.insert(2, f"{confidence_interval:0.3g}% CI")
 
@@ -0,0 +1,385 @@
+#    Copyright (C) 2020 David J. Wooten
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# This file is generated by scripts/generate_model_code.py. Do not edit it by hand.
+
+"""Effect and Jacobian of the 2-drug MuSyC model, with h, C, alpha, and gamma on log scale."""
+
+import numpy as np
+
+
+def evaluate_intermediates(
+    d1, d2, E0, E1, E2, E3, logh1, logh2, logC1, logC2, r1r, r2r, logalpha12, logalpha21, loggamma12, loggamma21
+):
+    """Evaluates the quantities shared by model() and jacobian()."""
+    h1 = np.exp(logh1)
+    h2 = np.exp(logh2)
+    r1 = r1r * np.exp(-h1 * logC1)
+    r2 = r2r * np.exp(-h2 * logC2)
+    alpha12 = np.exp(logalpha12)
+    alpha21 = np.exp(logalpha21)
+    k1 = np.float_power(d1, h1) * r1
+    k2 = np.float_power(d2, h2) * r2
+    gamma12 = np.exp(loggamma12)
+    gamma21 = np.exp(loggamma21)
+    k12 = np.float_power(r2, gamma12) * np.float_power(alpha12 * d2, gamma12 * h2)
+    k21 = np.float_power(r1, gamma21) * np.float_power(alpha21 * d1, gamma21 * h1)
+    k12r = np.float_power(r2r, gamma12)
+    k21r = np.float_power(r1r, gamma21)
+    w0 = k12 * k21r * r2r + k12r * k21 * r1r + k12r * r1r * r2r + k21r * r1r * r2r
+    w1 = k1 * k12r * k21 + k1 * k12r * r2r + k1 * k21r * r2r + k12r * k2 * k21
+    w2 = k1 * k12 * k21r + k12 * k2 * k21r + k12r * k2 * r1r + k2 * k21r * r1r
+    w3 = k1 * k12 * k21 + k1 * k12 * r2r + k12 * k2 * k21 + k2 * k21 * r1r
+    w = w0 + w1 + w2 + w3
+    return h1, h2, r1, r2, alpha12, alpha21, k1, k2, gamma12, gamma21, k12, k21, k12r, k21r, w0, w1, w2, w3, w
+
+
+def model(
+    d1,
+    d2,
+    E0,
+    E1,
+    E2,
+    E3,
+    logh1,
+    logh2,
+    logC1,
+    logC2,
+    r1r,
+    r2r,
+    logalpha12,
+    logalpha21,
+    loggamma12,
+    loggamma21,
+    intermediates=None,
+):
+    """Evaluates the model's effect.
+
+    :param tuple intermediates: evaluate_intermediates() of the same arguments, if it was already called
+    """
+    if intermediates is None:
+        intermediates = evaluate_intermediates(
+            d1, d2, E0, E1, E2, E3, logh1, logh2, logC1, logC2, r1r, r2r, logalpha12, logalpha21, loggamma12, loggamma21
+        )
+    h1, h2, r1, r2, alpha12, alpha21, k1, k2, gamma12, gamma21, k12, k21, k12r, k21r, w0, w1, w2, w3, w = intermediates
+    return (E0 * w0 + E1 * w1 + E2 * w2 + E3 * w3) / w
+
+
+def jacobian(
+    d1,
+    d2,
+    E0,
+    E1,
+    E2,
+    E3,
+    logh1,
+    logh2,
+    logC1,
+    logC2,
+    r1r,
+    r2r,
+    logalpha12,
+    logalpha21,
+    loggamma12,
+    loggamma21,
+    intermediates=None,
+    logd1=None,
+    logd2=None,
+):
+    """Evaluates the Jacobian of the model.
+
+    Returns an array whose last axis holds the derivatives with respect to E0, E1, E2, E3, logh1, logh2, logC1,
+    logC2, logalpha12, logalpha21, loggamma12, loggamma21. Derivatives that are undefined at zero dose (such as d**h
+    * log(d)) are set to 0.
+
+    :param tuple intermediates: evaluate_intermediates() of the same arguments, if it was already called
+    :param ArrayLike logd1: np.log(d1), if it was already calculated
+    :param ArrayLike logd2: np.log(d2), if it was already calculated
+    """
+    if intermediates is None:
+        intermediates = evaluate_intermediates(
+            d1, d2, E0, E1, E2, E3, logh1, logh2, logC1, logC2, r1r, r2r, logalpha12, logalpha21, loggamma12, loggamma21
+        )
+    h1, h2, r1, r2, alpha12, alpha21, k1, k2, gamma12, gamma21, k12, k21, k12r, k21r, w0, w1, w2, w3, w = intermediates
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if logd1 is None:
+            logd1 = np.log(d1)
+        if logd2 is None:
+            logd2 = np.log(d2)
+        x0 = 1 / (w)
+        x1 = logalpha21 + logd1
+        x2 = logC1 - x1
+        x3 = k12r * k21
+        x4 = gamma21 * x3
+        x5 = r1r * x4
+        x6 = x2 * x5
+        x7 = np.float_power(d1, h1) * r1
+        x8 = -k1 * logd1 + logC1 * x7
+        x9 = k12 * k21r
+        x10 = x8 * x9
+        x11 = k1 + k2
+        x12 = x11 * x4
+        x13 = k21r * r2r
+        x14 = k12r * r2r + x13 + x3
+        x15 = x12 * x2 + x14 * x8
+        x16 = k21 + r2r
+        x17 = k12 * x16
+        x18 = k2 * r1r
+        x19 = k1 * k12 + k12 * k2 + x18
+        x20 = k21 * x19
+        x21 = gamma21 * x20
+        x22 = x17 * x8 + x2 * x21
+        x23 = E0 * w0 + E1 * w1 + E2 * w2 + E3 * w3
+        x24 = h1 * x0
+        x25 = logalpha12 + logd2
+        x26 = logC2 - x25
+        x27 = E0 * x13
+        x28 = gamma12 * k12
+        x29 = x27 * x28
+        x30 = np.float_power(d2, h2) * r2
+        x31 = -k2 * logd2 + logC2 * x30
+        x32 = x3 * x31
+        x33 = x11 * x9
+        x34 = gamma12 * x33
+        x35 = k12r * r1r
+        x36 = k21r * r1r + x35 + x9
+        x37 = x26 * x34 + x31 * x36
+        x38 = k12 + r1r
+        x39 = k21 * x38
+        x40 = k1 * k21 + k1 * r2r + k2 * k21
+        x41 = k12 * x40
+        x42 = gamma12 * x41
+        x43 = x26 * x42 + x31 * x39
+        x44 = k12 * x13
+        x45 = gamma12 * x44
+        x46 = h2 * x0
+        x47 = x7 * x9
+        x48 = x12 + x14 * x7
+        x49 = x17 * x7 + x21
+        x50 = x3 * x30
+        x51 = x30 * x36 + x34
+        x52 = x30 * x39 + x42
+        x53 = k21r * x11
+        x54 = E3 * x40
+        x55 = x0 * x23
+        x56 = k12r * x11
+        x57 = E3 * x19
+        x58 = np.log(r2r)
+        x59 = k12r * x58
+        x60 = x40 * x59
+        x61 = h2 * x25 + np.log(r2)
+        x62 = x16 * x35 * x58 + x44 * x61
+        x63 = x18 * x59 + x33 * x61
+        x64 = np.log(r1r)
+        x65 = k21r * x19 * x64
+        x66 = h1 * x1 + np.log(r1)
+        x67 = x13 * x64
+        x68 = x3 * x66
+        x69 = r1r * x68 + x38 * x67
+        x70 = k1 * x67 + x11 * x68
+        j_E0 = w0 * x0
+        j_E1 = w1 * x0
+        j_E2 = w2 * x0
+        j_E3 = w3 * x0
+        j_logh1 = x24 * (-E0 * x6 - E1 * x15 - E2 * x10 - E3 * x22 + x0 * x23 * (x10 + x15 + x22 + x6))
+        j_logh2 = x46 * (-E1 * x32 - E2 * x37 - E3 * x43 + x0 * x23 * (x26 * x45 + x32 + x37 + x43) - x26 * x29)
+        j_logC1 = x24 * (-E0 * x5 - E1 * x48 - E2 * x47 - E3 * x49 + x0 * x23 * (x47 + x48 + x49 + x5))
+        j_logC2 = x46 * (-E1 * x50 - E2 * x51 - E3 * x52 + x0 * x23 * (x45 + x50 + x51 + x52) - x29)
+        j_logalpha12 = x28 * x46 * (E2 * x53 + x27 + x54 - x55 * (x13 + x40 + x53))
+        j_logalpha21 = gamma21 * k21 * x24 * (E0 * x35 + E1 * x56 - x55 * (x19 + x35 + x56) + x57)
+        j_loggamma12 = (
+            gamma12 * x0 * (E0 * x62 + E1 * x60 + E2 * x63 + k12 * x54 * x61 - x55 * (x41 * x61 + x60 + x62 + x63))
+        )
+        j_loggamma21 = (
+            gamma21 * x0 * (E0 * x69 + E1 * x70 + E2 * x65 + k21 * x57 * x66 - x55 * (x20 * x66 + x65 + x69 + x70))
+        )
+    jac = np.stack(
+        np.broadcast_arrays(
+            j_E0,
+            j_E1,
+            j_E2,
+            j_E3,
+            j_logh1,
+            j_logh2,
+            j_logC1,
+            j_logC2,
+            j_logalpha12,
+            j_logalpha21,
+            j_loggamma12,
+            j_loggamma21,
+        ),
+        axis=-1,
+    )
+    jac[np.isnan(jac)] = 0
+    return jac
+
+
+def model_point(
+    d1, d2, E0, E1, E2, E3, logh1, logh2, logC1, logC2, r1r, r2r, logalpha12, logalpha21, loggamma12, loggamma21
+):
+    """Evaluates the model's effect at a single dose."""
+    h1 = np.exp(logh1)
+    h2 = np.exp(logh2)
+    r1 = r1r * np.exp(-h1 * logC1)
+    r2 = r2r * np.exp(-h2 * logC2)
+    alpha12 = np.exp(logalpha12)
+    alpha21 = np.exp(logalpha21)
+    k1 = d1**h1 * r1
+    k2 = d2**h2 * r2
+    gamma12 = np.exp(loggamma12)
+    gamma21 = np.exp(loggamma21)
+    k12 = r2**gamma12 * (alpha12 * d2) ** (gamma12 * h2)
+    k21 = r1**gamma21 * (alpha21 * d1) ** (gamma21 * h1)
+    k12r = r2r**gamma12
+    k21r = r1r**gamma21
+    w0 = k12 * k21r * r2r + k12r * k21 * r1r + k12r * r1r * r2r + k21r * r1r * r2r
+    w1 = k1 * k12r * k21 + k1 * k12r * r2r + k1 * k21r * r2r + k12r * k2 * k21
+    w2 = k1 * k12 * k21r + k12 * k2 * k21r + k12r * k2 * r1r + k2 * k21r * r1r
+    w3 = k1 * k12 * k21 + k1 * k12 * r2r + k12 * k2 * k21 + k2 * k21 * r1r
+    w = w0 + w1 + w2 + w3
+    return (E0 * w0 + E1 * w1 + E2 * w2 + E3 * w3) / w
+
+
+def jacobian_point(
+    out,
+    logd1,
+    logd2,
+    d1,
+    d2,
+    E0,
+    E1,
+    E2,
+    E3,
+    logh1,
+    logh2,
+    logC1,
+    logC2,
+    r1r,
+    r2r,
+    logalpha12,
+    logalpha21,
+    loggamma12,
+    loggamma21,
+):
+    """Writes the Jacobian of the model at a single dose to the 1D array out, as a row of jacobian().
+
+    :param float logd1: np.log(d1)
+    :param float logd2: np.log(d2)
+    """
+    h1 = np.exp(logh1)
+    h2 = np.exp(logh2)
+    r1 = r1r * np.exp(-h1 * logC1)
+    r2 = r2r * np.exp(-h2 * logC2)
+    alpha12 = np.exp(logalpha12)
+    alpha21 = np.exp(logalpha21)
+    k1 = d1**h1 * r1
+    k2 = d2**h2 * r2
+    gamma12 = np.exp(loggamma12)
+    gamma21 = np.exp(loggamma21)
+    k12 = r2**gamma12 * (alpha12 * d2) ** (gamma12 * h2)
+    k21 = r1**gamma21 * (alpha21 * d1) ** (gamma21 * h1)
+    k12r = r2r**gamma12
+    k21r = r1r**gamma21
+    w0 = k12 * k21r * r2r + k12r * k21 * r1r + k12r * r1r * r2r + k21r * r1r * r2r
+    w1 = k1 * k12r * k21 + k1 * k12r * r2r + k1 * k21r * r2r + k12r * k2 * k21
+    w2 = k1 * k12 * k21r + k12 * k2 * k21r + k12r * k2 * r1r + k2 * k21r * r1r
+    w3 = k1 * k12 * k21 + k1 * k12 * r2r + k12 * k2 * k21 + k2 * k21 * r1r
+    w = w0 + w1 + w2 + w3
+    x0 = 1 / (w)
+    x1 = logalpha21 + logd1
+    x2 = logC1 - x1
+    x3 = k12r * k21
+    x4 = gamma21 * x3
+    x5 = r1r * x4
+    x6 = x2 * x5
+    x7 = d1**h1 * r1
+    x8 = -k1 * logd1 + logC1 * x7
+    x9 = k12 * k21r
+    x10 = x8 * x9
+    x11 = k1 + k2
+    x12 = x11 * x4
+    x13 = k21r * r2r
+    x14 = k12r * r2r + x13 + x3
+    x15 = x12 * x2 + x14 * x8
+    x16 = k21 + r2r
+    x17 = k12 * x16
+    x18 = k2 * r1r
+    x19 = k1 * k12 + k12 * k2 + x18
+    x20 = k21 * x19
+    x21 = gamma21 * x20
+    x22 = x17 * x8 + x2 * x21
+    x23 = E0 * w0 + E1 * w1 + E2 * w2 + E3 * w3
+    x24 = h1 * x0
+    x25 = logalpha12 + logd2
+    x26 = logC2 - x25
+    x27 = E0 * x13
+    x28 = gamma12 * k12
+    x29 = x27 * x28
+    x30 = d2**h2 * r2
+    x31 = -k2 * logd2 + logC2 * x30
+    x32 = x3 * x31
+    x33 = x11 * x9
+    x34 = gamma12 * x33
+    x35 = k12r * r1r
+    x36 = k21r * r1r + x35 + x9
+    x37 = x26 * x34 + x31 * x36
+    x38 = k12 + r1r
+    x39 = k21 * x38
+    x40 = k1 * k21 + k1 * r2r + k2 * k21
+    x41 = k12 * x40
+    x42 = gamma12 * x41
+    x43 = x26 * x42 + x31 * x39
+    x44 = k12 * x13
+    x45 = gamma12 * x44
+    x46 = h2 * x0
+    x47 = x7 * x9
+    x48 = x12 + x14 * x7
+    x49 = x17 * x7 + x21
+    x50 = x3 * x30
+    x51 = x30 * x36 + x34
+    x52 = x30 * x39 + x42
+    x53 = k21r * x11
+    x54 = E3 * x40
+    x55 = x0 * x23
+    x56 = k12r * x11
+    x57 = E3 * x19
+    x58 = np.log(r2r)
+    x59 = k12r * x58
+    x60 = x40 * x59
+    x61 = h2 * x25 + np.log(r2)
+    x62 = x16 * x35 * x58 + x44 * x61
+    x63 = x18 * x59 + x33 * x61
+    x64 = np.log(r1r)
+    x65 = k21r * x19 * x64
+    x66 = h1 * x1 + np.log(r1)
+    x67 = x13 * x64
+    x68 = x3 * x66
+    x69 = r1r * x68 + x38 * x67
+    x70 = k1 * x67 + x11 * x68
+    out[0] = w0 * x0
+    out[1] = w1 * x0
+    out[2] = w2 * x0
+    out[3] = w3 * x0
+    out[4] = x24 * (-E0 * x6 - E1 * x15 - E2 * x10 - E3 * x22 + x0 * x23 * (x10 + x15 + x22 + x6))
+    out[5] = x46 * (-E1 * x32 - E2 * x37 - E3 * x43 + x0 * x23 * (x26 * x45 + x32 + x37 + x43) - x26 * x29)
+    out[6] = x24 * (-E0 * x5 - E1 * x48 - E2 * x47 - E3 * x49 + x0 * x23 * (x47 + x48 + x49 + x5))
+    out[7] = x46 * (-E1 * x50 - E2 * x51 - E3 * x52 + x0 * x23 * (x45 + x50 + x51 + x52) - x29)
+    out[8] = x28 * x46 * (E2 * x53 + x27 + x54 - x55 * (x13 + x40 + x53))
+    out[9] = gamma21 * k21 * x24 * (E0 * x35 + E1 * x56 - x55 * (x19 + x35 + x56) + x57)
+    out[10] = gamma12 * x0 * (E0 * x62 + E1 * x60 + E2 * x63 + k12 * x54 * x61 - x55 * (x41 * x61 + x60 + x62 + x63))
+    out[11] = gamma21 * x0 * (E0 * x69 + E1 * x70 + E2 * x65 + k21 * x57 * x66 - x55 * (x20 * x66 + x65 + x69 + x70))
+    for index in range(12):
+        if np.isnan(out[index]):
+            out[index] = 0
@@ -0,0 +1,311 @@
+#    Copyright (C) 2020 David J. Wooten
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# This file is generated by scripts/generate_model_code.py. Do not edit it by hand.
+
+"""Effect and Jacobian of the 2-drug MuSyC model with gamma fixed at 1, and h, C, alpha on log scale."""
+
+import numpy as np
+
+
+def evaluate_intermediates(d1, d2, E0, E1, E2, E3, logh1, logh2, logC1, logC2, r1r, r2r, logalpha12, logalpha21):
+    """Evaluates the quantities shared by model() and jacobian()."""
+    h1 = np.exp(logh1)
+    h2 = np.exp(logh2)
+    r1 = r1r * np.exp(-h1 * logC1)
+    r2 = r2r * np.exp(-h2 * logC2)
+    alpha12 = np.exp(logalpha12)
+    alpha21 = np.exp(logalpha21)
+    k1 = np.float_power(d1, h1) * r1
+    k2 = np.float_power(d2, h2) * r2
+    k12 = r2 * np.float_power(alpha12 * d2, h2)
+    k21 = r1 * np.float_power(alpha21 * d1, h1)
+    w0 = k12 * r1r * r2r + k21 * r1r * r2r + (r1r) ** 2 * r2r + r1r * (r2r) ** 2
+    w1 = k1 * k21 * r2r + k1 * r1r * r2r + k1 * (r2r) ** 2 + k2 * k21 * r2r
+    w2 = k1 * k12 * r1r + k12 * k2 * r1r + k2 * (r1r) ** 2 + k2 * r1r * r2r
+    w3 = k1 * k12 * k21 + k1 * k12 * r2r + k12 * k2 * k21 + k2 * k21 * r1r
+    w = w0 + w1 + w2 + w3
+    return h1, h2, r1, r2, alpha12, alpha21, k1, k2, k12, k21, w0, w1, w2, w3, w
+
+
+def model(d1, d2, E0, E1, E2, E3, logh1, logh2, logC1, logC2, r1r, r2r, logalpha12, logalpha21, intermediates=None):
+    """Evaluates the model's effect.
+
+    :param tuple intermediates: evaluate_intermediates() of the same arguments, if it was already called
+    """
+    if intermediates is None:
+        intermediates = evaluate_intermediates(
+            d1, d2, E0, E1, E2, E3, logh1, logh2, logC1, logC2, r1r, r2r, logalpha12, logalpha21
+        )
+    h1, h2, r1, r2, alpha12, alpha21, k1, k2, k12, k21, w0, w1, w2, w3, w = intermediates
+    return (E0 * w0 + E1 * w1 + E2 * w2 + E3 * w3) / w
+
+
+def jacobian(
+    d1,
+    d2,
+    E0,
+    E1,
+    E2,
+    E3,
+    logh1,
+    logh2,
+    logC1,
+    logC2,
+    r1r,
+    r2r,
+    logalpha12,
+    logalpha21,
+    intermediates=None,
+    logd1=None,
+    logd2=None,
+):
+    """Evaluates the Jacobian of the model.
+
+    Returns an array whose last axis holds the derivatives with respect to E0, E1, E2, E3, logh1, logh2, logC1,
+    logC2, logalpha12, logalpha21. Derivatives that are undefined at zero dose (such as d**h * log(d)) are set to 0.
+
+    :param tuple intermediates: evaluate_intermediates() of the same arguments, if it was already called
+    :param ArrayLike logd1: np.log(d1), if it was already calculated
+    :param ArrayLike logd2: np.log(d2), if it was already calculated
+    """
+    if intermediates is None:
+        intermediates = evaluate_intermediates(
+            d1, d2, E0, E1, E2, E3, logh1, logh2, logC1, logC2, r1r, r2r, logalpha12, logalpha21
+        )
+    h1, h2, r1, r2, alpha12, alpha21, k1, k2, k12, k21, w0, w1, w2, w3, w = intermediates
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if logd1 is None:
+            logd1 = np.log(d1)
+        if logd2 is None:
+            logd2 = np.log(d2)
+        x0 = 1 / (w)
+        x1 = np.float_power(d1, h1)
+        x2 = logC1 * r1
+        x3 = -k1 * logd1 + x1 * x2
+        x4 = k12 * x3
+        x5 = r1r * x4
+        x6 = np.float_power(alpha21 * d1, h1)
+        x7 = k21 * (logalpha21 + logd1) - x2 * x6
+        x8 = r1r * r2r
+        x9 = x7 * x8
+        x10 = k21 + r2r
+        x11 = r1r + x10
+        x12 = x11 * x3
+        x13 = k1 + k2
+        x14 = x13 * x7
+        x15 = E1 * r2r
+        x16 = k1 * k12 + k12 * k2 + k2 * r1r
+        x17 = x10 * x4 - x16 * x7
+        x18 = E0 * w0 + E1 * w1 + E2 * w2 + E3 * w3
+        x19 = x0 * x18
+        x20 = h1 * x0
+        x21 = np.float_power(d2, h2)
+        x22 = logC2 * r2
+        x23 = -k2 * logd2 + x21 * x22
+        x24 = k21 * x23
+        x25 = np.float_power(alpha12 * d2, h2)
+        x26 = k12 * (logalpha12 + logd2) - x22 * x25
+        x27 = x26 * x8
+        x28 = k12 + r1r
+        x29 = r2r + x28
+        x30 = x23 * x29
+        x31 = x13 * x26
+        x32 = E2 * r1r
+        x33 = k1 * k21 + k1 * r2r + k2 * k21
+        x34 = x24 * x28 - x26 * x33
+        x35 = h2 * x0
+        x36 = k12 * x1
+        x37 = x6 * x8
+        x38 = x1 * x11
+        x39 = x13 * x6
+        x40 = x10 * x36 + x16 * x6
+        x41 = k21 * x21
+        x42 = x25 * x8
+        x43 = x21 * x29
+        x44 = x13 * x25
+        x45 = x25 * x33 + x28 * x41
+        x46 = E0 * x8
+        x47 = r1r * x13
+        x48 = r2r * x13
+        j_E0 = w0 * x0
+        j_E1 = w1 * x0
+        j_E2 = w2 * x0
+        j_E3 = w3 * x0
+        j_logh1 = x20 * (
+            E0 * x9 - E2 * x5 - E3 * x17 + x15 * (-x12 + x14) + x19 * (r2r * x12 - r2r * x14 + x17 + x5 - x9)
+        )
+        j_logh2 = x35 * (
+            E0 * x27 - E3 * x34 - x15 * x24 + x19 * (r1r * x30 - r1r * x31 + r2r * x24 - x27 + x34) + x32 * (-x30 + x31)
+        )
+        j_logC1 = (
+            r1
+            * x20
+            * (
+                -E0 * x37
+                - E3 * x40
+                + x0 * x18 * (r1r * x36 + r2r * x38 + r2r * x39 + x37 + x40)
+                - x15 * (x38 + x39)
+                - x32 * x36
+            )
+        )
+        j_logC2 = (
+            r2
+            * x35
+            * (
+                -E0 * x42
+                - E3 * x45
+                + x0 * x18 * (r1r * x43 + r1r * x44 + r2r * x41 + x42 + x45)
+                - x15 * x41
+                - x32 * (x43 + x44)
+            )
+        )
+        j_logalpha12 = k12 * x35 * (E2 * x47 + E3 * x33 - x19 * (x33 + x47 + x8) + x46)
+        j_logalpha21 = k21 * x20 * (E1 * x48 + E3 * x16 - x19 * (x16 + x48 + x8) + x46)
+    jac = np.stack(
+        np.broadcast_arrays(j_E0, j_E1, j_E2, j_E3, j_logh1, j_logh2, j_logC1, j_logC2, j_logalpha12, j_logalpha21),
+        axis=-1,
+    )
+    jac[np.isnan(jac)] = 0
+    return jac
+
+
+def model_point(d1, d2, E0, E1, E2, E3, logh1, logh2, logC1, logC2, r1r, r2r, logalpha12, logalpha21):
+    """Evaluates the model's effect at a single dose."""
+    h1 = np.exp(logh1)
+    h2 = np.exp(logh2)
+    r1 = r1r * np.exp(-h1 * logC1)
+    r2 = r2r * np.exp(-h2 * logC2)
+    alpha12 = np.exp(logalpha12)
+    alpha21 = np.exp(logalpha21)
+    k1 = d1**h1 * r1
+    k2 = d2**h2 * r2
+    k12 = r2 * (alpha12 * d2) ** h2
+    k21 = r1 * (alpha21 * d1) ** h1
+    w0 = k12 * r1r * r2r + k21 * r1r * r2r + (r1r) ** 2 * r2r + r1r * (r2r) ** 2
+    w1 = k1 * k21 * r2r + k1 * r1r * r2r + k1 * (r2r) ** 2 + k2 * k21 * r2r
+    w2 = k1 * k12 * r1r + k12 * k2 * r1r + k2 * (r1r) ** 2 + k2 * r1r * r2r
+    w3 = k1 * k12 * k21 + k1 * k12 * r2r + k12 * k2 * k21 + k2 * k21 * r1r
+    w = w0 + w1 + w2 + w3
+    return (E0 * w0 + E1 * w1 + E2 * w2 + E3 * w3) / w
+
+
+def jacobian_point(
+    out, logd1, logd2, d1, d2, E0, E1, E2, E3, logh1, logh2, logC1, logC2, r1r, r2r, logalpha12, logalpha21
+):
+    """Writes the Jacobian of the model at a single dose to the 1D array out, as a row of jacobian().
+
+    :param float logd1: np.log(d1)
+    :param float logd2: np.log(d2)
+    """
+    h1 = np.exp(logh1)
+    h2 = np.exp(logh2)
+    r1 = r1r * np.exp(-h1 * logC1)
+    r2 = r2r * np.exp(-h2 * logC2)
+    alpha12 = np.exp(logalpha12)
+    alpha21 = np.exp(logalpha21)
+    k1 = d1**h1 * r1
+    k2 = d2**h2 * r2
+    k12 = r2 * (alpha12 * d2) ** h2
+    k21 = r1 * (alpha21 * d1) ** h1
+    w0 = k12 * r1r * r2r + k21 * r1r * r2r + (r1r) ** 2 * r2r + r1r * (r2r) ** 2
+    w1 = k1 * k21 * r2r + k1 * r1r * r2r + k1 * (r2r) ** 2 + k2 * k21 * r2r
+    w2 = k1 * k12 * r1r + k12 * k2 * r1r + k2 * (r1r) ** 2 + k2 * r1r * r2r
+    w3 = k1 * k12 * k21 + k1 * k12 * r2r + k12 * k2 * k21 + k2 * k21 * r1r
+    w = w0 + w1 + w2 + w3
+    x0 = 1 / (w)
+    x1 = d1**h1
+    x2 = logC1 * r1
+    x3 = -k1 * logd1 + x1 * x2
+    x4 = k12 * x3
+    x5 = r1r * x4
+    x6 = (alpha21 * d1) ** h1
+    x7 = k21 * (logalpha21 + logd1) - x2 * x6
+    x8 = r1r * r2r
+    x9 = x7 * x8
+    x10 = k21 + r2r
+    x11 = r1r + x10
+    x12 = x11 * x3
+    x13 = k1 + k2
+    x14 = x13 * x7
+    x15 = E1 * r2r
+    x16 = k1 * k12 + k12 * k2 + k2 * r1r
+    x17 = x10 * x4 - x16 * x7
+    x18 = E0 * w0 + E1 * w1 + E2 * w2 + E3 * w3
+    x19 = x0 * x18
+    x20 = h1 * x0
+    x21 = d2**h2
+    x22 = logC2 * r2
+    x23 = -k2 * logd2 + x21 * x22
+    x24 = k21 * x23
+    x25 = (alpha12 * d2) ** h2
+    x26 = k12 * (logalpha12 + logd2) - x22 * x25
+    x27 = x26 * x8
+    x28 = k12 + r1r
+    x29 = r2r + x28
+    x30 = x23 * x29
+    x31 = x13 * x26
+    x32 = E2 * r1r
+    x33 = k1 * k21 + k1 * r2r + k2 * k21
+    x34 = x24 * x28 - x26 * x33
+    x35 = h2 * x0
+    x36 = k12 * x1
+    x37 = x6 * x8
+    x38 = x1 * x11
+    x39 = x13 * x6
+    x40 = x10 * x36 + x16 * x6
+    x41 = k21 * x21
+    x42 = x25 * x8
+    x43 = x21 * x29
+    x44 = x13 * x25
+    x45 = x25 * x33 + x28 * x41
+    x46 = E0 * x8
+    x47 = r1r * x13
+    x48 = r2r * x13
+    out[0] = w0 * x0
+    out[1] = w1 * x0
+    out[2] = w2 * x0
+    out[3] = w3 * x0
+    out[4] = x20 * (E0 * x9 - E2 * x5 - E3 * x17 + x15 * (-x12 + x14) + x19 * (r2r * x12 - r2r * x14 + x17 + x5 - x9))
+    out[5] = x35 * (
+        E0 * x27 - E3 * x34 - x15 * x24 + x19 * (r1r * x30 - r1r * x31 + r2r * x24 - x27 + x34) + x32 * (-x30 + x31)
+    )
+    out[6] = (
+        r1
+        * x20
+        * (
+            -E0 * x37
+            - E3 * x40
+            + x0 * x18 * (r1r * x36 + r2r * x38 + r2r * x39 + x37 + x40)
+            - x15 * (x38 + x39)
+            - x32 * x36
+        )
+    )
+    out[7] = (
+        r2
+        * x35
+        * (
+            -E0 * x42
+            - E3 * x45
+            + x0 * x18 * (r1r * x43 + r1r * x44 + r2r * x41 + x42 + x45)
+            - x15 * x41
+            - x32 * (x43 + x44)
+        )
+    )
+    out[8] = k12 * x35 * (E2 * x47 + E3 * x33 - x19 * (x33 + x47 + x8) + x46)
+    out[9] = k21 * x20 * (E1 * x48 + E3 * x16 - x19 * (x16 + x48 + x8) + x46)
+    for index in range(10):
+        if np.isnan(out[index]):
+            out[index] = 0
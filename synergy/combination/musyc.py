@@ -13,17 +13,48 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Dict, List, Tuple, Type
+from typing import Dict, List, Optional, Tuple, Type
 
 import numpy as np
 
-from synergy.combination.jacobians.musyc_jacobian import jacobian
+from synergy.combination.generated import musyc as generated
+from synergy.combination.generated import musyc_no_gamma as generated_no_gamma
 from synergy.combination.synergy_model_2d import ParametricSynergyModel2D
 from synergy.exceptions import ModelNotParameterizedError
 from synergy.single import Hill
 from synergy.single.dose_response_model_1d import DoseResponseModel1D
-from synergy.utils import format_table
-from synergy.utils.model_mixins import ParametricModelMixins
+from synergy.utils import backend, format_table
+from synergy.utils.model_mixins import (
+    EvaluationWorkspace,
+    FitContext,
+    ParametricModelMixins,
+)
+
+# The equilibrium weight of each state of the 2-drug MuSyC model is a sum of four of these terms, each listed by the
+# factors it multiplies, and the occupancy of a state is its weight divided by the sum of all of them
+_STATE_WEIGHT_TERMS = (
+    ("d1_pow_h1", "r1", "r2", "r1_C1h1_pow_gamma21", "C2_pow_h2"),
+    ("d1_pow_h1", "r1", "r2", "r2_C2h2_pow_gamma12", "C2_pow_h2"),
+    ("d1_pow_h1", "r1", "r2_pow_gamma12_plus_1", "alpha12_d2_pow_gamma12_h2", "C2_pow_h2"),
+    ("d1_pow_h1", "r1", "r2_pow_gamma12", "alpha12_d2_pow_gamma12_h2", "r1_C1h1_pow_gamma21"),
+    ("d1_pow_h1", "r1_pow_gamma21_plus_1", "r2_pow_gamma12", "alpha21_d1_pow_gamma21_h1", "alpha12_d2_pow_gamma12_h2"),
+    ("d1_pow_h1", "r1_pow_gamma21_plus_1", "alpha21_d1_pow_gamma21_h1", "r2_C2h2_pow_gamma12"),
+    ("d2_pow_h2", "r1", "r2", "r1_C1h1_pow_gamma21", "C1_pow_h1"),
+    ("d2_pow_h2", "r1", "r2", "r2_C2h2_pow_gamma12", "C1_pow_h1"),
+    ("d2_pow_h2", "r1_pow_gamma21_plus_1", "r2", "alpha21_d1_pow_gamma21_h1", "C1_pow_h1"),
+    ("d2_pow_h2", "r1_pow_gamma21", "r2", "alpha21_d1_pow_gamma21_h1", "r2_C2h2_pow_gamma12"),
+    ("d2_pow_h2", "r1_pow_gamma21", "r2_pow_gamma12_plus_1", "alpha21_d1_pow_gamma21_h1", "alpha12_d2_pow_gamma12_h2"),
+    ("d2_pow_h2", "r2_pow_gamma12_plus_1", "alpha12_d2_pow_gamma12_h2", "r1_C1h1_pow_gamma21"),
+    ("r1", "r2", "r1_C1h1_pow_gamma21", "C1_pow_h1", "C2_pow_h2"),
+    ("r1", "r2", "r2_C2h2_pow_gamma12", "C1_pow_h1", "C2_pow_h2"),
+    ("r1_pow_gamma21_plus_1", "alpha21_d1_pow_gamma21_h1", "r2_C2h2_pow_gamma12", "C1_pow_h1"),
+    ("r2_pow_gamma12_plus_1", "alpha12_d2_pow_gamma12_h2", "r1_C1h1_pow_gamma21", "C2_pow_h2"),
+)
+
+# The terms of the weights of U, A1, and A2 (A3 is the remainder)
+_U_TERMS = (12, 13, 14, 15)
+_A1_TERMS = (0, 1, 5, 9)
+_A2_TERMS = (3, 6, 7, 11)
 
 
 class MuSyC(ParametricSynergyModel2D):
@@ -63,6 +94,8 @@ class MuSyC(ParametricSynergyModel2D):
         If True will fit gamma, otherwise will keep it constant at 1.0
     """
 
+    _batch_fit_supported = True
+
     def __init__(
         self, drug1_model=None, drug2_model=None, r1r: float = 1.0, r2r: float = 1.0, fit_gamma: bool = True, **kwargs
     ):
@@ -168,44 +201,12 @@ class MuSyC(ParametricSynergyModel2D):
     def _model_to_fit_with_gamma(
         self, d, E0, E1, E2, E3, logh1, logh2, logC1, logC2, logalpha12, logalpha21, loggamma12, loggamma21
     ):
-        return self._model(
-            d[0],
-            d[1],
-            E0,
-            E1,
-            E2,
-            E3,
-            np.exp(logh1),
-            np.exp(logh2),
-            np.exp(logC1),
-            np.exp(logC2),
-            self.r1r,
-            self.r2r,
-            np.exp(logalpha12),
-            np.exp(logalpha21),
-            np.exp(loggamma12),
-            np.exp(loggamma21),
-        )
+        params = (E0, E1, E2, E3, logh1, logh2, logC1, logC2, logalpha12, logalpha21, loggamma12, loggamma21)
+        return self._evaluate_generated(generated, d, params)
 
     def _model_to_fit_no_gamma(self, d, E0, E1, E2, E3, logh1, logh2, logC1, logC2, logalpha12, logalpha21):
-        return self._model(
-            d[0],
-            d[1],
-            E0,
-            E1,
-            E2,
-            E3,
-            np.exp(logh1),
-            np.exp(logh2),
-            np.exp(logC1),
-            np.exp(logC2),
-            self.r1r,
-            self.r2r,
-            np.exp(logalpha12),
-            np.exp(logalpha21),
-            1,
-            1,
-        )
+        params = (E0, E1, E2, E3, logh1, logh2, logC1, logC2, logalpha12, logalpha21)
+        return self._evaluate_generated(generated_no_gamma, d, params)
 
     def _jacobian_with_gamma(
         self, d, E0, E1, E2, E3, logh1, logh2, logC1, logC2, logalpha12, logalpha21, loggamma12, loggamma21
@@ -215,24 +216,8 @@ class MuSyC(ParametricSynergyModel2D):
         Derivatives in the jacobian are already defined with respect to (e.g.) log(h) or log(alpha), rather than the
         linear values, so np.exp() is not required (or desired) here.
         """
-        return jacobian(
-            d[0],
-            d[1],
-            E0,
-            E1,
-            E2,
-            E3,
-            logh1,
-            logh2,
-            logC1,
-            logC2,
-            self.r1r,
-            self.r2r,
-            logalpha12,
-            logalpha21,
-            loggamma12,
-            loggamma21,
-        )
+        params = (E0, E1, E2, E3, logh1, logh2, logC1, logC2, logalpha12, logalpha21, loggamma12, loggamma21)
+        return self._evaluate_generated(generated, d, params, jacobian=True)
 
     def _jacobian_no_gamma(self, d, E0, E1, E2, E3, logh1, logh2, logC1, logC2, logalpha12, logalpha21):
         """Calculate the jacobian assuming gamma==1.
@@ -240,12 +225,57 @@ class MuSyC(ParametricSynergyModel2D):
         Derivatives in the jacobian are already defined with respect to (e.g.) log(h) or log(alpha), rather than the
         linear values, so np.exp() is not required (or desired) here.
 
-        The [:, :-2] gets rid of derivatives WRT gamma
-        TODO: Speed things up by defining a no_gamma jacobian that doesn't even calculate them at all
+        Gamma is fixed at 1 in the generated code, so its powers simplify and its derivatives are never computed.
         """
-        return jacobian(
-            d[0], d[1], E0, E1, E2, E3, logh1, logh2, logC1, logC2, self.r1r, self.r2r, logalpha12, logalpha21, 0, 0
-        )[:, :-2]
+        params = (E0, E1, E2, E3, logh1, logh2, logC1, logC2, logalpha12, logalpha21)
+        return self._evaluate_generated(generated_no_gamma, d, params, jacobian=True)
+
+    def _evaluate_generated(self, module, d, params, jacobian: bool = False):
+        """Evaluate the generated model or Jacobian, computing their shared intermediates once per parameter vector.
+
+        :param module: The generated module (with or without gamma)
+        :param d: Doses, as passed to fit_function (the fit's FitContext, during fit())
+        :param Sequence params: Fit parameters, in the order of self._parameter_names
+        :param bool jacobian: If True, evaluate the Jacobian rather than the model
+        """
+        args = (d[0], d[1], *params[:8], self.r1r, self.r2r, *params[8:])
+        kernels = backend.numba_kernels(args[:2], args[2:])
+        if kernels is not None:
+            gamma = module is generated
+            if not jacobian:
+                return kernels.musyc(d[0], d[1], args[2:], gamma=gamma)
+            logd1, logd2 = FitContext.of(d).log_doses
+            return kernels.musyc_jacobian(d[0], d[1], logd1, logd2, args[2:], gamma=gamma)
+
+        intermediates = self._shared_intermediates(module.evaluate_intermediates, d, params, *args)
+        if not jacobian:
+            return module.model(*args, intermediates=intermediates)
+        logd1, logd2 = FitContext.of(d).log_doses
+        return module.jacobian(*args, intermediates=intermediates, logd1=logd1, logd2=logd2)
+
+    @property
+    def _linear_parameter_indices(self) -> List[int]:
+        """E0, E1, E2, and E3 enter the model linearly."""
+        return [0, 1, 2, 3]
+
+    def _design_matrix(self, d, logh1, logh2, logC1, logC2, logalpha12, logalpha21, loggamma12=0, loggamma21=0):
+        """State occupancies, which multiply E0, E1, E2, and E3 to give the model's effect."""
+        occupancy = self._state_occupancy(
+            d[0],
+            d[1],
+            np.exp(logh1),
+            np.exp(logh2),
+            np.exp(logC1),
+            np.exp(logC2),
+            self.r1r,
+            self.r2r,
+            np.exp(logalpha12),
+            np.exp(logalpha21),
+            np.exp(loggamma12),
+            np.exp(loggamma21),
+            workspace=self._fit_workspace,
+        )
+        return np.column_stack(occupancy), 0
 
     def _get_initial_guess(self, d1, d2, E, p0):
         # If there is no intial guess, use single-drug models to come up with intitial guess
@@ -432,6 +462,58 @@ class MuSyC(ParametricSynergyModel2D):
             ) = popt
 
     def _model(self, d1, d2, E0, E1, E2, E3, h1, h2, C1, C2, r1r, r2r, alpha12, alpha21, gamma12, gamma21):
+        log_scale = (h1, h2, C1, C2, alpha12, alpha21, gamma12, gamma21)
+        kernels = backend.numba_kernels((d1, d2), (E0, E1, E2, E3, r1r, r2r, *log_scale))
+        if kernels is not None:
+            # The kernels take h, C, alpha, and gamma on log scale, as the generated code does
+            with np.errstate(divide="ignore"):
+                logh1, logh2, logC1, logC2, logalpha12, logalpha21, loggamma12, loggamma21 = np.log(log_scale)
+            params = (
+                E0,
+                E1,
+                E2,
+                E3,
+                logh1,
+                logh2,
+                logC1,
+                logC2,
+                r1r,
+                r2r,
+                logalpha12,
+                logalpha21,
+                loggamma12,
+                loggamma21,
+            )
+            return kernels.musyc(d1, d2, params)
+
+        U, A1, A2, A3 = self._state_occupancy(d1, d2, h1, h2, C1, C2, r1r, r2r, alpha12, alpha21, gamma12, gamma21)
+        return U * E0 + A1 * E1 + A2 * E2 + A3 * E3
+
+    def _state_occupancy(
+        self,
+        d1,
+        d2,
+        h1,
+        h2,
+        C1,
+        C2,
+        r1r,
+        r2r,
+        alpha12,
+        alpha21,
+        gamma12,
+        gamma21,
+        workspace: Optional[EvaluationWorkspace] = None,
+    ):
+        """Fraction of the population in each state (U, A1, A2, A3) at equilibrium.
+
+        The model's effect is linear in E0, E1, E2, and E3, weighted by these occupancies. Each occupancy is the sum of
+        some of the terms in _STATE_WEIGHT_TERMS, divided by the sum of all of them, so every term and the shared
+        denominator are computed once, in place in scratch arrays.
+
+        :param Optional[EvaluationWorkspace] workspace: If given, reuse its scratch arrays (such as between the
+            evaluations of a fit) rather than allocating them
+        """
         # Precompute some terms that are used repeatedly
         d1_pow_h1 = np.float_power(d1, h1)
         d2_pow_h2 = np.float_power(d2, h2)
@@ -441,94 +523,55 @@ class MuSyC(ParametricSynergyModel2D):
         r1 = r1r / C1_pow_h1
         r2 = r2r / C2_pow_h2
 
-        alpha21_d1_pow_gamma21_h1 = np.float_power(alpha21 * d1, gamma21 * h1)
-        alpha12_d2_pow_gamma12_h2 = np.float_power(alpha12 * d2, gamma12 * h2)
-        r1_C1h1_pow_gamma21 = np.float_power((r1 * C1_pow_h1), gamma21)
-        r2_C2h2_pow_gamma12 = np.float_power((r2 * C2_pow_h2), gamma12)
-        r1_pow_gamma21_plus_1 = np.float_power(r1, (gamma21 + 1))
-        r2_pow_gamma12_plus_1 = np.float_power(r2, (gamma12 + 1))
-        r1_pow_gamma21 = np.float_power(r1, gamma21)
-        r2_pow_gamma12 = np.float_power(r2, gamma12)
-
-        # Unaffected population
-        U = (
-            r1 * r2 * r1_C1h1_pow_gamma21 * C1_pow_h1 * C2_pow_h2
-            + r1 * r2 * r2_C2h2_pow_gamma12 * C1_pow_h1 * C2_pow_h2
-            + r1_pow_gamma21_plus_1 * alpha21_d1_pow_gamma21_h1 * r2_C2h2_pow_gamma12 * C1_pow_h1
-            + r2_pow_gamma12_plus_1 * alpha12_d2_pow_gamma12_h2 * r1_C1h1_pow_gamma21 * C2_pow_h2
-        ) / (
-            d1_pow_h1 * r1 * r2 * r1_C1h1_pow_gamma21 * C2_pow_h2
-            + d1_pow_h1 * r1 * r2 * r2_C2h2_pow_gamma12 * C2_pow_h2
-            + d1_pow_h1 * r1 * r2_pow_gamma12_plus_1 * alpha12_d2_pow_gamma12_h2 * C2_pow_h2
-            + d1_pow_h1 * r1 * r2_pow_gamma12 * alpha12_d2_pow_gamma12_h2 * r1_C1h1_pow_gamma21
-            + d1_pow_h1 * r1_pow_gamma21_plus_1 * r2_pow_gamma12 * alpha21_d1_pow_gamma21_h1 * alpha12_d2_pow_gamma12_h2
-            + d1_pow_h1 * r1_pow_gamma21_plus_1 * alpha21_d1_pow_gamma21_h1 * r2_C2h2_pow_gamma12
-            + d2_pow_h2 * r1 * r2 * r1_C1h1_pow_gamma21 * C1_pow_h1
-            + d2_pow_h2 * r1 * r2 * r2_C2h2_pow_gamma12 * C1_pow_h1
-            + d2_pow_h2 * r1_pow_gamma21_plus_1 * r2 * alpha21_d1_pow_gamma21_h1 * C1_pow_h1
-            + d2_pow_h2 * r1_pow_gamma21 * r2 * alpha21_d1_pow_gamma21_h1 * r2_C2h2_pow_gamma12
-            + d2_pow_h2 * r1_pow_gamma21 * r2_pow_gamma12_plus_1 * alpha21_d1_pow_gamma21_h1 * alpha12_d2_pow_gamma12_h2
-            + d2_pow_h2 * r2_pow_gamma12_plus_1 * alpha12_d2_pow_gamma12_h2 * r1_C1h1_pow_gamma21
-            + r1 * r2 * r1_C1h1_pow_gamma21 * C1_pow_h1 * C2_pow_h2
-            + r1 * r2 * r2_C2h2_pow_gamma12 * C1_pow_h1 * C2_pow_h2
-            + r1_pow_gamma21_plus_1 * alpha21_d1_pow_gamma21_h1 * r2_C2h2_pow_gamma12 * C1_pow_h1
-            + r2_pow_gamma12_plus_1 * alpha12_d2_pow_gamma12_h2 * r1_C1h1_pow_gamma21 * C2_pow_h2
-        )
-
-        # Affected by drug 1 only
-        A1 = (
-            d1_pow_h1 * r1 * r2 * r1_C1h1_pow_gamma21 * C2_pow_h2
-            + d1_pow_h1 * r1 * r2 * r2_C2h2_pow_gamma12 * C2_pow_h2
-            + d1_pow_h1 * r1_pow_gamma21_plus_1 * alpha21_d1_pow_gamma21_h1 * r2_C2h2_pow_gamma12
-            + d2_pow_h2 * r1_pow_gamma21 * r2 * alpha21_d1_pow_gamma21_h1 * r2_C2h2_pow_gamma12
-        ) / (
-            d1_pow_h1 * r1 * r2 * r1_C1h1_pow_gamma21 * C2_pow_h2
-            + d1_pow_h1 * r1 * r2 * r2_C2h2_pow_gamma12 * C2_pow_h2
-            + d1_pow_h1 * r1 * r2_pow_gamma12_plus_1 * alpha12_d2_pow_gamma12_h2 * C2_pow_h2
-            + d1_pow_h1 * r1 * r2_pow_gamma12 * alpha12_d2_pow_gamma12_h2 * r1_C1h1_pow_gamma21
-            + d1_pow_h1 * r1_pow_gamma21_plus_1 * r2_pow_gamma12 * alpha21_d1_pow_gamma21_h1 * alpha12_d2_pow_gamma12_h2
-            + d1_pow_h1 * r1_pow_gamma21_plus_1 * alpha21_d1_pow_gamma21_h1 * r2_C2h2_pow_gamma12
-            + d2_pow_h2 * r1 * r2 * r1_C1h1_pow_gamma21 * C1_pow_h1
-            + d2_pow_h2 * r1 * r2 * r2_C2h2_pow_gamma12 * C1_pow_h1
-            + d2_pow_h2 * r1_pow_gamma21_plus_1 * r2 * alpha21_d1_pow_gamma21_h1 * C1_pow_h1
-            + d2_pow_h2 * r1_pow_gamma21 * r2 * alpha21_d1_pow_gamma21_h1 * r2_C2h2_pow_gamma12
-            + d2_pow_h2 * r1_pow_gamma21 * r2_pow_gamma12_plus_1 * alpha21_d1_pow_gamma21_h1 * alpha12_d2_pow_gamma12_h2
-            + d2_pow_h2 * r2_pow_gamma12_plus_1 * alpha12_d2_pow_gamma12_h2 * r1_C1h1_pow_gamma21
-            + r1 * r2 * r1_C1h1_pow_gamma21 * C1_pow_h1 * C2_pow_h2
-            + r1 * r2 * r2_C2h2_pow_gamma12 * C1_pow_h1 * C2_pow_h2
-            + r1_pow_gamma21_plus_1 * alpha21_d1_pow_gamma21_h1 * r2_C2h2_pow_gamma12 * C1_pow_h1
-            + r2_pow_gamma12_plus_1 * alpha12_d2_pow_gamma12_h2 * r1_C1h1_pow_gamma21 * C2_pow_h2
-        )
-
-        # Affected by drug 2 only
-        A2 = (
-            d1_pow_h1 * r1 * r2_pow_gamma12 * alpha12_d2_pow_gamma12_h2 * r1_C1h1_pow_gamma21
-            + d2_pow_h2 * r1 * r2 * r1_C1h1_pow_gamma21 * C1_pow_h1
-            + d2_pow_h2 * r1 * r2 * r2_C2h2_pow_gamma12 * C1_pow_h1
-            + d2_pow_h2 * r2_pow_gamma12_plus_1 * alpha12_d2_pow_gamma12_h2 * r1_C1h1_pow_gamma21
-        ) / (
-            d1_pow_h1 * r1 * r2 * r1_C1h1_pow_gamma21 * C2_pow_h2
-            + d1_pow_h1 * r1 * r2 * r2_C2h2_pow_gamma12 * C2_pow_h2
-            + d1_pow_h1 * r1 * r2_pow_gamma12_plus_1 * alpha12_d2_pow_gamma12_h2 * C2_pow_h2
-            + d1_pow_h1 * r1 * r2_pow_gamma12 * alpha12_d2_pow_gamma12_h2 * r1_C1h1_pow_gamma21
-            + d1_pow_h1 * r1_pow_gamma21_plus_1 * r2_pow_gamma12 * alpha21_d1_pow_gamma21_h1 * alpha12_d2_pow_gamma12_h2
-            + d1_pow_h1 * r1_pow_gamma21_plus_1 * alpha21_d1_pow_gamma21_h1 * r2_C2h2_pow_gamma12
-            + d2_pow_h2 * r1 * r2 * r1_C1h1_pow_gamma21 * C1_pow_h1
-            + d2_pow_h2 * r1 * r2 * r2_C2h2_pow_gamma12 * C1_pow_h1
-            + d2_pow_h2 * r1_pow_gamma21_plus_1 * r2 * alpha21_d1_pow_gamma21_h1 * C1_pow_h1
-            + d2_pow_h2 * r1_pow_gamma21 * r2 * alpha21_d1_pow_gamma21_h1 * r2_C2h2_pow_gamma12
-            + d2_pow_h2 * r1_pow_gamma21 * r2_pow_gamma12_plus_1 * alpha21_d1_pow_gamma21_h1 * alpha12_d2_pow_gamma12_h2
-            + d2_pow_h2 * r2_pow_gamma12_plus_1 * alpha12_d2_pow_gamma12_h2 * r1_C1h1_pow_gamma21
-            + r1 * r2 * r1_C1h1_pow_gamma21 * C1_pow_h1 * C2_pow_h2
-            + r1 * r2 * r2_C2h2_pow_gamma12 * C1_pow_h1 * C2_pow_h2
-            + r1_pow_gamma21_plus_1 * alpha21_d1_pow_gamma21_h1 * r2_C2h2_pow_gamma12 * C1_pow_h1
-            + r2_pow_gamma12_plus_1 * alpha12_d2_pow_gamma12_h2 * r1_C1h1_pow_gamma21 * C2_pow_h2
-        )
+        factors = {
+            "d1_pow_h1": d1_pow_h1,
+            "d2_pow_h2": d2_pow_h2,
+            "C1_pow_h1": C1_pow_h1,
+            "C2_pow_h2": C2_pow_h2,
+            "r1": r1,
+            "r2": r2,
+            "alpha21_d1_pow_gamma21_h1": np.float_power(alpha21 * d1, gamma21 * h1),
+            "alpha12_d2_pow_gamma12_h2": np.float_power(alpha12 * d2, gamma12 * h2),
+            "r1_C1h1_pow_gamma21": np.float_power((r1 * C1_pow_h1), gamma21),
+            "r2_C2h2_pow_gamma12": np.float_power((r2 * C2_pow_h2), gamma12),
+            "r1_pow_gamma21_plus_1": np.float_power(r1, (gamma21 + 1)),
+            "r2_pow_gamma12_plus_1": np.float_power(r2, (gamma12 + 1)),
+            "r1_pow_gamma21": np.float_power(r1, gamma21),
+            "r2_pow_gamma12": np.float_power(r2, gamma12),
+        }
+        shape = np.broadcast(*factors.values()).shape
+        dtype = np.result_type(*factors.values())
+
+        if workspace is None:
+            workspace = EvaluationWorkspace()
+        n_terms = len(_STATE_WEIGHT_TERMS)
+        with workspace.get(n_terms + 2, shape, dtype) as buffers:
+            terms = [buffers[i, ...] for i in range(n_terms)]
+            numerator, denominator = buffers[n_terms, ...], buffers[n_terms + 1, ...]
+
+            # Multiply and add in the order of the expanded expressions, so results do not depend on the workspace
+            for term, names in zip(terms, _STATE_WEIGHT_TERMS):
+                np.multiply(factors[names[0]], factors[names[1]], out=term)
+                for name in names[2:]:
+                    np.multiply(term, factors[name], out=term)
+            np.add(terms[0], terms[1], out=denominator)
+            for term in terms[2:]:
+                np.add(denominator, term, out=denominator)
+
+            def occupancy(indices):
+                np.add(terms[indices[0]], terms[indices[1]], out=numerator)
+                for index in indices[2:]:
+                    np.add(numerator, terms[index], out=numerator)
+                return numerator / denominator
+
+            U = occupancy(_U_TERMS)
+            A1 = occupancy(_A1_TERMS)
+            A2 = occupancy(_A2_TERMS)
 
         # Affected by both drugs
         A3 = 1 - (U + A1 + A2)
 
-        return U * E0 + A1 * E1 + A2 * E2 + A3 * E3
+        return U, A1, A2, A3
 
     @staticmethod
     def _get_beta(E0, E1, E2, E3):
@@ -537,13 +580,35 @@ class MuSyC(ParametricSynergyModel2D):
         beta = (strongest_E - E3) / (E0 - strongest_E)
         return beta
 
-    def get_confidence_intervals(self, confidence_interval: float = 95):
-        ci = super().get_confidence_intervals(confidence_interval=confidence_interval)
+    def get_confidence_intervals(self, confidence_interval: float = 95, ci_method: Optional[str] = None):
+        """Return the lower bound and upper bound estimates for each parameter, and for beta.
 
-        if self.bootstrap_parameters is None:
-            return ci
+        Parameters
+        ----------
+        confidence_interval : float, default=95
+            % confidence interval to return. Must be between 0 and 100.
 
+        ci_method : str, optional
+            "bootstrap", "covariance", or "profile". By default, bootstrap intervals are used if available, then
+            profile intervals. beta is not a fit parameter, so with "covariance" or "profile" its interval is
+            calculated by the delta method (propagating the parameter covariance), rather than from a profile
+            likelihood.
+
+        Returns
+        -------
+        Dict[str, Tuple[float, float]]
+            Lower and upper bounds for each parameter keyed by parameter name.
+        """
+        ci = super().get_confidence_intervals(confidence_interval=confidence_interval, ci_method=ci_method)
         params = self._parameter_names
+
+        if ParametricModelMixins.get_ci_method(self, ci_method) != "bootstrap":
+            E_idx = [params.index(E) for E in ["E0", "E1", "E2", "E3"]]
+            ci["beta"] = ParametricModelMixins.delta_method_interval(
+                self, lambda parameters: MuSyC._get_beta(*parameters[E_idx]), confidence_interval
+            )
+            return ci
+
         E0 = self.bootstrap_parameters[:, params.index("E0")]  # type: ignore
         E1 = self.bootstrap_parameters[:, params.index("E1")]  # type: ignore
         E2 = self.bootstrap_parameters[:, params.index("E2")]  # type: ignore
@@ -560,7 +625,7 @@ class MuSyC(ParametricSynergyModel2D):
 
         header = ["Parameter", "Value", "Comparison", "Synergy"]
         ci: Dict[str, Tuple[float, float]] = {}
-        if self.bootstrap_parameters is not None:
+        if self.bootstrap_parameters is not None or self.parameter_covariance is not None:
             ci = self.get_confidence_intervals(confidence_interval=confidence_interval)
             header.insert(2, f"{confidence_interval:0.3g}% CI")
 
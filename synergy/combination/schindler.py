@@ -20,6 +20,7 @@ import numpy as np
 from synergy.combination.synergy_model_2d import DoseDependentSynergyModel2D
 from synergy.single import Hill
 from synergy.single.dose_response_model_1d import DoseResponseModel1D
+from synergy.utils import backend
 
 
 class Schindler(DoseDependentSynergyModel2D):
@@ -58,6 +59,10 @@ class Schindler(DoseDependentSynergyModel2D):
 
     def _model(self, d1, d2, E1, E2, h1, h2, C1, C2):
         """The Schindler model."""
+        kernels = backend.numba_kernels((d1, d2), (E1, E2, h1, h2, C1, C2))
+        if kernels is not None:
+            return kernels.schindler(d1, d2, E1, E2, h1, h2, C1, C2)
+
         m1 = d1 / C1
         m2 = d2 / C2
 
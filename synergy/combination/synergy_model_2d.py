@@ -3,7 +3,7 @@
 import logging
 from abc import ABC, abstractmethod
 from copy import deepcopy
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 import numpy as np
 from scipy.optimize import curve_fit
@@ -11,7 +11,16 @@ from scipy.optimize import curve_fit
 from synergy import utils
 from synergy.exceptions import ModelNotFitToDataError, ModelNotParameterizedError
 from synergy.single.dose_response_model_1d import DoseResponseModel1D
-from synergy.utils.model_mixins import ParametricModelMixins
+from synergy.utils.model_mixins import (
+    CI_METHODS,
+    BootstrapStatus,
+    EvaluationWorkspace,
+    FitContext,
+    FitIntermediatesCache,
+    ParametricModelMixins,
+    ProfileLikelihood,
+)
+from synergy.utils.optimize import batch_curve_fit
 
 _LOGGER = logging.Logger(__name__)
 
@@ -171,6 +180,9 @@ class DoseDependentSynergyModel2D(SynergyModel2D):
 class ParametricSynergyModel2D(SynergyModel2D):
     """Base class for parametric 2-drug synergy models."""
 
+    # True if fit_function and jacobian_function broadcast over parameters passed as arrays of shape (B, 1)
+    _batch_fit_supported = False
+
     def __init__(self, drug1_model=None, drug2_model=None, **kwargs):
         """Ctor."""
         self._bounds: Tuple[Sequence[float], Sequence[float]]
@@ -183,14 +195,36 @@ class ParametricSynergyModel2D(SynergyModel2D):
         self.fit_function: Callable
         self.jacobian_function: Callable
 
+        # Lets jacobian_function reuse what fit_function computed at the same parameters (see _shared_intermediates())
+        self._fit_intermediates = FitIntermediatesCache()
+
+        # Scratch arrays reused by models that evaluate in place during fits (such as MuSyC._state_occupancy())
+        self._fit_workspace = EvaluationWorkspace()
+
+        # Dose-derived arrays of the current fit, passed to fit_function and jacobian_function as xdata
+        self._fit_context: Optional[FitContext] = None
+
         self._converged: bool = False
         self._is_fit: bool = False
+        self._variable_projection: bool = False
 
         self.sum_of_squares_residuals: Optional[float]
         self.r_squared: Optional[float]
         self.aic: Optional[float]
         self.bic: Optional[float]
         self.bootstrap_parameters = None
+        self.bootstrap_status: Optional[BootstrapStatus] = None
+        self.parameter_covariance: Optional[np.ndarray] = None
+        self.parameter_profiles: Optional[ProfileLikelihood] = None
+
+    @property
+    def _linear_parameter_indices(self) -> Optional[Sequence[int]]:
+        """Fit-space indices of parameters that enter the model linearly, for variable projection.
+
+        None if the model does not support variable projection. Models that do must also define
+        _design_matrix(xdata, *nonlinear_params), returning (A, offset).
+        """
+        return None
 
     @abstractmethod
     def E(self, d1, d2):
@@ -201,6 +235,29 @@ class ParametricSynergyModel2D(SynergyModel2D):
         :return ArrayLike: Expected effect of the combination of drugs at doses d1 and d2
         """
 
+    def E_grid(self, d1_unique, d2_unique) -> np.ndarray:
+        """Calculate the expected effect at every combination of the given doses of drug 1 and drug 2.
+
+        Equivalent to ``E(D1, D2)`` with ``D1, D2 = np.meshgrid(d1_unique, d2_unique)``, which is also the ordering of
+        ``dose_utils.make_dose_grid()``. The model is evaluated with d1_unique as a row broadcast against d2_unique as
+        a column, so terms that depend on the dose of only one drug, such as (d1 / C1)^h1, are computed once per
+        unique dose rather than once per combination.
+
+        :param ArrayLike d1_unique: Doses of drug 1, shape (n1,)
+        :param ArrayLike d2_unique: Doses of drug 2, shape (n2,)
+        :return np.ndarray: Expected effect at each combination of doses, shape (n2, n1)
+        """
+        d1 = np.asarray(d1_unique, dtype=float)
+        d2 = np.asarray(d2_unique, dtype=float)
+        if d1.ndim != 1 or d2.ndim != 1:
+            raise ValueError("d1_unique and d2_unique must be 1D arrays")
+        if not self.is_specified:
+            raise ModelNotParameterizedError()
+
+        E = self.E(d1[np.newaxis, :], d2[:, np.newaxis])
+        shape = (d2.size, d1.size)
+        return E if np.shape(E) == shape else np.broadcast_to(E, shape).copy()
+
     def get_parameters(self) -> Dict[str, Any]:
         """Return the model's parameters as a dict keyed by parameter name.
 
@@ -231,7 +288,30 @@ class ParametricSynergyModel2D(SynergyModel2D):
         :param dict kwargs:
             - p0: Initial parameter guesses
             - bootstrap_iterations: Number of bootstrap iterations to perform to estimate confidence intervals
-            - use_jacobian: whether to use the model jacobian when fitting
+            - n_jobs: Number of workers used to run bootstrap iterations (-1 for one per CPU)
+            - executor: "process", "thread", or a ``concurrent.futures.Executor`` used when ``n_jobs != 1``
+            - seed: Seed for bootstrap resampling. Results are identical for a given seed regardless of ``n_jobs``.
+            - bootstrap_solver: "curve_fit" (default) refits each bootstrap iteration separately, "batch" refits all
+              iterations assigned to a worker at once with a vectorized Levenberg-Marquardt solver (MuSyC only)
+            - bootstrap_tol: If given, stop bootstrapping once no confidence interval bound changes by more than this
+              fraction of its interval's width over ``bootstrap_window`` (default 50) iterations. The % confidence
+              interval checked is ``bootstrap_confidence_interval`` (default 95).
+            - bootstrap_timeout, bootstrap_max_nfev: Wall-clock (seconds) and model evaluation budgets for bootstrapping
+            - bootstrap_fail_fast: If True (default), stop bootstrapping once too many iterations have failed for
+              ``bootstrap_iterations`` to converge within ``max_iterations``. See ``model.bootstrap_status``.
+            - ci_method: If "covariance", also estimate the parameter covariance from the Jacobian at the optimum,
+              which allows ``get_confidence_intervals()`` to return asymptotic intervals without bootstrapping. If
+              "profile", also calculate the profile likelihood of each parameter in parallel (using ``n_jobs`` and
+              ``executor``), for intervals of parameters with asymmetric or bounded uncertainty. MuSyC's beta
+              (derived from the E parameters) uses the delta method with either "covariance" or "profile".
+            - profile_confidence_interval: Largest % confidence interval profile likelihoods must cover (default 99)
+            - profile_max_steps: Maximum number of steps each profile likelihood takes on either side of the optimum
+              (default 30). Intervals are nan on a side where the profile stops before crossing the threshold.
+            - variable_projection: If True, parameters that enter the model linearly (such as MuSyC's E parameters)
+              are solved by (bounded) linear least squares inside each iteration, so only the remaining parameters
+              are optimized (MuSyC only)
+            - use_jacobian: whether to use the model jacobian when fitting. If "auto", models without an analytic
+              Jacobian use a complex-step Jacobian (see ``synergy.utils.differentiation``).
             - Additional kwargs for ``scipy.optimize.curve_fit()``
         """
         self._is_fit = True
@@ -240,9 +320,20 @@ class ParametricSynergyModel2D(SynergyModel2D):
         E = np.asarray(E)
 
         # Parse optional kwargs
-        use_jacobian = kwargs.pop("use_jacobian", True if self.jacobian_function is not None else False)
+        use_jacobian = ParametricModelMixins.pop_use_jacobian(self, kwargs)
         bootstrap_iterations = kwargs.pop("bootstrap_iterations", 0)
         max_iterations = kwargs.pop("max_iterations", 10000)
+        bootstrap_kwargs = ParametricModelMixins.pop_bootstrap_kwargs(kwargs)
+        ci_method = kwargs.pop("ci_method", "bootstrap")
+        if ci_method not in CI_METHODS:
+            raise ValueError(f"ci_method must be one of {CI_METHODS} ({ci_method})")
+        profile_confidence_interval = kwargs.pop("profile_confidence_interval", 99)
+        profile_max_steps = kwargs.pop("profile_max_steps", 30)
+        self._variable_projection = kwargs.pop("variable_projection", False)
+        if self._variable_projection and self._linear_parameter_indices is None:
+            raise ValueError(f"{type(self).__name__} does not support variable_projection")
+        self.parameter_covariance = None
+        self.parameter_profiles = None
         p0 = kwargs.pop("p0", None)
         if p0 is not None:
             p0 = list(p0)
@@ -253,27 +344,52 @@ class ParametricSynergyModel2D(SynergyModel2D):
         # Pass bounds and p0 to kwargs for curve_fit()
         kwargs["p0"] = p0
 
-        with np.errstate(divide="ignore", invalid="ignore"):
-            popt = self._fit(d1, d2, E, use_jacobian, **kwargs)
-
-        if popt is None:  # curve_fit() failed to fit parameters
-            self._converged = False
-            return
-
-        # otherwise curve_fit() succeeded
-        self._converged = True
-        self._set_parameters(popt)
-
-        n_parameters = len(popt)
-        n_samples = len(d1)
-        if n_samples - n_parameters - 1 > 0:  # TODO: What is this watching out for?
-            self._score(d1, d2, E)
-            kwargs["p0"] = self._transform_params_to_fit(popt)
-            ParametricModelMixins.bootstrap_parameter_ranges(
-                self, E, use_jacobian, bootstrap_iterations, max_iterations, d1, d2, **kwargs
-            )
-
-    def get_confidence_intervals(self, confidence_interval: float = 95) -> Dict[str, Tuple[float, float]]:
+        with ParametricModelMixins.fit_context(self, (d1, d2)):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                popt = self._fit(d1, d2, E, use_jacobian, **kwargs)
+
+            if popt is None:  # curve_fit() failed to fit parameters
+                self._converged = False
+                return
+
+            # otherwise curve_fit() succeeded
+            self._converged = True
+            self._set_parameters(popt)
+
+            n_parameters = len(popt)
+            n_samples = len(d1)
+            if n_samples - n_parameters - 1 > 0:  # TODO: What is this watching out for?
+                self._score(d1, d2, E)
+                if ci_method in ("covariance", "profile"):
+                    self.parameter_covariance = ParametricModelMixins.parameter_covariance(
+                        self, self._fit_context, E, use_jacobian
+                    )
+                if ci_method == "profile":
+                    ParametricModelMixins.profile_likelihood(
+                        self,
+                        self._fit_context,
+                        E,
+                        use_jacobian,
+                        profile_confidence_interval,
+                        n_jobs=bootstrap_kwargs.get("n_jobs", 1),
+                        executor=bootstrap_kwargs.get("executor", "process"),
+                        max_steps=profile_max_steps,
+                        **kwargs,
+                    )
+                kwargs["p0"] = self._transform_params_to_fit(popt)
+                ParametricModelMixins.bootstrap_parameter_ranges(
+                    self, E, use_jacobian, bootstrap_iterations, max_iterations, d1, d2, **bootstrap_kwargs, **kwargs
+                )
+
+    def _end_fit(self):
+        """Release the dose-derived arrays, cached intermediates, and scratch arrays of the last fit."""
+        self._fit_context = None
+        self._fit_intermediates.clear()
+        self._fit_workspace.clear()
+
+    def get_confidence_intervals(
+        self, confidence_interval: float = 95, ci_method: Optional[str] = None
+    ) -> Dict[str, Tuple[float, float]]:
         """Return the lower bound and upper bound estimates for each parameter.
 
         Parameters
@@ -281,6 +397,11 @@ class ParametricSynergyModel2D(SynergyModel2D):
         confidence_interval : float, default=95
             % confidence interval to return. Must be between 0 and 100.
 
+        ci_method : str, optional
+            "bootstrap" to use percentiles of bootstrap_parameters, "covariance" to use asymptotic intervals from
+            the parameter covariance at the optimum, or "profile" to use profile likelihood intervals. By default,
+            bootstrap intervals are used if available, then profile intervals.
+
         Returns
         -------
         Dict[str, Tuple[float, float]]
@@ -292,14 +413,16 @@ class ParametricSynergyModel2D(SynergyModel2D):
             raise ModelNotFitToDataError()
         if confidence_interval < 0 or confidence_interval > 100:
             raise ValueError(f"confidence_interval must be between 0 and 100 ({confidence_interval})")
-        if self.bootstrap_parameters is None:
-            raise ValueError(
-                "Model must have been fit with bootstrap_iterations > 0 to get parameter confidence intervals"
-            )
-
-        lb = (100 - confidence_interval) / 2.0
-        ub = 100 - lb
-        intervals = np.percentile(self.bootstrap_parameters, [lb, ub], axis=0).transpose()
+        ci_method = ParametricModelMixins.get_ci_method(self, ci_method)
+
+        if ci_method == "covariance":
+            intervals = ParametricModelMixins.covariance_confidence_intervals(self, confidence_interval)
+        elif ci_method == "profile":
+            intervals = ParametricModelMixins.profile_confidence_intervals(self, confidence_interval)
+        else:
+            lb = (100 - confidence_interval) / 2.0
+            ub = 100 - lb
+            intervals = np.percentile(self.bootstrap_parameters, [lb, ub], axis=0).transpose()
         return dict(zip(self._parameter_names, intervals))
 
     def _get_initial_guess(self, d1, d2, E, p0):
@@ -308,6 +431,20 @@ class ParametricSynergyModel2D(SynergyModel2D):
             p0 = list(self._transform_params_to_fit(p0))
         return utils.sanitize_initial_guess(p0, self._bounds)
 
+    def _shared_intermediates(self, function: Callable, d, params: Sequence, *args):
+        """Evaluate intermediates shared by fit_function and jacobian_function, reusing the last evaluation.
+
+        Models whose fit_function and jacobian_function both need (e.g.) d**h can compute it with a function called
+        through this method, so the Jacobian reuses the value computed when the model was last evaluated.
+
+        :param Callable function: Evaluates the intermediates
+        :param d: Doses, as passed to fit_function and jacobian_function
+        :param Sequence params: Fit parameters, as passed to fit_function and jacobian_function
+        :param args: Arguments for function, which must depend only on d and params
+        :return: The result of function(*args)
+        """
+        return self._fit_intermediates.get(function, d, params, *args)
+
     def _transform_params_from_fit(self, params):
         """Transform parameters from curve-fitting scale to linear scale.
 
@@ -322,24 +459,48 @@ class ParametricSynergyModel2D(SynergyModel2D):
         """
         return params
 
-    def _fit(self, d1, d2, E, use_jacobian: bool, **kwargs):
+    def _get_fit_context(self, d1, d2) -> FitContext:
+        """Return the context created by fit() for doses (d1, d2), or a new one if _fit() was called with others."""
+        if self._fit_context is not None and self._fit_context.is_for((d1, d2)):
+            return self._fit_context
+        return FitContext((d1, d2))
+
+    def _fit(self, d1, d2, E, use_jacobian: Union[bool, str], **kwargs):
         """Fit the model to data (d, E)"""
-        jac = self.jacobian_function if use_jacobian else None
+        jac = ParametricModelMixins.get_jacobian_function(self, use_jacobian)
         if use_jacobian and jac is None:
             _LOGGER.warning(f"No jacobian function is specified for {type(self).__name__}, ignoring `use_jacobian`.")
-        popt = curve_fit(
-            self.fit_function,
-            (d1, d2),
-            E,
-            bounds=self._bounds,
-            jac=jac,
-            **kwargs,
-        )[0]
+        xdata = self._get_fit_context(d1, d2)
+        if self._variable_projection:
+            popt = ParametricModelMixins.variable_projection_fit(self, xdata, E, use_jacobian, **kwargs)
+        else:
+            popt = curve_fit(
+                self.fit_function,
+                xdata,
+                E,
+                bounds=self._bounds,
+                jac=jac,
+                **kwargs,
+            )[0]
 
         if np.isnan(popt).any():
             return None
         return self._transform_params_from_fit(popt)
 
+    def _fit_batch(self, d1, d2, E, use_jacobian: Union[bool, str], **kwargs):
+        """Fit the model to each row of E simultaneously.
+
+        :param ArrayLike d1: Concentration of drug 1
+        :param ArrayLike d2: Concentration of drug 2
+        :param ArrayLike E: Observed effects for each of B datasets, shape (B, len(d1))
+        :param Union[bool, str] use_jacobian: Whether to use the jacobian when fitting, or "auto"
+        :param kwargs: p0 and solver options passed to ``synergy.utils.optimize.batch_curve_fit()``
+        :return np.ndarray: Fit parameters for each dataset, shape (B, n_parameters). Rows that failed are nan.
+        """
+        jac = ParametricModelMixins.get_jacobian_function(self, use_jacobian)
+        popt, _ = batch_curve_fit(self.fit_function, (d1, d2), E, kwargs.pop("p0"), self._bounds, jac=jac, **kwargs)
+        return np.column_stack(self._transform_params_from_fit(popt.T))
+
     def _score(self, d1, d2, E):
         """Calculate goodness of fit and model quality scores
 
@@ -13,13 +13,14 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import List, Type
+from typing import List, Optional, Type
 
 import numpy as np
 
 from synergy.combination.synergy_model_2d import DoseDependentSynergyModel2D
 from synergy.single import Hill
 from synergy.single.dose_response_model_1d import DoseResponseModel1D
+from synergy.utils.model_mixins import FitContext
 
 
 class ZIP(DoseDependentSynergyModel2D):
@@ -37,6 +38,15 @@ class ZIP(DoseDependentSynergyModel2D):
     ZIP models store these delta values as model._synergy, but also store the Hill equation fits for drug1 and drug2
     across the whole surface, allowing investigation of how h and C change across the surface
 
+    Parameters
+    ----------
+    use_jacobian : bool
+        If True, use analytic Jacobians for the Hill-equation slice fits
+
+    variable_projection : bool
+        If True, fit each Hill-equation slice over h and C only, solving Emax in closed form (see Hill.fit()). This is
+        usually faster, with equivalent results. Default False.
+
 
     Members
     -------
@@ -56,9 +66,17 @@ class ZIP(DoseDependentSynergyModel2D):
         The EC50 of drug 2 obtained by holding D1==constant
     """
 
-    def __init__(self, use_jacobian: bool = True, drug1_model=None, drug2_model=None, **kwargs):
+    def __init__(
+        self,
+        use_jacobian: bool = True,
+        drug1_model=None,
+        drug2_model=None,
+        variable_projection: bool = False,
+        **kwargs,
+    ):
         super().__init__(drug1_model=drug1_model, drug2_model=drug2_model, **kwargs)
         self.use_jacobian = use_jacobian
+        self.variable_projection = variable_projection
 
         self._h_21: List[float] = []  # h of drug 1, holding drug 2 fixed
         self._h_12: List[float] = []  # h of drug 2, holding drug 1 fixed
@@ -111,7 +129,13 @@ class ZIP(DoseDependentSynergyModel2D):
             mask = np.where(d2 == D2)
             y2 = drug2_model.E(D2)
             zip_model.E0 = y2
-            zip_model.fit(d1[mask], E[mask], use_jacobian=self.use_jacobian, p0=[Emax_1, h1, C1])
+            zip_model.fit(
+                d1[mask],
+                E[mask],
+                use_jacobian=self.use_jacobian,
+                p0=[Emax_1, h1, C1],
+                variable_projection=self.variable_projection,
+            )
             self._h_21.append(zip_model.h)
             self._C_21.append(zip_model.C)
             self._Emax_21.append(zip_model.Emax)
@@ -120,7 +144,13 @@ class ZIP(DoseDependentSynergyModel2D):
             mask = np.where(d1 == D1)
             y1 = drug1_model.E(D1)
             zip_model.E0 = y1
-            zip_model.fit(d2[mask], E[mask], use_jacobian=self.use_jacobian, p0=[Emax_2, h2, C2])
+            zip_model.fit(
+                d2[mask],
+                E[mask],
+                use_jacobian=self.use_jacobian,
+                p0=[Emax_2, h2, C2],
+                variable_projection=self.variable_projection,
+            )
             self._h_12.append(zip_model.h)
             self._C_12.append(zip_model.C)
             self._Emax_12.append(zip_model.Emax)
@@ -189,17 +219,28 @@ class _Hill_3P(Hill):
         return ["Emax", "h", "C"]
 
     def _model_to_fit(self, d, Emax, logh, logC):
-        return self._model(d, self.E0, Emax, np.exp(logh), np.exp(logC))
+        return self._model(FitContext.of(d).doses, self.E0, Emax, np.exp(logh), np.exp(logC))
+
+    @property
+    def _linear_parameter_indices(self) -> Optional[List[int]]:
+        """Emax enters the model linearly."""
+        return [0]
+
+    def _design_matrix(self, d, logh, logC):
+        dh = np.float_power(FitContext.of(d).doses, np.exp(logh))
+        occupancy = dh / (np.exp(logC * np.exp(logh)) + dh)
+        return occupancy[:, None], self.E0 * (1 - occupancy)
 
     def _model_jacobian_for_fit(self, d, Emax, logh, logC):
-        dh = d ** (np.exp(logh))
+        context = FitContext.of(d)
+        dh = context.doses ** (np.exp(logh))
         Ch = (np.exp(logC)) ** (np.exp(logh))
-        logd = np.log(d)
+        logd = context.log_doses
         E0 = self.E0
         jEmax = dh / (Ch + dh)
         jC = (E0 - Emax) * dh * np.exp(logh + logC) * (np.exp(logC)) ** (np.exp(logh) - 1) / ((Ch + dh) * (Ch + dh))
         jh = (Emax - E0) * dh * np.exp(logh) * ((Ch + dh) * logd - (logC * Ch + logd * dh)) / ((Ch + dh) * (Ch + dh))
-        jac = np.hstack((jEmax.reshape(-1, 1), jh.reshape(-1, 1), jC.reshape(-1, 1)))
+        jac = np.stack(np.broadcast_arrays(jEmax, jh, jC), axis=-1)
         jac[np.isnan(jac)] = 0
         return jac
 
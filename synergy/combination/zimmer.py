@@ -16,12 +16,13 @@
 from typing import Dict, List, Tuple, Type
 
 import numpy as np
+from scipy.special import xlogy
 
 from synergy.combination.synergy_model_2d import ParametricSynergyModel2D
 from synergy.exceptions import ModelNotParameterizedError
 from synergy.single import Hill_2P
 from synergy.single.dose_response_model_1d import DoseResponseModel1D
-from synergy.utils import format_table
+from synergy.utils import backend, format_table
 from synergy.utils.model_mixins import ParametricModelMixins
 
 
@@ -45,7 +46,7 @@ class Zimmer(ParametricSynergyModel2D):
     def __init__(self, drug1_model=None, drug2_model=None, **kwargs):
         super().__init__(drug1_model=drug1_model, drug2_model=drug2_model, **kwargs)
         self.fit_function = self._model_to_fit
-        self.jacobian_function = None  # TODO
+        self.jacobian_function = self._jacobian
 
     @property
     def _parameter_names(self) -> List[str]:
@@ -56,7 +57,82 @@ class Zimmer(ParametricSynergyModel2D):
         return {"h1": (0, np.inf), "h2": (0, np.inf), "C1": (0, np.inf), "C2": (0, np.inf)}
 
     def _model_to_fit(self, d, logh1, logh2, logC1, logC2, a12, a21):
-        return self._model(d[0], d[1], np.exp(logh1), np.exp(logh2), np.exp(logC1), np.exp(logC2), a12, a21)
+        kernels = backend.numba_kernels((d[0], d[1]), (logh1, logh2, logC1, logC2, a12, a21))
+        if kernels is not None:
+            h1, h2, C1, C2 = np.exp([logh1, logh2, logC1, logC2])
+            return kernels.zimmer(d[0], d[1], h1, h2, C1, C2, a12, a21)
+        terms = self._fit_terms(d, (logh1, logh2, logC1, logC2, a12, a21))
+        return terms["E1"] * terms["E2"]
+
+    def _fit_terms(self, d, params):
+        """Evaluate _model_terms() for the fit parameters, reusing them between fit_function and jacobian_function."""
+        logh1, logh2, logC1, logC2, a12, a21 = params
+        return self._shared_intermediates(
+            self._model_terms,
+            d,
+            params,
+            d[0],
+            d[1],
+            np.exp(logh1),
+            np.exp(logh2),
+            np.exp(logC1),
+            np.exp(logC2),
+            a12,
+            a21,
+        )
+
+    def _jacobian(self, d, logh1, logh2, logC1, logC2, a12, a21):
+        """Jacobian of the model with respect to log h1, log h2, log C1, log C2, a12, and a21.
+
+        d1p is the root of A * d1p^2 + B * d1p + C = 0, so by implicit differentiation
+        dd1p/dtheta = -(A' * d1p^2 + B' * d1p + C') / sqrt(B^2 - 4AC). Dividing by d1p, and using C / d1p = A * d1p',
+        where d1p' = (-B - sqrt(B^2 - 4AC)) / (2A) is the other root, gives dlog(d1p)/dtheta without dividing by d1p,
+        so it remains finite at d1 = 0. d2p = d2 / (1 + a21 * s) with s = d1p / (d1p + C1) then follows directly.
+        """
+        kernels = backend.numba_kernels((d[0], d[1]), (logh1, logh2, logC1, logC2, a12, a21))
+        if kernels is not None:
+            return kernels.zimmer_jacobian(d[0], d[1], logh1, logh2, logC1, logC2, a12, a21)
+
+        d1, d2 = d[0], d[1]
+        h1, h2 = np.exp(logh1), np.exp(logh2)
+        C1, C2 = np.exp(logC1), np.exp(logC2)
+        terms = self._fit_terms(d, (logh1, logh2, logC1, logC2, a12, a21))
+        d1p, s, r1, r2 = terms["d1p"], terms["s"], terms["r1"], terms["r2"]
+        E1, E2 = terms["E1"], terms["E2"]
+        B, sqrt_discriminant = terms["B"], terms["sqrt_discriminant"]
+        C_over_d1p = (-B - sqrt_discriminant) / 2
+
+        # (A', B', C' / C) for log C1, log C2, a12, and a21
+        coefficient_derivatives = [
+            (0, C1 * (d2 * (1 + a12) + C2), 1),
+            (C2 * (1 + a21), C2 * (C1 - d1 * (1 + a21)), C2 / (d2 + C2)),
+            (d2, C1 * d2, 0),
+            (C2, -d1 * C2, 0),
+        ]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dlogd1p = [
+                -(dA * d1p + dB + dlogC * C_over_d1p) / sqrt_discriminant for dA, dB, dlogC in coefficient_derivatives
+            ]
+
+            # dlog(d1p / C1) and dlog(d2p / C2), where dlog(d2p) = -(a21 * ds + s * da21) / (1 + a21 * s), and
+            # ds = s * (1 - s) * dlog(d1p / C1)
+            dlogx1 = [dlogd1p[0] - 1] + dlogd1p[1:]
+            dlogx2 = [-a21 * s * (1 - s) * dlogx / (1 + a21 * s) for dlogx in dlogx1]
+            dlogx2[1] = dlogx2[1] - 1
+            dlogx2[3] = dlogx2[3] - s / (1 + a21 * s)
+
+            # E = E1 * E2, where Ei = 1 / (1 + ri), so dlog(Ei) = -(1 - Ei) * dlog(ri) = -Ei * ri * dlog(ri)
+            m1 = E1 * r1
+            m2 = E2 * r2
+            E = E1 * E2
+            jac = np.stack(
+                [-E * xlogy(m1, r1), -E * xlogy(m2, r2)]
+                + [-E * (h1 * m1 * dx1 + h2 * m2 * dx2) for dx1, dx2 in zip(dlogx1, dlogx2)],
+                axis=-1,
+            )
+        jac[np.isnan(jac)] = 0
+        return jac
 
     def _get_initial_guess(self, d1, d2, E, p0):
         # If there is no intial guess, use single-drug models to come up with intitial guess
@@ -116,17 +192,46 @@ class Zimmer(ParametricSynergyModel2D):
         return self._model(d1, d2, self.h1, self.h2, self.C1, self.C2, 0, 0)
 
     def _model(self, d1, d2, h1, h2, C1, C2, a12, a21):
+        kernels = backend.numba_kernels((d1, d2), (h1, h2, C1, C2, a12, a21))
+        if kernels is not None:
+            return kernels.zimmer(d1, d2, h1, h2, C1, C2, a12, a21)
+        terms = self._model_terms(d1, d2, h1, h2, C1, C2, a12, a21)
+        return terms["E1"] * terms["E2"]
+
+    @staticmethod
+    def _model_terms(d1, d2, h1, h2, C1, C2, a12, a21) -> Dict[str, np.ndarray]:
+        """Intermediate terms of the Zimmer model, shared by _model() and _jacobian().
+
+        The effective dose d1p is the positive root of A * d1p^2 + B * d1p + C = 0, and E = E1 * E2, where
+        Ei = 1 / (1 + ri) and ri = (dip / Ci)^hi.
+        """
         A = d2 + C2 * (a21 + 1) + d2 * a12
         B = d2 * C1 + C1 * C2 + a12 * d2 * C1 - d1 * (d2 + C2 * (a21 + 1))
         C = -d1 * (d2 * C1 + C1 * C2)
+        sqrt_discriminant = np.sqrt(np.float_power(B, 2.0) - 4 * A * C)
 
-        d1p = (-B + np.sqrt(np.float_power(B, 2.0) - 4 * A * C)) / (2.0 * A)
-        with np.errstate(divide="ignore"):
-            d2p = d2 / (1.0 + a21 / (1.0 + C1 / d1p))
+        # -B + sqrt_discriminant cancels catastrophically when 4AC << B^2 (such as near d1 = 0, or for large a12 and
+        # a21), so in that case use the equivalent form 2C / (-B - sqrt_discriminant)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d1p = np.where(B > 0, 2.0 * C / (-B - sqrt_discriminant), (-B + sqrt_discriminant) / (2.0 * A))
 
-        return (1 - np.float_power(d1p, h1) / (np.float_power(C1, h1) + np.float_power(d1p, h1))) * (
-            1 - np.float_power(d2p, h2) / (np.float_power(C2, h2) + np.float_power(d2p, h2))
-        )
+        s = d1p / (d1p + C1)
+        d2p = d2 / (1.0 + a21 * s)
+
+        r1 = np.float_power(d1p / C1, h1)
+        r2 = np.float_power(d2p / C2, h2)
+
+        return {
+            "B": B,
+            "sqrt_discriminant": sqrt_discriminant,
+            "d1p": d1p,
+            "d2p": d2p,
+            "s": s,
+            "r1": r1,
+            "r2": r2,
+            "E1": 1 / (1 + r1),
+            "E2": 1 / (1 + r2),
+        }
 
     @property
     def _required_single_drug_class(self) -> Type[DoseResponseModel1D]:
@@ -167,7 +272,7 @@ class Zimmer(ParametricSynergyModel2D):
 
         header = ["Parameter", "Value", "Comparison", "Synergy"]
         ci: Dict[str, Tuple[float, float]] = {}
-        if self.bootstrap_parameters is not None:
+        if self.bootstrap_parameters is not None or self.parameter_covariance is not None:
             ci = self.get_confidence_intervals(confidence_interval=confidence_interval)
             header.insert(2, f"{confidence_interval:0.3g}% CI")
 
@@ -13,9 +13,12 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
 
 from synergy import utils
 from synergy.exceptions import ModelNotParameterizedError
@@ -24,6 +27,150 @@ from synergy.single.dose_response_model_1d import DoseResponseModel1D
 from synergy.single.hill import Hill
 from synergy.utils.model_mixins import ParametricModelMixins
 
+# With automatic solver selection, the sparse steady-state solver is used for at least this many drugs when the stacked
+# dense transition matrices of all dose rows would exceed the model's memory_budget (rather than solving them in
+# chunks), and always used for at least _ALWAYS drugs, where sparse factorization is faster than dense.
+_SPARSE_SOLVER_MIN_DRUGS = 6
+_SPARSE_SOLVER_MIN_DRUGS_ALWAYS = 9
+
+
+class MuSyCTopology:
+    """The state graph of an N-drug MuSyC model, and the names and layout of its parameters.
+
+    MuSyC models a population in 2^N states, one for each combination of drugs affecting it. States are integer
+    bitmasks, where bit k is set if drug k+1 is present (so state 0b101 is affected by drugs 1 and 3). Adding a drug to
+    a state that already has at least one drug is a synergy edge, with its own alpha and gamma parameters.
+
+    Topologies depend only on N, so ``MuSyCTopology(N)`` is computed once and shared by every caller. It is immutable.
+
+    :param int n: Number of drugs
+    """
+
+    _cache: Dict[int, "MuSyCTopology"] = {}
+
+    def __new__(cls, n: int):
+        if n not in cls._cache:
+            if n < 2:
+                raise ValueError(f"MuSyC requires at least two drugs (N={n}). Specify num_drugs or single_drug_models.")
+            topology = super().__new__(cls)
+            topology._build(n)
+            cls._cache[n] = topology
+        return cls._cache[n]
+
+    def _build(self, n: int):
+        n_states = 2**n
+        states = np.arange(n_states)
+        state_names = tuple(
+            ",".join(sorted(str(drug + 1) for drug in range(n) if state >> drug & 1)) or "0"
+            for state in range(n_states)
+        )
+
+        # Synergy edges, in parameter order: by start state, then by added drug from last to first
+        edges = tuple(
+            (start, start | 1 << drug)
+            for start in range(1, n_states)
+            for drug in reversed(range(n))
+            if not start >> drug & 1
+        )
+        edge_index = {edge: idx for idx, edge in enumerate(edges)}
+        edge_names = tuple(f"{state_names[start]}_{state_names[start ^ end]}" for start, end in edges)
+
+        # Transition tables: row k holds the edges of drug k, ordered by lower state
+        lower = np.asarray([[state for state in states if not state >> drug & 1] for drug in range(n)], dtype=int)
+        upper = lower | (1 << np.arange(n))[:, np.newaxis]
+        edge_param = np.asarray(
+            [[edge_index.get((start, end), -1) for start, end in zip(*row)] for row in zip(lower, upper)], dtype=int
+        )
+        n_edges = lower.shape[1]
+        diagonal_index = np.zeros((n_states, n), dtype=int)
+        drugs = np.arange(n)[:, np.newaxis]
+        diagonal_index[lower, drugs] = drugs * n_edges + np.arange(n_edges)
+        diagonal_index[upper, drugs] = (n + drugs) * n_edges + np.arange(n_edges)
+        for array in (states, lower, upper, edge_param, diagonal_index):
+            array.setflags(write=False)
+
+        parameter_names = (
+            tuple(f"E_{name}" for name in state_names)
+            + tuple(f"h_{drug + 1}" for drug in range(n))
+            + tuple(f"C_{drug + 1}" for drug in range(n))
+            + tuple(f"alpha_{name}" for name in edge_names)
+            + tuple(f"gamma_{name}" for name in edge_names)
+        )
+        h_offset = n_states
+        alpha_offset = h_offset + 2 * n
+        gamma_offset = alpha_offset + len(edges)
+
+        attributes = dict(
+            n=n,
+            n_states=n_states,
+            states=states,
+            state_names=state_names,
+            edges=edges,
+            edge_index=MappingProxyType(edge_index),
+            lower=lower,
+            upper=upper,
+            edge_param=edge_param,
+            diagonal_index=diagonal_index,
+            parameter_names=parameter_names,
+            E=slice(0, h_offset),
+            h=slice(h_offset, h_offset + n),
+            C=slice(h_offset + n, alpha_offset),
+            alpha=slice(alpha_offset, gamma_offset),
+            gamma=slice(gamma_offset, len(parameter_names)),
+        )
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+    # Attributes, documented here because they are set in _build()
+    #: Number of drugs
+    n: int
+    #: Number of states, 2^N
+    n_states: int
+    #: Every state, as a bitmask
+    states: np.ndarray
+    #: Drugs present in each state, such as "0" (undrugged) or "1,3"
+    state_names: Tuple[str, ...]
+    #: (start state, end state) of each synergy edge, in alpha (gamma) parameter order
+    edges: Tuple[Tuple[int, int], ...]
+    #: Map of (start state, end state) to the alpha (gamma) parameter index of each synergy edge
+    edge_index: Mapping[Tuple[int, int], int]
+    #: Shape (N, 2^(N-1)). Adding drug k pairs each state lacking it (lower[k]) with the state reached (upper[k]), so
+    #: each drug's edges form a perfect matching of the states
+    lower: np.ndarray
+    upper: np.ndarray
+    #: Shape (N, 2^(N-1)). Alpha (gamma) parameter index of each edge in lower/upper, or -1 for non-synergistic edges
+    #: leaving the undrugged state
+    edge_param: np.ndarray
+    #: Shape (2^N, N). Index of each state's outgoing transitions among the flattened forward (adding drug) rates,
+    #: followed by the flattened reverse (removing drug) rates
+    diagonal_index: np.ndarray
+    #: Names of all parameters, including gamma
+    parameter_names: Tuple[str, ...]
+    #: Positions of the E, h, C, alpha, and gamma parameters in parameter_names
+    E: slice
+    h: slice
+    C: slice
+    alpha: slice
+    gamma: slice
+
+    def get_parameter_names(self, fit_gamma: bool) -> Tuple[str, ...]:
+        """Names of the model's parameters.
+
+        :param bool fit_gamma: Whether gamma parameters are included
+        :return Tuple[str, ...]: Parameter names, in order E, h, C, alpha (and gamma)
+        """
+        return self.parameter_names if fit_gamma else self.parameter_names[: self.gamma.start]
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        # Copies and unpickled topologies resolve to the shared instance
+        return MuSyCTopology, (self.n,)
+
+    def __repr__(self):
+        return f"MuSyCTopology({self.n})"
+
 
 class MuSyC(ParametricSynergyModelND):
     """The MuSyC model for n-dimensional drug combinations.
@@ -35,6 +182,14 @@ class MuSyC(ParametricSynergyModelND):
     - fit_gamma=False (default) - fits only alpha and beta, with gamma fixed to 1.0
     - fit_gamma=True - fits all synergy parameters (alpha, beta, and gamma)
 
+    The equilibrium state occupancies are found by solving a linear system over the 2^N drug states. ``solver`` selects
+    how:
+
+    - solver="auto" (default) - chooses based on the number of drugs and dose rows
+    - solver="dense" - stacks a dense (2^N, 2^N) matrix per dose row, which is fastest for few drugs
+    - solver="sparse" - uses one sparse factorization exploiting the N * 2^(N-1) edges of the state graph, which scales
+      to larger combinations
+
     .. csv-table:: Interpretation of synergy parameters
        :header: "Parameter", "Values", "Synergy/Antagonism", "Interpretation"
 
@@ -46,6 +201,9 @@ class MuSyC(ParametricSynergyModelND):
        ,                "> 1",    "Synergistic Cooperativity",  "Drug(s) ``a`` increase the cooperativity of drug ``b``"
     """
 
+    # _state_occupancy() chooses the solver from the number of dose rows before chunking them
+    _fit_function_chunks_doses = True
+
     # Bounds will depened on the number of dimensions, so will be filled out in _get_initial_guess()
     def __init__(
         self,
@@ -53,17 +211,18 @@ class MuSyC(ParametricSynergyModelND):
         num_drugs: int = -1,
         r_r=1.0,
         fit_gamma=False,
+        solver: str = "auto",
         **kwargs,
     ):
         """Ctor."""
-        # Given 3 drugs, there are 9 synergy edges, and so 9 synergistic potencies and cooperativities.
-        # Thus, alphas=[a,b,c,d,e,f,g,h,i]. _edge_index[2][6] will give the index of the alpha corresponding to going
-        # from state [010] to [110] (e.g., adding drug 3).
+        if solver not in ("auto", "dense", "sparse"):
+            raise ValueError(f"solver must be one of 'auto', 'dense', or 'sparse' (got '{solver}')")
+        self.solver = solver
         if single_drug_models:
             self.N = len(single_drug_models)
         else:
             self.N = num_drugs
-        self._edge_index = MuSyC._get_edge_indices(self.N)
+        self._topology = MuSyCTopology(self.N)
         self.fit_gamma = fit_gamma
 
         super().__init__(single_drug_models=single_drug_models, num_drugs=num_drugs, **kwargs)
@@ -72,8 +231,10 @@ class MuSyC(ParametricSynergyModelND):
 
         if not self.fit_gamma:
             self.fit_function = self._model_no_gamma
+            self.jacobian_function = self._jacobian_no_gamma
         else:
             self.fit_function = self._model
+            self.jacobian_function = self._jacobian_with_gamma
 
     def _transform_params_to_fit(self, params):
         """Transform linear parameters to log-scale for fitting.
@@ -130,12 +291,10 @@ class MuSyC(ParametricSynergyModelND):
 
             # Make guesses of E for each drug state
             for idx in range(self._num_E_params):
-                # state = [0,1,1] means drug3=0, drug2=1, drug1=1
-                state = MuSyC._idx_to_state(idx, self.N)
+                # state idx = 0b011 means drug3=0, drug2=1, drug1=1
                 mask = d[:, 0] > -1  # d is always > 0, so initializes to array of True
                 for drugnum in range(self.N):  # e.g., 0, 1, 2 (N=3)
-                    drugstate = state[self.N - drugnum - 1]  # e.g., 0->2, 1->1, 2->0  (N=3)
-                    if drugstate == 0:
+                    if not idx >> drugnum & 1:
                         mask = mask & (d[:, drugnum] == np.min(d[:, drugnum]))
                     else:
                         mask = mask & (d[:, drugnum] == np.max(d[:, drugnum]))
@@ -252,38 +411,13 @@ class MuSyC(ParametricSynergyModelND):
         :return Dict[int, Dict[int, int]]: Map of start state, end state, to index of associated alpha (gamma) parameter
         """
         edge_index: Dict[int, Dict[int, int]] = dict()
-        count = 0
-        for i in range(1, 2**n):
-            add_d, _rem_d = MuSyC._get_neighbors(i, n)  # only map edges corresponding to adding drugs, so ignore rem_d.
-            if len(add_d) > 0:
-                edge_index[i] = dict()
-            for j in add_d:
-                edge_index[i][j[1]] = count
-                count += 1
+        for (start_state, end_state), idx in MuSyCTopology(n).edge_index.items():
+            edge_index.setdefault(start_state, dict())[end_state] = idx
         return edge_index
 
     @property
     def _parameter_names(self) -> List[str]:
-        param_names = []
-        gamma_names = []
-        for i in range(self._num_E_params):
-            drug_string = MuSyC._get_drug_string_from_state(MuSyC._idx_to_state(i, self.N))
-            param_names.append(f"E_{drug_string}")
-        for i in range(self._num_h_params):
-            param_names.append(f"h_{i + 1}")
-        for i in range(self._num_C_params):
-            param_names.append(f"C_{i + 1}")
-        for start_state in self._edge_index:
-            for end_state in self._edge_index[start_state]:
-                edge_string = MuSyC._get_drug_string_from_edge(
-                    MuSyC._idx_to_state(start_state, self.N), MuSyC._idx_to_state(end_state, self.N)
-                )
-                param_names.append(f"alpha_{edge_string}")
-                gamma_names.append(f"gamma_{edge_string}")
-
-        if self.fit_gamma:
-            return param_names + gamma_names
-        return param_names
+        return list(self._topology.get_parameter_names(self.fit_gamma))
 
     @property
     def _default_fit_bounds(self) -> Dict[str, Tuple[float, float]]:
@@ -296,7 +430,7 @@ class MuSyC(ParametricSynergyModelND):
     @property
     def _num_E_params(self):
         """One per drug state."""
-        return 2**self.N
+        return self._topology.n_states
 
     @property
     def _num_h_params(self):
@@ -311,118 +445,323 @@ class MuSyC(ParametricSynergyModelND):
     @property
     def _num_alpha_params(self):
         """One per edge from a drugged state to another drugged state."""
-        return 2 ** (self.N - 1) * self.N - self.N
+        return len(self._topology.edges)
 
     @property
     def _num_gamma_params(self):
         """One per edge from a drugged state to another drugged state."""
-        return 2 ** (self.N - 1) * self.N - self.N
+        return len(self._topology.edges)
 
     def _model_no_gamma(self, d, *args):
         """MuSyC model assuming gamma == 1."""
         loggammas = [0] * self._num_gamma_params
         return self._model(d, *args, *loggammas)
 
+    @property
+    def _linear_parameter_indices(self) -> List[int]:
+        """The E parameters enter the model linearly."""
+        return list(range(self._num_E_params))
+
+    def _design_matrix(self, d, *args):
+        """State occupancies, which multiply the E parameters to give the model's effect."""
+        if not self.fit_gamma:
+            args = (*args, *([0] * self._num_gamma_params))
+        return self._state_occupancy(d, *args), 0
+
     def _model(self, d, *args):
         """MuSyC model.
 
-        This creates a transition matrix for the MuSyC model and then solves for the equilibrium state by inverting it.
+        The effect is the sum of each state's E parameter, weighted by the fraction of the population in that state.
+        """
+        E_params = np.asarray(args[: self._num_E_params])
+        return np.dot(self._state_occupancy(d, *args[self._num_E_params :]), E_params)
+
+    def _state_occupancy(self, d, *args):
+        """Fraction of the population in each state at equilibrium, shape (len(d), 2**N).
+
+        This creates a transition matrix for the MuSyC model and then solves for the equilibrium state, with either a
+        dense or a sparse solver (see ``solver``).
+        args are the log-scaled h, C, alpha, and gamma parameters.
         """
-        # `matrix` is the state transition matrix for the MuSyC model
-        # matrix[i, :, :] is the state transition matrix at d[i]
-        # That is to say, the matrix is handled completely numerically, rather than symbolically solving and then
-        # plugging in doses.
         if len(d.shape) == 1:
             d = np.reshape(d, (-1, len(d)))
-        matrix = np.zeros((d.shape[0], 2**self.N, 2**self.N))
+        sparse = self._use_sparse_solver(d.shape[0])
 
-        E_param_offset = 0
-        h_param_offset = E_param_offset + self._num_E_params
+        def occupancy(d_chunk):
+            forward, reverse = self._transition_rates(d_chunk, *args)
+            return self._solve_steady_state(forward, reverse, sparse=sparse)[0]
+
+        return self._evaluate_in_chunks(occupancy, d, bytes_per_row=self._bytes_per_dose_row(sparse))
+
+    def E_grid(self, *d_unique) -> np.ndarray:
+        """Return the effect of the drug combination at every combination of the given doses of each drug.
+
+        See ``ParametricSynergyModelND.E_grid()``. Each forward transition rate depends only on the dose of the drug it
+        adds, so the rates are evaluated once per unique dose of each drug and gathered for every combination, rather
+        than evaluated for every combination.
+        """
+        doses_by_drug, indices, shape = self._grid_indices(d_unique)
+        params = self._transform_params_to_fit(self._get_parameters())
+        E_params = params[: self._num_E_params]
+        rate_params = list(params[self._num_E_params :])
+        if not self.fit_gamma:
+            rate_params += [0] * self._num_gamma_params
+
+        # Column k holds the unique doses of drug k, repeated to a common length
+        n_axis = max(doses.size for doses in doses_by_drug)
+        d_axes = np.column_stack([np.resize(doses, n_axis) for doses in doses_by_drug])
+        forward_axes, reverse = self._transition_rates(d_axes, *rate_params)
+        sparse = self._use_sparse_solver(len(indices))
+
+        def occupancy(indices_chunk):
+            forward = forward_axes[indices_chunk, np.arange(self.N)]
+            return self._solve_steady_state(forward, reverse, sparse=sparse)[0]
+
+        occupancies = self._evaluate_in_chunks(occupancy, indices, bytes_per_row=self._bytes_per_dose_row(sparse))
+        return np.reshape(np.dot(occupancies, E_params), shape)
+
+    def _jacobian_no_gamma(self, d, *args):
+        """Jacobian of the MuSyC model assuming gamma == 1."""
+        loggammas = [0] * self._num_gamma_params
+        return self._jacobian_with_gamma(d, *args, *loggammas)[:, : self._topology.gamma.start]
+
+    def _jacobian_with_gamma(self, d, *args):
+        """Jacobian of the MuSyC model with respect to its (log-scaled) fit parameters, shape (len(d), n_parameters).
+
+        The occupancies x solve A(theta) x = b, so by implicit differentiation, x' = -A^-1 (dA/dtheta) x. Rather than
+        solving once per parameter, the effect E = E_params . x is differentiated through the adjoint, solving
+        A^T lambda = E_params once per dose row so that dE/dtheta = -lambda^T (dA/dtheta) x for every parameter.
+        dA/dtheta is never formed: each edge's rates enter A only through the net flux along it (see
+        ``_solve_steady_state()``).
+        """
+        if len(d.shape) == 1:
+            d = np.reshape(d, (-1, len(d)))
+        sparse = self._use_sparse_solver(d.shape[0])
+        bytes_per_row = self._bytes_per_dose_row(sparse, adjoint=True)
+        return self._evaluate_in_chunks(self._jacobian_rows, d, sparse, *args, bytes_per_row=bytes_per_row)
+
+    def _jacobian_rows(self, d, sparse: bool, *args):
+        """Jacobian of the MuSyC model at dose rows d, solving with the sparse solver if sparse is True."""
+        topology = self._topology
+        E_params = np.asarray(args[topology.E], dtype=float)
+        forward, reverse = self._transition_rates(d, *args[topology.h.start :])
+        occupancy, adjoint = self._solve_steady_state(forward, reverse, E_params=E_params, sparse=sparse)
+
+        h = np.exp(np.asarray(args[topology.h], dtype=float))[:, np.newaxis]
+        logC = np.asarray(args[topology.C], dtype=float)[:, np.newaxis]
+        edge_param = topology.edge_param
+        synergy_edge = edge_param >= 0
+        logalpha = np.append(np.asarray(args[topology.alpha], dtype=float), 0)[edge_param]
+        gamma = np.exp(np.append(np.asarray(args[topology.gamma], dtype=float), 0)[edge_param])
+
+        # The flux along each edge is forward * x[lower] - reverse * x[upper], which A . x adds to the upper state and
+        # subtracts from the lower state. So dE/dtheta is minus the sum, over edges, of each flux's derivative times
+        # the adjoint difference across the edge.
+        lower_occupancy = occupancy[:, topology.lower]
+        upper_occupancy = occupancy[:, topology.upper]
+        adjoint_difference = adjoint[:, topology.upper] - adjoint[:, topology.lower]  # type: ignore
+
+        # forward = (r_r * (alpha * d / C)**h)**gamma, so its log-derivative wrt log(alpha) is gamma * h. Edges with no
+        # forward rate (zero dose) contribute nothing.
+        dflux_dlogalpha = adjoint_difference * lower_occupancy * forward * gamma * h
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_potency = logalpha + np.log(d[:, :, np.newaxis]) - logC
+            dflux_dlogh = np.where(forward > 0, dflux_dlogalpha * log_potency, 0)
+            log_forward = gamma * (np.log(self.r_r) + h * log_potency)
+            dflux_dloggamma = adjoint_difference * (
+                np.where(forward > 0, lower_occupancy * forward * log_forward, 0)
+                - upper_occupancy * reverse * gamma * np.log(self.r_r)
+            )
+
+        n_rows = d.shape[0]
+        dE_dlogalpha = np.zeros((n_rows, len(topology.edges)))
+        dE_dlogalpha[:, edge_param[synergy_edge]] = -dflux_dlogalpha[:, synergy_edge]
+        dE_dloggamma = np.zeros((n_rows, len(topology.edges)))
+        dE_dloggamma[:, edge_param[synergy_edge]] = -dflux_dloggamma[:, synergy_edge]
+        dE_dlogh = -np.sum(dflux_dlogh, axis=-1)
+        dE_dlogC = np.sum(dflux_dlogalpha, axis=-1)
+
+        return np.hstack([occupancy, dE_dlogh, dE_dlogC, dE_dlogalpha, dE_dloggamma])
+
+    def _transition_rates(self, d, *args) -> Tuple[np.ndarray, np.ndarray]:
+        """Rates of every transition in the state graph (see ``MuSyCTopology``).
+
+        :return Tuple[np.ndarray, np.ndarray]: ``forward[i, k, e]`` is the rate of adding drug k along its e'th edge at
+            d[i], and ``reverse[k, e]`` is the (dose-independent) rate of removing it
+        """
+        edge_param = self._topology.edge_param
+
+        h_param_offset = 0
         C_param_offset = h_param_offset + self._num_h_params
         alpha_param_offset = C_param_offset + self._num_C_params
         gamma_param_offset = alpha_param_offset + self._num_alpha_params
 
-        E_params = args[E_param_offset:h_param_offset]
-        logh_params = np.asarray(args[h_param_offset:C_param_offset])
-        logC_params = np.asarray(args[C_param_offset:alpha_param_offset])
-        logalpha_params = np.asarray(args[alpha_param_offset:gamma_param_offset])
-        loggamma_params = np.asarray(args[gamma_param_offset:])
-
-        h_params = np.exp(logh_params)
-        C_params = np.exp(logC_params)
-        alpha_params = np.exp(logalpha_params)
-        gamma_params = np.exp(loggamma_params)
-
-        # First do row 0, which corresponds to U
-        # All edges are non-synergistic
-
-        add_drugs, remove_drugs = MuSyC._get_neighbors(0, self.N)
-        # drugnum indicates which drug is added (like drug 0, drug 1, or drug 2 (0-based indexing))
-        # jidx is the matrix column index of the state reached by adding that drug
-        for drugnum, jidx in add_drugs:
-            d_row = d[:, drugnum]
-            h = h_params[drugnum]
-            C = C_params[drugnum]
-            # r1r = self.r * np.float_power(C, h)
-            r = self.r_r / np.float_power(C, h)
-
-            # Transitions away from U due to dose d
-            matrix[:, 0, 0] -= r * np.float_power(d_row, h)
-            # Transitions into U from neighboring states
-            matrix[:, 0, jidx] = self.r_r
-
-        # Loop over all other states/rows (except the last one, since we know An = 1 - (U + A1 + A2 + ...))
-        for idx in range(1, self._num_E_params - 1):
-            add_drugs, remove_drugs = MuSyC._get_neighbors(idx, self.N)
-            for drugnum, jidx in add_drugs:
-                gamma = 1
-                alpha = 1
-                # If the neighbor is not 0, this is a synergy edge
-                if jidx > 0:
-                    edge_idx = self._edge_index[idx][jidx]
-                    gamma = gamma_params[edge_idx]
-                    alpha = alpha_params[edge_idx]
-                d_row = d[:, drugnum]
-                h = h_params[drugnum]
-                C = C_params[drugnum]
-                r = self.r_r / np.float_power(C, h)
-
-                # This state gains from reverse transitions out of jidx
-                matrix[:, idx, jidx] += self.r_r**gamma
-
-                # This state loses from transitions toward jidx
-                matrix[:, idx, idx] -= np.float_power(r * np.float_power(alpha * d_row, h), gamma)
-
-            for drugnum, jidx in remove_drugs:
-                gamma = 1
-                alpha = 1
-                # If the neighbor is not 0, this is a synergy edge
-                if jidx > 0:
-                    edge_idx = self._edge_index[jidx][idx]
-                    gamma = gamma_params[edge_idx]
-                    alpha = alpha_params[edge_idx]
-                d_row = d[:, drugnum]
-                h = h_params[drugnum]
-                C = C_params[drugnum]
-                r = self.r_r / np.float_power(C, h)
-
-                # This state loses from reverse transitions toward jidx
-                matrix[:, idx, idx] -= self.r_r**gamma
-
-                # This state gaines from transitions from jidx
-                matrix[:, idx, jidx] += np.float_power(r * np.float_power(alpha * d_row, h), gamma)
-
-        # The final constraint is that U + A1 + A2 + ... = 1
+        # Edges leaving U are non-synergistic, and use parameter index -1, which maps to the trailing 1 here
+        h = np.exp(np.asarray(args[h_param_offset:C_param_offset]))[:, np.newaxis]
+        C = np.exp(np.asarray(args[C_param_offset:alpha_param_offset]))[:, np.newaxis]
+        alpha = np.append(np.exp(np.asarray(args[alpha_param_offset:gamma_param_offset])), 1)[edge_param]
+        gamma = np.append(np.exp(np.asarray(args[gamma_param_offset:])), 1)[edge_param]
+
+        r = self.r_r / np.float_power(C, h)
+        forward = np.float_power(r * np.float_power(alpha * d[:, :, np.newaxis], h), gamma)
+        reverse = np.float_power(self.r_r, gamma)
+        return forward, reverse
+
+    def _outflow(self, forward: np.ndarray, reverse: np.ndarray) -> np.ndarray:
+        """Total rate of transitions away from each state, shape (len(d), 2**N)."""
+        diagonal_index = self._topology.diagonal_index
+        n_rows = forward.shape[0]
+        reverse_rows = np.broadcast_to(reverse.ravel(), (n_rows, reverse.size))
+        rates = np.concatenate([forward.reshape(n_rows, -1), reverse_rows], axis=1)
+        return rates[:, diagonal_index].sum(axis=-1)
+
+    def _use_sparse_solver(self, n_rows: int) -> bool:
+        """Whether to solve for the equilibrium state with the sparse solver, given the number of dose rows."""
+        if self.solver != "auto":
+            return self.solver == "sparse"
+        if self.N >= _SPARSE_SOLVER_MIN_DRUGS_ALWAYS:
+            return True
+        dense_bytes = n_rows * 4**self.N * np.dtype(float).itemsize
+        return self.N >= _SPARSE_SOLVER_MIN_DRUGS and dense_bytes > self.memory_budget
+
+    def _bytes_per_dose_row(self, sparse: Optional[bool] = None, adjoint: bool = False) -> int:
+        """Approximate bytes of temporary arrays used to solve for the equilibrium state of one dose row.
+
+        :param Optional[bool] sparse: Whether the sparse solver is used (by default, as chosen for a single row)
+        :param bool adjoint: Whether the adjoint system is also solved, as for the Jacobian
+        """
+        if sparse is None:
+            sparse = self._use_sparse_solver(1)
+        itemsize = np.dtype(float).itemsize
+        n_states = self._topology.n_states
+        if sparse:
+            # Each row contributes (N + 1) * 2**N nonzeros, which are assembled as COO triplets, converted to CSC, and
+            # filled in by the factorization
+            return 16 * (self.N + 1) * n_states * itemsize
+        # The stacked transition matrices, and the copy that np.linalg.solve() factorizes, for each system solved
+        return (4 if adjoint else 2) * n_states**2 * itemsize
+
+    def _solve_steady_state(
+        self,
+        forward: np.ndarray,
+        reverse: np.ndarray,
+        E_params: Optional[np.ndarray] = None,
+        sparse: Optional[bool] = None,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Solve for the equilibrium state of every dose row, with the dense or sparse solver (see ``solver``).
+
+        The transition matrix A of each dose row is made of balance equations, except for one row that instead fixes
+        the scale of the occupancies. In the balance equations, A . x is the sum over edges of the net flux along the
+        edge, forward * x[lower] - reverse * x[upper], added to the upper state and subtracted from the lower state.
+
+        :param np.ndarray forward: Forward transition rates (see ``_transition_rates()``)
+        :param np.ndarray reverse: Reverse transition rates
+        :param Optional[np.ndarray] E_params: If given, also solve the adjoint system for these E parameters
+        :param Optional[bool] sparse: Whether to use the sparse solver (by default, chosen by ``_use_sparse_solver()``)
+        :return Tuple[np.ndarray, Optional[np.ndarray]]: The occupancies x, shape (len(d), 2**N), and the adjoint
+            (None unless E_params is given). The adjoint lambda satisfies dE/dtheta = -lambda^T (dA/dtheta) x over
+            the balance equations only, so lambda is zero for the row that fixes the scale.
+        """
+        if sparse is None:
+            sparse = self._use_sparse_solver(forward.shape[0])
+        if sparse:
+            return self._solve_steady_state_sparse(forward, reverse, E_params)
+        return self._solve_steady_state_dense(forward, reverse, E_params)
+
+    def _solve_steady_state_dense(
+        self, forward: np.ndarray, reverse: np.ndarray, E_params: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Solve for the equilibrium state of every dose row by stacking dense (2**N, 2**N) transition matrices."""
+        # `matrix` is the state transition matrix for the MuSyC model
+        # matrix[i, :, :] is the state transition matrix at d[i]
+        # That is to say, the matrix is handled completely numerically, rather than symbolically solving and then
+        # plugging in doses.
+        lower, upper = self._topology.lower, self._topology.upper
+        n_rows = forward.shape[0]
+        n_states = self._topology.n_states
+
+        matrix = np.zeros((n_rows, n_states, n_states), dtype=np.result_type(forward, reverse))
+        # The lower state gains from reverse transitions out of the upper state, and vice versa
+        matrix[:, lower, upper] = reverse
+        matrix[:, upper, lower] = forward
+        # Each state loses from every transition away from it
+        states = np.arange(n_states)
+        matrix[:, states, states] = -self._outflow(forward, reverse)
+
+        # The final constraint is that U + A1 + A2 + ... = 1, replacing the (redundant) balance equation of the last
+        # state. All other rows should multiply to zero.
+        # M . [U A1 A2 ...]^T = [0 0 0 ... 1]^T
         matrix[:, -1, :] = 1
-        matrix_inv = np.linalg.inv(matrix)
+        b = np.zeros((n_rows, n_states, 1))
+        b[:, -1] = 1
+        if E_params is None:
+            return np.linalg.solve(matrix, b)[..., 0], None
+
+        # Solve the forward and adjoint systems A x = b and A^T lambda = E_params in one batch
+        matrix = np.concatenate([matrix, np.swapaxes(matrix, 1, 2)])
+        b = np.concatenate([b, np.broadcast_to(np.reshape(E_params, (1, -1, 1)), b.shape)])
+        solution = np.linalg.solve(matrix, b)[..., 0]
+        occupancy, adjoint = solution[:n_rows], solution[n_rows:]
+        adjoint[:, -1] = 0
+        return occupancy, adjoint
+
+    def _solve_steady_state_sparse(
+        self, forward: np.ndarray, reverse: np.ndarray, E_params: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Solve for the equilibrium state of every dose row with one sparse factorization.
+
+        The state graph is a hypercube with N * 2**(N-1) edges, so each transition matrix has only (N + 1) * 2**N
+        nonzeros. The matrices of all dose rows are assembled into one block-diagonal sparse matrix. Rather than a
+        dense sum constraint (which would fill in the factorization), the balance equation of one state per row is
+        replaced by fixing that state's (unnormalized) occupancy to 1, and occupancies are normalized afterwards. The
+        fixed state is the one that would be most occupied if the drugs acted independently, so that the unnormalized
+        occupancies stay within floating point range.
+
+        The adjoint system reuses the same factorization. With unnormalized occupancies y and x = y / sum(y), the
+        derivative of E = E_params . x is -lambda^T (dA/dtheta) x with A^T lambda = E_params - E for each dose row.
+        """
+        lower, upper = self._topology.lower, self._topology.upper
+        n_rows = forward.shape[0]
+        n_states = self._topology.n_states
+        n_edges = lower.size
+        states = np.arange(n_states)
+
+        rows = np.concatenate([lower.ravel(), upper.ravel(), states])
+        cols = np.concatenate([upper.ravel(), lower.ravel(), states])
+        values = np.concatenate(
+            [
+                np.broadcast_to(reverse.ravel(), (n_rows, n_edges)),
+                forward.reshape(n_rows, n_edges),
+                -self._outflow(forward, reverse),
+            ],
+            axis=1,
+        )
 
-        # M . [U A1 A2 ...]^T = [0 0 0 ... 1]^T
-        # [U A1 A2 ...]^T = M^-1 . [0 0 0 ... 1]^T
-        # [E0 E1 E2 ...] . [U A1 A2 ...] = E
-        # All other rows should multiply to zero. Only the last row goes to 1.
-        b = np.zeros(2**self.N)
-        b[-1] = 1
-        return np.dot(np.dot(matrix_inv, b), np.asarray(E_params))
+        # forward[:, k, 0] and reverse[k, 0] are the rates of adding and removing drug k alone
+        fixed = np.sum((np.real(forward[:, :, 0]) > np.real(reverse[:, 0])) << np.arange(self.N), axis=1)
+        fixed_row = rows == fixed[:, np.newaxis]
+        values[fixed_row] = 0
+        values[fixed_row & (cols == fixed[:, np.newaxis])] = 1
+
+        offset = (np.arange(n_rows) * n_states)[:, np.newaxis]
+        matrix = sparse.csc_matrix(
+            (values.ravel(), ((rows + offset).ravel(), (cols + offset).ravel())),
+            shape=(n_rows * n_states, n_rows * n_states),
+        )
+        matrix.eliminate_zeros()
+        b = np.zeros((n_rows, n_states))
+        b[np.arange(n_rows), fixed] = 1
+
+        factors = splu(matrix, permc_spec="MMD_AT_PLUS_A")
+        occupancy = factors.solve(b.ravel()).reshape(n_rows, n_states)
+        occupancy /= np.sum(occupancy, axis=1, keepdims=True)
+        if E_params is None:
+            return occupancy, None
+
+        residual = E_params - np.dot(occupancy, E_params)[:, np.newaxis]
+        adjoint = factors.solve(residual.ravel(), trans="T").reshape(n_rows, n_states)
+        adjoint[np.arange(n_rows), fixed] = 0
+        return occupancy, adjoint
 
     @staticmethod
     def _get_drug_string_from_state(state: Sequence[int]) -> str:
@@ -480,11 +819,9 @@ class MuSyC(ParametricSynergyModelND):
             raise ModelNotParameterizedError("Cannot calculate beta if model is not specified.")
 
         parameters = [self.get_parameters()[param] for param in self._parameter_names]
-        state_count = 2**self.N
         beta = {}
-        for i in range(state_count):
+        for i, drug_string in enumerate(self._topology.state_names):
             state = MuSyC._idx_to_state(i, self.N)
-            drug_string = MuSyC._get_drug_string_from_state(state)
             value = MuSyC._get_beta(parameters, state)
             if not np.isnan(value):
                 beta[f"beta_{drug_string}"] = value
@@ -581,7 +918,9 @@ class MuSyC(ParametricSynergyModelND):
 
         return self._model(d, *self._transform_params_to_fit(parameters_list))
 
-    def get_confidence_intervals(self, confidence_interval: float = 95) -> Dict[str, Tuple[float, float]]:
+    def get_confidence_intervals(
+        self, confidence_interval: float = 95, ci_method: Optional[str] = None
+    ) -> Dict[str, Tuple[float, float]]:
         """Returns the lower bound and upper bound estimate for each parameter.
 
         This also calculates confidence intervals for beta, which is derived from the E parameters.
@@ -591,26 +930,33 @@ class MuSyC(ParametricSynergyModelND):
         confidence_interval : float, default=95
             % confidence interval to return. Must be between 0 and 100.
 
+        ci_method : str, optional
+            "bootstrap", "covariance", or "profile". By default, bootstrap intervals are used if available. beta is
+            not a fit parameter, so with "covariance" or "profile" its intervals are calculated by the delta method
+            (propagating the parameter covariance), rather than from a profile likelihood.
+
         Return
         ------
         Dict[str, Tuple[float, float]]
             A dictionary of parameter names to a tuple of the lower and upper bounds of the confidence interval.
         """
-        ci = super().get_confidence_intervals(confidence_interval=confidence_interval)
-
-        if self.bootstrap_parameters is None:
-            return ci
+        ci = super().get_confidence_intervals(confidence_interval=confidence_interval, ci_method=ci_method)
+        ci_method = ParametricModelMixins.get_ci_method(self, ci_method)
 
         lb = (100 - confidence_interval) / 2.0
         ub = 100 - lb
 
-        for i in range(self._num_E_params):
+        for i, drug_string in enumerate(self._topology.state_names):
             state = MuSyC._idx_to_state(i, self.N)
             if state.count(1) < 2:  # beta is only defined for states associated with 2 or more drugs
                 continue
-            bootstrap_beta = MuSyC._get_beta(self.bootstrap_parameters.transpose(), state)
-            drug_string = MuSyC._get_drug_string_from_state(state)
-            ci[f"beta_{drug_string}"] = np.percentile(bootstrap_beta, [lb, ub])
+            if ci_method != "bootstrap":
+                ci[f"beta_{drug_string}"] = ParametricModelMixins.delta_method_interval(
+                    self, lambda parameters: MuSyC._get_beta(parameters, state), confidence_interval
+                )
+            else:
+                bootstrap_beta = MuSyC._get_beta(np.transpose(self.bootstrap_parameters), state)
+                ci[f"beta_{drug_string}"] = np.percentile(bootstrap_beta, [lb, ub])
         return ci
 
     def summarize(self, confidence_interval: float = 95, tol: float = 0.01):
@@ -618,18 +964,17 @@ class MuSyC(ParametricSynergyModelND):
 
         header = ["Parameter", "Value", "Comparison", "Synergy"]
         ci: Dict[str, Tuple[float, float]] = {}
-        if self.bootstrap_parameters is not None:
+        if self.bootstrap_parameters is not None or self.parameter_covariance is not None:
             ci = self.get_confidence_intervals(confidence_interval=confidence_interval)
             header.insert(2, f"{confidence_interval:0.3g}% CI")
 
         rows = [header]
 
         # beta
-        for idx in range(self._num_E_params):
+        for idx, drug_string in enumerate(self._topology.state_names):
             state = MuSyC._idx_to_state(idx, self.N)
             if state.count(1) < 2:
                 continue
-            drug_string = MuSyC._get_drug_string_from_state(state)
             beta = MuSyC._get_beta(list(pars.values()), state)
             rows.append(
                 ParametricModelMixins.make_summary_row(
@@ -21,6 +21,7 @@ from synergy.exceptions import InvalidDrugModelError
 from synergy.higher.synergy_model_Nd import DoseDependentSynergyModelND
 from synergy.single.dose_response_model_1d import DoseResponseModel1D
 from synergy.single.hill import Hill
+from synergy.utils import backend
 
 
 class Schindler(DoseDependentSynergyModelND):
@@ -61,6 +62,10 @@ class Schindler(DoseDependentSynergyModelND):
         C = np.asarray([model.C for model in self.single_drug_models])  # len == N
         Emax = E0 - np.asarray([model.Emax for model in self.single_drug_models])  # len == N
 
+        kernels = backend.numba_kernels((d,), (*h, *C, *Emax), ndim=2)
+        if kernels is not None:
+            return kernels.schindler_nd(d, Emax, h, C)
+
         m = d / C  # shape == (n_points, N)
         msum = m.sum(axis=1)  # len == n_points
 
@@ -3,7 +3,7 @@
 import logging
 from abc import ABC, abstractmethod
 from copy import deepcopy
-from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 import numpy as np
 from scipy.optimize import curve_fit
@@ -12,10 +12,18 @@ from synergy import utils
 from synergy.exceptions import ModelNotFitToDataError, ModelNotParameterizedError
 from synergy.single.dose_response_model_1d import DoseResponseModel1D
 from synergy.utils import dose_utils
-from synergy.utils.model_mixins import ParametricModelMixins
+from synergy.utils.model_mixins import (
+    CI_METHODS,
+    BootstrapStatus,
+    ParametricModelMixins,
+    ProfileLikelihood,
+)
 
 _LOGGER = logging.Logger(__name__)
 
+# Default for SynergyModelND.memory_budget (256 MiB)
+DEFAULT_MEMORY_BUDGET = 2**28
+
 
 class SynergyModelND(ABC):
     """Base class for all N-drug synergy models (N > 2).
@@ -23,6 +31,11 @@ class SynergyModelND(ABC):
     :param Sequence[DoseResponseModel1D] single_drug_models: Single drug models for each drug
     """
 
+    #: Approximate number of bytes of temporary arrays to allocate when evaluating the model at many dose rows. Larger
+    #: dose matrices are evaluated in chunks of rows, so memory use does not grow with the number of rows. Set it on a
+    #: model (or subclass) to trade memory for fewer, larger vectorized evaluations.
+    memory_budget: int = DEFAULT_MEMORY_BUDGET
+
     def __init__(self, single_drug_models: Optional[Sequence] = None):
         """Ctor."""
         self._is_fit = False
@@ -45,6 +58,36 @@ class SynergyModelND(ABC):
             ]
             self.N = len(self.single_drug_models)
 
+    def _bytes_per_dose_row(self) -> int:
+        """Approximate bytes of temporary arrays used to evaluate the model at one dose row."""
+        return 8 * max(self.N, 1) * np.dtype(float).itemsize
+
+    def _evaluate_in_chunks(self, function: Callable, d, *args, bytes_per_row: Optional[int] = None):
+        """Evaluate function(d, *args) over chunks of the rows of d, so that temporaries stay within memory_budget.
+
+        Each chunk's values are written into one preallocated output, whose first axis corresponds to the rows of d.
+
+        :param Callable function: Function of the dose rows, returning an array with one row per dose row
+        :param d: Dose rows, shape (n_rows, ...)
+        :param args: Further arguments of function
+        :param Optional[int] bytes_per_row: Temporary memory function uses per dose row (_bytes_per_dose_row() by
+            default)
+        :return: function(d, *args)
+        """
+        if bytes_per_row is None:
+            bytes_per_row = self._bytes_per_dose_row()
+        chunk_size = max(1, self.memory_budget // bytes_per_row)
+        if np.ndim(d) < 2 or len(d) <= chunk_size:
+            return function(d, *args)
+
+        out = None
+        for start in range(0, len(d), chunk_size):
+            values = np.asarray(function(d[start : start + chunk_size], *args))
+            if out is None:
+                out = np.empty((len(d), *values.shape[1:]), dtype=values.dtype)
+            out[start : start + len(values)] = values
+        return out
+
     @abstractmethod
     def fit(self, d, E, **kwargs):
         """Fit the model to data.
@@ -61,6 +104,55 @@ class SynergyModelND(ABC):
             Number of bootstrap iterations to perform to estimate confidence intervals. If 0, no bootstrapping is
             performed.
 
+        n_jobs : int, default=1
+            Number of workers used to run bootstrap iterations. If -1, one worker is used per CPU.
+
+        executor : str or concurrent.futures.Executor, default="process"
+            "process" or "thread" to choose the kind of worker pool used when n_jobs != 1, or an existing executor.
+
+        seed : int or np.random.SeedSequence, optional
+            Seed for bootstrap resampling. Results are identical for a given seed regardless of n_jobs.
+
+        bootstrap_tol : float, optional
+            If given, bootstrapping stops once no confidence interval bound changes by more than this fraction of the
+            interval's width over bootstrap_window iterations. bootstrap_iterations is then an upper limit.
+
+        bootstrap_window : int, default=50
+            Number of bootstrap iterations between checks for stable confidence intervals.
+
+        bootstrap_confidence_interval : float, default=95
+            % confidence interval whose stability is checked when bootstrap_tol is given.
+
+        bootstrap_timeout : float, optional
+            Maximum wall-clock time in seconds to spend bootstrapping. Iterations that converged in time are kept.
+
+        bootstrap_max_nfev : int, optional
+            Maximum number of model evaluations to spend bootstrapping. Iterations that converged in time are kept.
+
+        bootstrap_fail_fast : bool, default=True
+            If True, stop bootstrapping once so many iterations have failed that bootstrap_iterations are unlikely to
+            converge within max_iterations. The model's bootstrap_status records why bootstrapping stopped.
+
+        ci_method : str, default="bootstrap"
+            If "covariance", also estimate the parameter covariance from the Jacobian at the optimum, which allows
+            get_confidence_intervals() to return asymptotic confidence intervals without bootstrapping. If "profile",
+            also calculate the profile likelihood of each parameter (in parallel, using n_jobs and executor), which
+            gives better intervals for parameters with asymmetric or bounded uncertainty. For MuSyC, intervals of beta
+            (which is derived from the E parameters) are calculated by the delta method with either method.
+
+        profile_confidence_interval : float, default=99
+            Largest % confidence interval that profile likelihoods are calculated to cover.
+
+        profile_max_steps : int, default=30
+            Maximum number of steps each profile likelihood takes on either side of the optimum. If a profile stops
+            before crossing the threshold for profile_confidence_interval, a warning is logged and its intervals are
+            nan on that side.
+
+        variable_projection : bool, default=False
+            If True, parameters that enter the model linearly (such as MuSyC's E parameters) are solved by (bounded)
+            linear least squares inside each iteration, so only the remaining parameters are optimized. Only
+            supported by models that override _linear_parameter_indices, such as MuSyC.
+
         kwargs
             Optional parameters to pass to scipy.optimize.curve_fit().
         """
@@ -180,7 +272,7 @@ class DoseDependentSynergyModelND(SynergyModelND):
             raise ModelNotParameterizedError("The model failed to fit")
 
         self._is_fit = True
-        self.reference = self.E_reference(d)
+        self.reference = self._evaluate_in_chunks(self.E_reference, d)
         self.synergy = self._get_synergy(d, E)
 
         return self.synergy
@@ -214,6 +306,13 @@ class DoseDependentSynergyModelND(SynergyModelND):
 class ParametricSynergyModelND(SynergyModelND):
     """Base model for N-drug synergy models (N > 2) that are parametric."""
 
+    # N-drug models do not yet implement _fit_batch()
+    _batch_fit_supported = False
+
+    # True if fit_function evaluates large dose matrices in chunks itself (e.g., choosing how to evaluate them from the
+    # total number of rows first), so E() passes it every row at once rather than chunking them again
+    _fit_function_chunks_doses = False
+
     def __init__(
         self,
         single_drug_models: Optional[Sequence[DoseResponseModel1D]] = None,
@@ -240,16 +339,29 @@ class ParametricSynergyModelND(SynergyModelND):
         super().__init__(single_drug_models=single_drug_models)
 
         self.fit_function: Callable
-        self.jacobian_function: Optional[Callable] = None  # Currently no jacobian for any N-drug models
+        self.jacobian_function: Optional[Callable] = None  # Set by models that have an analytic Jacobian
 
         self._converged: bool = False
         self._is_fit: bool = False
+        self._variable_projection: bool = False
 
         self.sum_of_squares_residuals: Optional[float]
         self.r_squared: Optional[float]
         self.aic: Optional[float]
         self.bic: Optional[float]
         self.bootstrap_parameters = None
+        self.bootstrap_status: Optional[BootstrapStatus] = None
+        self.parameter_covariance: Optional[np.ndarray] = None
+        self.parameter_profiles: Optional[ProfileLikelihood] = None
+
+    @property
+    def _linear_parameter_indices(self) -> Optional[Sequence[int]]:
+        """Fit-space indices of parameters that enter the model linearly, for variable projection.
+
+        None if the model does not support variable projection. Models that do must also define
+        _design_matrix(xdata, *nonlinear_params), returning (A, offset).
+        """
+        return None
 
     def E(self, d):
         """Return the effect of the drug combination at doses d.
@@ -268,7 +380,42 @@ class ParametricSynergyModelND(SynergyModelND):
             return ModelNotParameterizedError()
 
         params = self._transform_params_to_fit(self._get_parameters())
-        return self.fit_function(d, *params)
+        if self._fit_function_chunks_doses:
+            return self.fit_function(d, *params)
+        return self._evaluate_in_chunks(self.fit_function, d, *params)
+
+    def E_grid(self, *d_unique) -> np.ndarray:
+        """Return the effect of the drug combination at every combination of the given doses of each drug.
+
+        Equivalent to ``E(d)``, where the rows of d are the combinations of doses ordered as
+        ``np.meshgrid(*d_unique)`` (as in ``dose_utils.make_dose_grid_multi()``). Models may evaluate terms that
+        depend on the dose of only one drug once per unique dose rather than once per combination.
+
+        :param ArrayLike d_unique: Doses of each drug, one 1D array per drug
+        :return np.ndarray: The effect at each combination of doses, with the shape of ``np.meshgrid(*d_unique)``
+        """
+        doses_by_drug, indices, shape = self._grid_indices(d_unique)
+        d = np.column_stack([doses[index] for doses, index in zip(doses_by_drug, indices.T)])
+        return np.reshape(self.E(d), shape)
+
+    def _grid_indices(self, d_unique: Sequence) -> Tuple[List[np.ndarray], np.ndarray, Tuple[int, ...]]:
+        """Validate the doses passed to E_grid(), and index the combinations of them.
+
+        :param Sequence d_unique: Doses of each drug
+        :return Tuple[List[np.ndarray], np.ndarray, Tuple[int, ...]]: The doses of each drug as float arrays, the index
+            into them of every combination's dose of each drug (shape (n_combinations, N)), and the grid's shape
+        """
+        if len(d_unique) != self.N:
+            raise ValueError(f"Expected doses of {self.N} drugs, but got {len(d_unique)}")
+        d_unique = [np.asarray(doses, dtype=float) for doses in d_unique]
+        if any(doses.ndim != 1 for doses in d_unique):
+            raise ValueError("The doses of each drug must be 1D arrays")
+        if not self.is_specified:
+            raise ModelNotParameterizedError()
+
+        index_grids = np.meshgrid(*[np.arange(doses.size) for doses in d_unique])
+        indices = np.column_stack([grid.ravel() for grid in index_grids])
+        return d_unique, indices, index_grids[0].shape
 
     def get_parameters(self) -> Dict[str, Any]:
         """Return the model's parameter values keyed by parameter names."""
@@ -292,9 +439,20 @@ class ParametricSynergyModelND(SynergyModelND):
         E = np.asarray(E)
 
         # Parse optional kwargs
-        use_jacobian = kwargs.pop("use_jacobian", True if self.jacobian_function is not None else False)
+        use_jacobian = ParametricModelMixins.pop_use_jacobian(self, kwargs)
         bootstrap_iterations = kwargs.pop("bootstrap_iterations", 0)
         max_iterations = kwargs.pop("max_iterations", 10000)
+        bootstrap_kwargs = ParametricModelMixins.pop_bootstrap_kwargs(kwargs)
+        ci_method = kwargs.pop("ci_method", "bootstrap")
+        if ci_method not in CI_METHODS:
+            raise ValueError(f"ci_method must be one of {CI_METHODS} ({ci_method})")
+        profile_confidence_interval = kwargs.pop("profile_confidence_interval", 99)
+        profile_max_steps = kwargs.pop("profile_max_steps", 30)
+        self._variable_projection = kwargs.pop("variable_projection", False)
+        if self._variable_projection and self._linear_parameter_indices is None:
+            raise ValueError(f"{type(self).__name__} does not support variable_projection")
+        self.parameter_covariance = None
+        self.parameter_profiles = None
         p0 = kwargs.pop("p0", None)
         if p0 is not None:
             p0 = list(p0)
@@ -326,12 +484,28 @@ class ParametricSynergyModelND(SynergyModelND):
             n_samples = d.shape[0]
         if n_samples - n_parameters - 1 > 0:  # TODO: What is this watching out for?
             self._score(d, E)
+            if ci_method in ("covariance", "profile"):
+                self.parameter_covariance = ParametricModelMixins.parameter_covariance(self, d, E, use_jacobian)
+            if ci_method == "profile":
+                ParametricModelMixins.profile_likelihood(
+                    self,
+                    d,
+                    E,
+                    use_jacobian,
+                    profile_confidence_interval,
+                    n_jobs=bootstrap_kwargs.get("n_jobs", 1),
+                    executor=bootstrap_kwargs.get("executor", "process"),
+                    max_steps=profile_max_steps,
+                    **kwargs,
+                )
             kwargs["p0"] = self._transform_params_to_fit(popt)
             ParametricModelMixins.bootstrap_parameter_ranges(
-                self, E, use_jacobian, bootstrap_iterations, max_iterations, d, **kwargs
+                self, E, use_jacobian, bootstrap_iterations, max_iterations, d, **bootstrap_kwargs, **kwargs
             )
 
-    def get_confidence_intervals(self, confidence_interval: float = 95) -> Dict[str, Tuple[float, float]]:
+    def get_confidence_intervals(
+        self, confidence_interval: float = 95, ci_method: Optional[str] = None
+    ) -> Dict[str, Tuple[float, float]]:
         """Returns the lower bound and upper bound estimate for each parameter.
 
         Parameters
@@ -339,6 +513,11 @@ class ParametricSynergyModelND(SynergyModelND):
         confidence_interval : float, default=95
             % confidence interval to return. Must be between 0 and 100.
 
+        ci_method : str, optional
+            "bootstrap" to use percentiles of bootstrap_parameters, "covariance" to use asymptotic intervals from
+            the parameter covariance at the optimum, or "profile" to use profile likelihood intervals. By default,
+            bootstrap intervals are used if available, then profile intervals.
+
         Return
         ------
         Dict[str, Tuple[float, float]]: The confidence interval for each parameter.
@@ -349,14 +528,16 @@ class ParametricSynergyModelND(SynergyModelND):
             raise ModelNotFitToDataError()
         if confidence_interval < 0 or confidence_interval > 100:
             raise ValueError(f"confidence_interval must be between 0 and 100 ({confidence_interval})")
-        if self.bootstrap_parameters is None:
-            raise ValueError(
-                "Model must have been fit with bootstrap_iterations > 0 to get parameter confidence intervals"
-            )
+        ci_method = ParametricModelMixins.get_ci_method(self, ci_method)
 
-        lb = (100 - confidence_interval) / 2.0
-        ub = 100 - lb
-        intervals = np.percentile(self.bootstrap_parameters, [lb, ub], axis=0).transpose()
+        if ci_method == "covariance":
+            intervals = ParametricModelMixins.covariance_confidence_intervals(self, confidence_interval)
+        elif ci_method == "profile":
+            intervals = ParametricModelMixins.profile_confidence_intervals(self, confidence_interval)
+        else:
+            lb = (100 - confidence_interval) / 2.0
+            ub = 100 - lb
+            intervals = np.percentile(self.bootstrap_parameters, [lb, ub], axis=0).transpose()
         return dict(zip(self._parameter_names, intervals))
 
     def _get_initial_guess(self, d, E, p0):
@@ -383,19 +564,22 @@ class ParametricSynergyModelND(SynergyModelND):
         """Return parameter values as a list."""
         return [self.__getattribute__(param) for param in self._parameter_names]
 
-    def _fit(self, d, E, use_jacobian: bool, **kwargs):
+    def _fit(self, d, E, use_jacobian: Union[bool, str], **kwargs):
         """Fit the model to data (d, E)"""
-        jac = self.jacobian_function if use_jacobian else None
+        jac = ParametricModelMixins.get_jacobian_function(self, use_jacobian)
         if use_jacobian and jac is None:
             _LOGGER.warning(f"No jacobian function is specified for {type(self).__name__}, ignoring `use_jacobian`.")
-        popt = curve_fit(
-            self.fit_function,
-            d,
-            E,
-            bounds=self._bounds,
-            jac=jac,
-            **kwargs,
-        )[0]
+        if self._variable_projection:
+            popt = ParametricModelMixins.variable_projection_fit(self, d, E, use_jacobian, **kwargs)
+        else:
+            popt = curve_fit(
+                self.fit_function,
+                d,
+                E,
+                bounds=self._bounds,
+                jac=jac,
+                **kwargs,
+            )[0]
 
         if np.isnan(popt).any():
             return None
@@ -1,6 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from scipy.optimize import curve_fit
@@ -8,7 +8,14 @@ from scipy.stats import norm
 
 from synergy import utils
 from synergy.exceptions import ModelNotFitToDataError, ModelNotParameterizedError
-from synergy.utils.model_mixins import ParametricModelMixins
+from synergy.utils.model_mixins import (
+    CI_METHODS,
+    BootstrapStatus,
+    FitContext,
+    ParametricModelMixins,
+    ProfileLikelihood,
+)
+from synergy.utils.optimize import batch_curve_fit
 
 _LOGGER = logging.Logger(__name__)
 
@@ -55,13 +62,21 @@ class DoseResponseModel1D(ABC):
 class ParametricDoseResponseModel1D(DoseResponseModel1D):
     """Base class for parametric dose-response models."""
 
+    # True if fit_function and jacobian_function broadcast over parameters passed as arrays of shape (B, 1)
+    _batch_fit_supported = False
+
     def __init__(self, **kwargs):
         """Ctor."""
         self.fit_function: Callable
         self.jacobian_function: Callable
+        self._bounds: Tuple[List[float], List[float]]
 
         self._converged: bool = False
         self._is_fit: bool = False
+        self._variable_projection: bool = False
+
+        # Dose-derived arrays of the current fit, passed to fit_function and jacobian_function as xdata
+        self._fit_context: Optional[FitContext] = None
 
         ParametricModelMixins.set_init_parameters(self, self._parameter_names, **kwargs)
         ParametricModelMixins.set_bounds(
@@ -73,6 +88,18 @@ class ParametricDoseResponseModel1D(DoseResponseModel1D):
         self.aic: Optional[float]
         self.bic: Optional[float]
         self.bootstrap_parameters = None
+        self.bootstrap_status: Optional[BootstrapStatus] = None
+        self.parameter_covariance: Optional[np.ndarray] = None
+        self.parameter_profiles: Optional[ProfileLikelihood] = None
+
+    @property
+    def _linear_parameter_indices(self) -> Optional[List[int]]:
+        """Fit-space indices of parameters that enter the model linearly, for variable projection.
+
+        None if the model does not support variable projection. Models that do must also define
+        _design_matrix(d, *nonlinear_params), returning (A, offset).
+        """
+        return None
 
     def get_parameters(self) -> Dict[str, Any]:
         """Returns model's parameters"""
@@ -109,6 +136,62 @@ class ParametricDoseResponseModel1D(DoseResponseModel1D):
             Number of bootstrap iterations to perform to estimate confidence intervals. If 0, no bootstrapping is
             performed.
 
+        n_jobs : int, default=1
+            Number of workers used to run bootstrap iterations. If -1, one worker is used per CPU.
+
+        executor : str or concurrent.futures.Executor, default="process"
+            "process" or "thread" to choose the kind of worker pool used when n_jobs != 1, or an existing executor.
+
+        seed : int or np.random.SeedSequence, optional
+            Seed for bootstrap resampling. Results are identical for a given seed regardless of n_jobs.
+
+        bootstrap_solver : str, default="curve_fit"
+            "curve_fit" refits each bootstrap iteration separately. "batch" refits all iterations assigned to a worker
+            at once with a vectorized Levenberg-Marquardt solver, which is much faster for many iterations.
+
+        bootstrap_tol : float, optional
+            If given, bootstrapping stops once no confidence interval bound changes by more than this fraction of the
+            interval's width over bootstrap_window iterations. bootstrap_iterations is then an upper limit.
+
+        bootstrap_window : int, default=50
+            Number of bootstrap iterations between checks for stable confidence intervals.
+
+        bootstrap_confidence_interval : float, default=95
+            % confidence interval whose stability is checked when bootstrap_tol is given.
+
+        bootstrap_timeout : float, optional
+            Maximum wall-clock time in seconds to spend bootstrapping. Iterations that converged in time are kept.
+
+        bootstrap_max_nfev : int, optional
+            Maximum number of model evaluations to spend bootstrapping. Iterations that converged in time are kept.
+
+        bootstrap_fail_fast : bool, default=True
+            If True, stop bootstrapping once so many iterations have failed that bootstrap_iterations are unlikely to
+            converge within max_iterations. The model's bootstrap_status records why bootstrapping stopped.
+
+        ci_method : str, default="bootstrap"
+            If "covariance", also estimate the parameter covariance from the Jacobian at the optimum, which allows
+            get_confidence_intervals() to return asymptotic confidence intervals without bootstrapping. If "profile",
+            also calculate the profile likelihood of each parameter (in parallel, using n_jobs and executor), which
+            gives better intervals for parameters with asymmetric or bounded uncertainty.
+
+        profile_confidence_interval : float, default=99
+            Largest % confidence interval that profile likelihoods are calculated to cover.
+
+        profile_max_steps : int, default=30
+            Maximum number of steps each profile likelihood takes on either side of the optimum. If a profile stops
+            before crossing the threshold for profile_confidence_interval, a warning is logged and its intervals are
+            nan on that side.
+
+        variable_projection : bool, default=False
+            If True, parameters that enter the model linearly (such as E0 and Emax of Hill) are solved by (bounded)
+            linear least squares inside each iteration, so only the remaining parameters (log h and log C) are
+            optimized. Only supported by models that override _linear_parameter_indices.
+
+        use_jacobian : bool or str, optional
+            Whether to use the model's Jacobian when fitting (by default, if it has one). If "auto", models without an
+            analytic Jacobian use a complex-step Jacobian (see synergy.utils.differentiation).
+
         kwargs
             kwargs to pass to scipy.optimize.curve_fit()
         """
@@ -117,9 +200,20 @@ class ParametricDoseResponseModel1D(DoseResponseModel1D):
         E = np.asarray(E)
 
         # Parse optional kwargs
-        use_jacobian = kwargs.pop("use_jacobian", True if self.jacobian_function is not None else False)
+        use_jacobian = ParametricModelMixins.pop_use_jacobian(self, kwargs)
         bootstrap_iterations = kwargs.pop("bootstrap_iterations", 0)
         max_iterations = kwargs.pop("max_iterations", 10000)
+        bootstrap_kwargs = ParametricModelMixins.pop_bootstrap_kwargs(kwargs)
+        ci_method = kwargs.pop("ci_method", "bootstrap")
+        if ci_method not in CI_METHODS:
+            raise ValueError(f"ci_method must be one of {CI_METHODS} ({ci_method})")
+        profile_confidence_interval = kwargs.pop("profile_confidence_interval", 99)
+        profile_max_steps = kwargs.pop("profile_max_steps", 30)
+        self._variable_projection = kwargs.pop("variable_projection", False)
+        if self._variable_projection and self._linear_parameter_indices is None:
+            raise ValueError(f"{type(self).__name__} does not support variable_projection")
+        self.parameter_covariance = None
+        self.parameter_profiles = None
         p0 = kwargs.pop("p0", None)
         if p0 is not None:
             p0 = list(p0)
@@ -130,28 +224,51 @@ class ParametricDoseResponseModel1D(DoseResponseModel1D):
         # Pass bounds and p0 to kwargs for curve_fit()
         kwargs["p0"] = p0
 
-        with np.errstate(divide="ignore", invalid="ignore"):
-            popt = self._fit(d, E, use_jacobian, **kwargs)
-
-        if popt is None:  # curve_fit() failed to fit parameters
-            self._converged = False
-            return
-
-        # otherwise curve_fit() succeeded
-        self._converged = True
-        self._set_parameters(popt)
-
-        n_parameters = len(popt)
-        n_samples = len(d)
-        if n_samples - n_parameters - 1 > 0:  # TODO: What is this watching out for?
-            self._score(d, E)
-            kwargs["p0"] = self._transform_params_to_fit(popt)
-            ParametricModelMixins.bootstrap_parameter_ranges(
-                self, E, use_jacobian, bootstrap_iterations, max_iterations, d, **kwargs
-            )
-            # self._bootstrap_resample(d, E, use_jacobian, bootstrap_iterations, **kwargs)
-
-    def get_confidence_intervals(self, confidence_interval: float = 95) -> Dict[str, Tuple[float, float]]:
+        with ParametricModelMixins.fit_context(self, d):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                popt = self._fit(d, E, use_jacobian, **kwargs)
+
+            if popt is None:  # curve_fit() failed to fit parameters
+                self._converged = False
+                return
+
+            # otherwise curve_fit() succeeded
+            self._converged = True
+            self._set_parameters(popt)
+
+            n_parameters = len(popt)
+            n_samples = len(d)
+            if n_samples - n_parameters - 1 > 0:  # TODO: What is this watching out for?
+                self._score(d, E)
+                if ci_method in ("covariance", "profile"):
+                    self.parameter_covariance = ParametricModelMixins.parameter_covariance(
+                        self, self._fit_context, E, use_jacobian
+                    )
+                if ci_method == "profile":
+                    ParametricModelMixins.profile_likelihood(
+                        self,
+                        self._fit_context,
+                        E,
+                        use_jacobian,
+                        profile_confidence_interval,
+                        n_jobs=bootstrap_kwargs.get("n_jobs", 1),
+                        executor=bootstrap_kwargs.get("executor", "process"),
+                        max_steps=profile_max_steps,
+                        **kwargs,
+                    )
+                kwargs["p0"] = self._transform_params_to_fit(popt)
+                ParametricModelMixins.bootstrap_parameter_ranges(
+                    self, E, use_jacobian, bootstrap_iterations, max_iterations, d, **bootstrap_kwargs, **kwargs
+                )
+                # self._bootstrap_resample(d, E, use_jacobian, bootstrap_iterations, **kwargs)
+
+    def _end_fit(self):
+        """Release the dose-derived arrays of the last fit."""
+        self._fit_context = None
+
+    def get_confidence_intervals(
+        self, confidence_interval: float = 95, ci_method: Optional[str] = None
+    ) -> Dict[str, Tuple[float, float]]:
         """Return the lower bound and upper bound estimate for each parameter, keyed by parameter name.
 
         Parameters
@@ -159,6 +276,11 @@ class ParametricDoseResponseModel1D(DoseResponseModel1D):
         confidence_interval : float, default=95
             % confidence interval to return. Must be between 0 and 100.
 
+        ci_method : str, optional
+            "bootstrap" to use percentiles of bootstrap_parameters, "covariance" to use asymptotic intervals from
+            the parameter covariance at the optimum, or "profile" to use profile likelihood intervals. By default,
+            bootstrap intervals are used if available, then profile intervals.
+
         Return
         ------
         Dict[str, Tuple[float, float]
@@ -170,14 +292,16 @@ class ParametricDoseResponseModel1D(DoseResponseModel1D):
             raise ModelNotFitToDataError()
         if confidence_interval < 0 or confidence_interval > 100:
             raise ValueError(f"confidence_interval must be between 0 and 100 ({confidence_interval})")
-        if self.bootstrap_parameters is None:
-            raise ValueError(
-                "Model must have been fit with bootstrap_iterations > 0 to get parameter confidence intervals"
-            )
-
-        lb = (100 - confidence_interval) / 2.0
-        ub = 100 - lb
-        intervals = np.percentile(self.bootstrap_parameters, [lb, ub], axis=0).transpose()
+        ci_method = ParametricModelMixins.get_ci_method(self, ci_method)
+
+        if ci_method == "covariance":
+            intervals = ParametricModelMixins.covariance_confidence_intervals(self, confidence_interval)
+        elif ci_method == "profile":
+            intervals = ParametricModelMixins.profile_confidence_intervals(self, confidence_interval)
+        else:
+            lb = (100 - confidence_interval) / 2.0
+            ub = 100 - lb
+            intervals = np.percentile(self.bootstrap_parameters, [lb, ub], axis=0).transpose()
         return dict(zip(self._parameter_names, intervals))
 
     def _get_initial_guess(self, d, E, p0):
@@ -200,24 +324,47 @@ class ParametricDoseResponseModel1D(DoseResponseModel1D):
         """
         return params
 
-    def _fit(self, d, E, use_jacobian: bool, **kwargs):
+    def _get_fit_context(self, d) -> FitContext:
+        """Return the context created by fit() for doses d, or a new one if _fit() was called with other doses."""
+        if self._fit_context is not None and self._fit_context.is_for(d):
+            return self._fit_context
+        return FitContext(d)
+
+    def _fit(self, d, E, use_jacobian: Union[bool, str], **kwargs):
         """Fit the model to data (d, E)"""
-        jac = self.jacobian_function if use_jacobian else None
+        jac = ParametricModelMixins.get_jacobian_function(self, use_jacobian)
         if use_jacobian and jac is None:
             _LOGGER.warning(f"No jacobian function is specified for {type(self).__name__}, ignoring `use_jacobian`.")
-        popt = curve_fit(
-            self.fit_function,
-            d,
-            E,
-            bounds=self._bounds,
-            jac=jac,
-            **kwargs,
-        )[0]
+        xdata = self._get_fit_context(d)
+        if self._variable_projection:
+            popt = ParametricModelMixins.variable_projection_fit(self, xdata, E, use_jacobian, **kwargs)
+        else:
+            popt = curve_fit(
+                self.fit_function,
+                xdata,
+                E,
+                bounds=self._bounds,
+                jac=jac,
+                **kwargs,
+            )[0]
 
         if True in np.isnan(popt):
             return None
         return self._transform_params_from_fit(popt)
 
+    def _fit_batch(self, d, E, use_jacobian: Union[bool, str], **kwargs):
+        """Fit the model to each row of E simultaneously.
+
+        :param ArrayLike d: Doses
+        :param ArrayLike E: Observed effects at doses d for each of B datasets, shape (B, len(d))
+        :param Union[bool, str] use_jacobian: Whether to use the jacobian when fitting, or "auto"
+        :param kwargs: p0 and solver options passed to ``synergy.utils.optimize.batch_curve_fit()``
+        :return np.ndarray: Fit parameters for each dataset, shape (B, n_parameters). Rows that failed are nan.
+        """
+        jac = ParametricModelMixins.get_jacobian_function(self, use_jacobian)
+        popt, _ = batch_curve_fit(self.fit_function, d, E, kwargs.pop("p0"), self._bounds, jac=jac, **kwargs)
+        return np.column_stack(self._transform_params_from_fit(popt.T))
+
     def _score(self, d, E):
         """Calculate goodness of fit and model quality scores
 
@@ -13,13 +13,22 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import Dict, List, Tuple
+import copy
+import warnings
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 from scipy.stats import linregress
 
+from synergy import utils
 from synergy.exceptions import ModelNotParameterizedError
 from synergy.single.dose_response_model_1d import ParametricDoseResponseModel1D
+from synergy.utils import backend
+from synergy.utils.model_mixins import FitContext
+from synergy.utils.optimize import (
+    batch_finite_difference_jacobian,
+    batch_levenberg_marquardt,
+)
 
 
 class Hill(ParametricDoseResponseModel1D):
@@ -31,6 +40,8 @@ class Hill(ParametricDoseResponseModel1D):
     This is the base model for Hill_2P and Hill_CI.
     """
 
+    _batch_fit_supported = True
+
     def __init__(self, **kwargs):
         """Ctor."""
         # To minimize risk of overflow or floating-point precision issues, we linearly scale
@@ -63,6 +74,17 @@ class Hill(ParametricDoseResponseModel1D):
     def _default_fit_bounds(self) -> Dict[str, Tuple[float, float]]:
         return {"h": (0.0, np.inf), "C": (0.0, np.inf)}
 
+    @property
+    def _linear_parameter_indices(self) -> Optional[List[int]]:
+        """E0 and Emax enter the model linearly."""
+        return [0, 1]
+
+    def _design_matrix(self, d, logh, logC):
+        """Weights of E0 and Emax in the Hill equation, for variable projection."""
+        dh = np.float_power(FitContext.of(d).doses, np.exp(logh))
+        occupancy = dh / (np.exp(logC * np.exp(logh)) + dh)
+        return np.column_stack([1 - occupancy, occupancy]), 0
+
     def _set_dose_scale(self, d):
         """Find the scaling factor that will normalize the dose scale to be log-centered around 0.
 
@@ -93,17 +115,110 @@ class Hill(ParametricDoseResponseModel1D):
             d / self._dose_scale, E, use_jacobian=use_jacobian, bootstrap_iterations=bootstrap_iterations, **kwargs
         )
 
+    @classmethod
+    def fit_many(cls, d, E, groups, use_jacobian: bool = True, max_nfev: int = 500, **kwargs) -> "HillFitResult":
+        """Fit an independent curve to each group of a dataset at once.
+
+        Curves are padded into a (K, M) layout (K curves, with at most M points each) and fit simultaneously with a
+        batched Levenberg-Marquardt solver, which is much faster than calling fit() once per curve when screening
+        thousands of single-drug responses. As in fit(), doses of each curve are scaled to be log-centered around 0.
+
+        :param ArrayLike d: Doses
+        :param ArrayLike E: Measured dose-response effect at doses d
+        :param ArrayLike groups: Label of the curve each data point belongs to
+        :param bool use_jacobian: Whether to use the model jacobian, rather than finite differences
+        :param int max_nfev: Maximum number of iterations for each curve
+        :param kwargs: Keyword arguments used to construct every model, such as parameter bounds (or E0 and Emax for
+            Hill_2P)
+        :return HillFitResult: Fit parameters and scores of every curve, which can be hydrated into models on demand
+        """
+        template = cls(**kwargs)
+        labels, d, E, mask = _pad_groups(d, E, groups)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            parameters, converged = template._fit_many(d, E, mask, use_jacobian, max_nfev)
+            scores = template._score_many(d, E, mask, parameters)
+        parameters[~converged] = np.nan
+        return HillFitResult(template, labels, parameters, converged, *scores)
+
+    def _fit_many(self, d, E, mask, use_jacobian: bool, max_nfev: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Fit every row of a padded (K, M) dataset, returning parameters (K, n_parameters) and convergence (K,)."""
+        # Per-curve equivalent of _set_dose_scale()
+        dose_scale = np.exp(_masked_median(np.log(d), mask & (d > 0)))
+        d_scaled = d / dose_scale[:, None]
+
+        C_idx = self._parameter_names.index("C")
+        lower, upper = (np.tile(np.asarray(bound, dtype=float), (len(d), 1)) for bound in self._bounds)
+        lower[:, C_idx] -= np.log(dose_scale)
+        upper[:, C_idx] -= np.log(dose_scale)
+
+        p0 = np.column_stack(self._transform_params_to_fit(self._get_initial_guess_many(d, E, mask).T))
+        p0[:, C_idx] -= np.log(dose_scale)
+        p0[~np.isfinite(p0)] = 0
+
+        def residuals(p, rows):
+            return np.where(mask[rows], self.fit_function(d_scaled[rows], *p.T[:, :, None]) - E[rows], 0)
+
+        def jacobian(p, rows):
+            if use_jacobian:
+                jac = self.jacobian_function(d_scaled[rows], *p.T[:, :, None])
+            else:
+                jac = batch_finite_difference_jacobian(residuals, p, rows, bounds=(lower[rows], upper[rows]))
+            return np.where(mask[rows, :, None], jac, 0)
+
+        popt, converged = batch_levenberg_marquardt(residuals, jacobian, p0, (lower, upper), max_nfev=max_nfev)
+        popt[:, C_idx] += np.log(dose_scale)
+        return np.column_stack(self._transform_params_from_fit(popt.T)), converged
+
+    def _get_initial_guess_many(self, d, E, mask) -> np.ndarray:
+        """Per-curve equivalent of _get_initial_guess(), returning initial parameters of shape (K, n_parameters)."""
+        d_min = np.min(np.where(mask, d, np.inf), axis=1, keepdims=True)
+        d_max = np.max(np.where(mask, d, -np.inf), axis=1, keepdims=True)
+        return np.column_stack(
+            [
+                _masked_median(E, mask & (d == d_min)),
+                _masked_median(E, mask & (d == d_max)),
+                np.ones(len(d)),
+                _masked_median(d, mask),
+            ]
+        )
+
+    def _E_many(self, d, parameters):
+        """Evaluate the model for every row of a padded (K, M) dose array, given parameters (K, n_parameters)."""
+        return self._model(d, *parameters.T[:, :, None])
+
+    def _score_many(self, d, E, mask, parameters) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Per-curve equivalent of _score(), returning sum_of_squares_residuals, r_squared, aic, and bic."""
+        n_parameters = parameters.shape[1]
+        n_datapoints = np.sum(mask, axis=1)
+        E_mean = np.sum(np.where(mask, E, 0), axis=1) / n_datapoints
+        sum_of_squares_residuals = np.sum(np.where(mask, (E - self._E_many(d, parameters)) ** 2, 0), axis=1)
+        ss_tot = np.sum(np.where(mask, (E - E_mean[:, None]) ** 2, 0), axis=1)
+
+        r_squared = 1 - sum_of_squares_residuals / ss_tot
+        aic = np.asarray(utils.AIC(sum_of_squares_residuals, n_parameters, n_datapoints))
+        bic = np.asarray(utils.BIC(sum_of_squares_residuals, n_parameters, n_datapoints))
+
+        # Match fit(), which only scores models with enough data points
+        unscored = n_datapoints - n_parameters - 1 <= 0
+        scores = (sum_of_squares_residuals, r_squared, aic, bic)
+        for score in scores:
+            score[unscored] = np.nan
+        return scores
+
     def _set_parameters(self, parameters):
         self.E0, self.Emax, self.h, self.C = parameters
 
     def _model(self, d, E0, Emax, h, C):
         """Hill equation."""
+        kernels = backend.numba_kernels((d,), (E0, Emax, h, C))
+        if kernels is not None:
+            return kernels.hill(d, E0, Emax, h, C)
         dh = np.float_power(d, h)
         return E0 + (Emax - E0) * (dh / (C**h + dh))
 
     def _model_to_fit(self, d, E0, Emax, logh, logC):
         """Hill equation expecting log-transformed parameters h and C parameters, for fitting."""
-        return self._model(d, E0, Emax, np.exp(logh), np.exp(logC))
+        return self._model(FitContext.of(d).doses, E0, Emax, np.exp(logh), np.exp(logC))
 
     def _model_inv(self, E, E0, Emax, h, C):
         """Inverse Hill equation."""
@@ -130,10 +245,14 @@ class Hill(ParametricDoseResponseModel1D):
             Derivatives of the Hill equation with respect to E0, Emax, logh,
             and logC
         """
+        context = FitContext.of(d)
+        kernels = backend.numba_kernels((context.doses,), (E0, Emax, logh, logC))
+        if kernels is not None:
+            return kernels.hill_jacobian(context.doses, context.log_doses, E0, Emax, logh, logC)
         h = np.exp(logh)
-        d_pow_h = d**h
+        d_pow_h = context.doses**h
         C_pow_h = np.exp(logC) ** h
-        logd = np.log(d)
+        logd = context.log_doses
 
         jE0 = 1 - d_pow_h / (C_pow_h + d_pow_h)
         jEmax = 1 - jE0
@@ -148,7 +267,7 @@ class Hill(ParametricDoseResponseModel1D):
             / ((C_pow_h + d_pow_h) * (C_pow_h + d_pow_h))
         )
 
-        jac = np.hstack((jE0.reshape(-1, 1), jEmax.reshape(-1, 1), jh.reshape(-1, 1), jC.reshape(-1, 1)))
+        jac = np.stack(np.broadcast_arrays(jE0, jEmax, jh, jC), axis=-1)
         jac[np.isnan(jac)] = 0
         return jac
 
@@ -189,15 +308,19 @@ class Hill_2P(Hill):
         super().__init__(**kwargs)
 
     def _model_to_fit(self, d, logh, logC):
-        return self._model(d, self.E0, self.Emax, np.exp(logh), np.exp(logC))
+        return self._model(FitContext.of(d).doses, self.E0, self.Emax, np.exp(logh), np.exp(logC))
 
     def _model_jacobian_for_fit(self, d, logh, logC):
+        context = FitContext.of(d)
+        kernels = backend.numba_kernels((context.doses,), (self.E0, self.Emax, logh, logC))
+        if kernels is not None:
+            return kernels.hill_jacobian(context.doses, context.log_doses, self.E0, self.Emax, logh, logC)[:, 2:]
         h = np.exp(logh)
-        d_pow_h = d**h
+        d_pow_h = context.doses**h
         C_pow_h = np.exp(logC) ** h
         squared_sum = np.float_power(C_pow_h + d_pow_h, 2.0)
 
-        logd = np.log(d)
+        logd = context.log_doses
 
         E0 = self.E0
         Emax = self.Emax
@@ -206,7 +329,7 @@ class Hill_2P(Hill):
 
         jh = (Emax - E0) * d_pow_h * h * ((C_pow_h + d_pow_h) * logd - (logC * C_pow_h + logd * d_pow_h)) / squared_sum
 
-        jac = np.hstack((jh.reshape(-1, 1), jC.reshape(-1, 1)))
+        jac = np.stack(np.broadcast_arrays(jh, jC), axis=-1)
         jac[np.isnan(jac)] = 0
         return jac
 
@@ -214,12 +337,23 @@ class Hill_2P(Hill):
     def _parameter_names(self) -> List[str]:
         return ["h", "C"]
 
+    @property
+    def _linear_parameter_indices(self) -> Optional[List[int]]:
+        """E0 and Emax are fixed, so no parameters enter linearly."""
+        return None
+
     def _get_initial_guess(self, d, E, p0):
         if p0 is None:
             p0 = [1, np.median(d)]
 
         return super()._get_initial_guess(d, E, p0)
 
+    def _get_initial_guess_many(self, d, E, mask) -> np.ndarray:
+        return np.column_stack([np.ones(len(d)), _masked_median(d, mask)])
+
+    def _E_many(self, d, parameters):
+        return self._model(d, self.E0, self.Emax, *parameters.T[:, :, None])
+
     def _set_parameters(self, popt):
         h, C = popt
 
@@ -252,6 +386,8 @@ class Hill_CI(Hill_2P):
     log-linearization approach to dose-response fitting used by the Combination Index.
     """
 
+    _batch_fit_supported = False
+
     def __init__(self, **kwargs):
         kwargs["E0"] = 1.0
         kwargs["Emax"] = 0.0
@@ -271,6 +407,21 @@ class Hill_CI(Hill_2P):
         C *= self._dose_scale
         return (h, C)
 
+    def _fit_many(self, d, E, mask, use_jacobian: bool, max_nfev: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-curve equivalent of _fit(), solving every median-effect linear regression at once."""
+        mask = mask & (E < 1) & (E > 0) & (d > 0)
+        n = np.sum(mask, axis=1)
+        x = np.where(mask, np.log(d), 0)
+        y = np.where(mask, np.log((1 - E) / E), 0)
+        x_centered = np.where(mask, x - (np.sum(x, axis=1) / n)[:, None], 0)
+        y_centered = np.where(mask, y - (np.sum(y, axis=1) / n)[:, None], 0)
+
+        h = np.sum(x_centered * y_centered, axis=1) / np.sum(x_centered**2, axis=1)
+        intercept = (np.sum(y, axis=1) - h * np.sum(x, axis=1)) / n
+        C = np.exp(-intercept / h)
+        converged = (n >= 2) & np.isfinite(h) & np.isfinite(C)
+        return np.column_stack([h, C]), converged
+
     def plot_linear_fit(self, d, E, ax=None):
         if not self.is_specified:
             raise ModelNotParameterizedError()
@@ -316,3 +467,108 @@ class Hill_CI(Hill_2P):
             return "Hill_CI()"
 
         return "Hill_CI(h=%0.3g, C=%0.3g)" % (self.h, self.C)
+
+
+class HillFitResult:
+    """Many Hill curves fit at once by ``Hill.fit_many()``, stored as arrays with one entry per curve.
+
+    Individual models are only constructed when requested, as ``result[group]``.
+    """
+
+    def __init__(
+        self,
+        template: Hill,
+        groups: np.ndarray,
+        parameters: np.ndarray,
+        converged: np.ndarray,
+        sum_of_squares_residuals: np.ndarray,
+        r_squared: np.ndarray,
+        aic: np.ndarray,
+        bic: np.ndarray,
+    ):
+        """Ctor.
+
+        :param Hill template: Unfit model that each curve's model is copied from
+        :param np.ndarray groups: Label of each curve, shape (K,)
+        :param np.ndarray parameters: Fit parameters of each curve, shape (K, n_parameters). Rows that failed are nan.
+        :param np.ndarray converged: Whether each curve's fit converged, shape (K,)
+        :param np.ndarray sum_of_squares_residuals: Score of each curve, shape (K,)
+        :param np.ndarray r_squared: Score of each curve, shape (K,)
+        :param np.ndarray aic: Score of each curve, shape (K,)
+        :param np.ndarray bic: Score of each curve, shape (K,)
+        """
+        self._template = template
+        self.groups = groups
+        self.converged = converged
+        self.parameters: Dict[str, np.ndarray] = dict(zip(template._parameter_names, parameters.T))
+        self.sum_of_squares_residuals = sum_of_squares_residuals
+        self.r_squared = r_squared
+        self.aic = aic
+        self.bic = bic
+        self._index = {group: idx for idx, group in enumerate(groups.tolist())}
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def __getitem__(self, group: Any) -> Hill:
+        """Construct the fit model of one curve.
+
+        :param group: The curve's label
+        :return Hill: A fit model of the same class used to call fit_many()
+        """
+        idx = self._index[group]
+        model = copy.deepcopy(self._template)
+        model._is_fit = True
+        model._converged = bool(self.converged[idx])
+        if not model._converged:
+            return model
+
+        model._set_parameters([float(values[idx]) for values in self.parameters.values()])
+        if np.isfinite(self.sum_of_squares_residuals[idx]):
+            model.sum_of_squares_residuals = float(self.sum_of_squares_residuals[idx])
+            model.r_squared = float(self.r_squared[idx])
+            model.aic = float(self.aic[idx])
+            model.bic = float(self.bic[idx])
+        return model
+
+    def __repr__(self):
+        return "HillFitResult(%s, n_curves=%d, n_converged=%d)" % (
+            type(self._template).__name__,
+            len(self),
+            np.sum(self.converged),
+        )
+
+
+def _pad_groups(d, E, groups) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Arrange grouped data into padded arrays with one row per group.
+
+    :return Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The sorted unique group labels (K,), and doses,
+        effects, and a mask of real (not padded) data points, each of shape (K, M), where M is the size of the
+        largest group. Padded doses are 1 and padded effects are 0, so that they evaluate to finite values.
+    """
+    d = np.asarray(d, dtype=float)
+    E = np.asarray(E, dtype=float)
+    groups = np.asarray(groups)
+    if not (d.shape == E.shape == groups.shape) or d.ndim != 1:
+        raise ValueError("d, E, and groups must be 1D arrays of the same length")
+
+    labels, inverse, counts = np.unique(groups, return_inverse=True, return_counts=True)
+    order = np.argsort(inverse, kind="stable")
+    rows = inverse[order]
+    columns = np.arange(len(order)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    shape = (len(labels), np.max(counts, initial=0))
+    d_padded = np.ones(shape)
+    E_padded = np.zeros(shape)
+    mask = np.zeros(shape, dtype=bool)
+    d_padded[rows, columns] = d[order]
+    E_padded[rows, columns] = E[order]
+    mask[rows, columns] = True
+    return labels, d_padded, E_padded, mask
+
+
+def _masked_median(values, mask) -> np.ndarray:
+    """Median of each row of values, considering only entries where mask is True (nan for empty rows)."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # All-nan rows
+        return np.nanmedian(np.where(mask, values, np.nan), axis=1)
@@ -30,6 +30,7 @@ from synergy.higher import Bliss as BlissND
 from synergy.higher import DoseDependentSynergyModelND
 from synergy.higher import MuSyC as MuSyCND
 from synergy.higher import Schindler as SchindlerND
+from synergy.higher.musyc import MuSyCTopology
 from synergy.single import DoseResponseModel1D, Hill
 from synergy.utils import dose_utils
 
@@ -425,7 +426,7 @@ class MuSyCDataGenerator:
         parameters = kwargs or {}
         model = MuSyCND(num_drugs=num_drugs)
         C_params = [1.0] * num_drugs  # record C params to help set default dmin and dmax
-        for parameter in model._parameter_names:  # TODO: Stop accessing private property
+        for parameter in MuSyCTopology(num_drugs).get_parameter_names(fit_gamma=False):
             if parameter not in parameters:
                 if parameter.startswith("E"):
                     num_present_drugs = 0 if parameter == "E_0" else len(parameter.split(","))
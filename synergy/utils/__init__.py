@@ -51,16 +51,21 @@ def AIC(sum_of_squares_residuals: float, n_parameters: int, n_samples: int) -> f
     Equations (6) and (16)
     https://projects.ncsu.edu/crsc/reports/ftp/pdf/crsc-tr17-09.pdf
 
+    sum_of_squares_residuals and n_samples may also be arrays, to score many fits at once.
+
     :param float sum_of_squares_residuals: The sum of squares of the residuals
     :param int n_parameters: The number of parameters in the model
     :param int n_samples: The number of samples
     :return float: The AIC value
     """
     aic = n_samples * np.log(sum_of_squares_residuals / n_samples) + 2 * (n_parameters + 1)
-    if n_samples / n_parameters > 40:
+    if np.ndim(n_samples) == 0 and n_samples / n_parameters > 40:
         return aic
-    else:
-        return aic + 2 * n_parameters * (n_parameters + 1) / (n_samples - n_parameters - 1)
+
+    # Small-sample correction (arrays of scores are corrected elementwise)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correction = 2 * n_parameters * (n_parameters + 1) / (n_samples - n_parameters - 1)
+    return aic + np.where(np.asarray(n_samples) / n_parameters > 40, 0, correction)
 
 
 def BIC(sum_of_squares_residuals: float, n_parameters: int, n_samples: int) -> float:
@@ -0,0 +1,66 @@
+"""Selection of the backend that evaluates model equations and Jacobians."""
+
+from typing import Sequence
+
+import numpy as np
+
+try:
+    import numba  # noqa: F401
+
+    numba_installed = True
+except ImportError:
+    numba_installed = False
+
+BACKENDS = ("numpy", "numba")
+
+_BACKEND = "numpy"
+
+
+def set_backend(backend: str):
+    """Select how models evaluate their equations and Jacobians.
+
+    "numpy" (the default) evaluates them as NumPy array expressions. "numba" evaluates Hill, 2D MuSyC, BRAID, Zimmer,
+    and Schindler with compiled kernels (see ``synergy.utils.kernels``), which compute each dose in a single pass
+    without temporary arrays. Results match the NumPy backend to within rounding error. Each kernel is compiled the
+    first time it is used, and cached on disk for later sessions.
+
+    Evaluations the kernels do not support, such as scalar doses or the batched and complex parameters used by
+    ``bootstrap_solver="batch"`` and ``use_jacobian="auto"``, use NumPy with either backend.
+
+    :param str backend: "numpy" or "numba"
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS} ({backend})")
+    if backend == "numba" and not numba_installed:
+        raise ImportError("numba must be installed to use the numba backend")
+    global _BACKEND
+    _BACKEND = backend
+
+
+def get_backend() -> str:
+    """The backend selected by ``set_backend()``."""
+    return _BACKEND
+
+
+def numba_kernels(doses: Sequence, params: Sequence, ndim: int = 1):
+    """Return ``synergy.utils.kernels`` if the numba backend is selected and its kernels support these arguments.
+
+    :param Sequence doses: Dose arrays the model is evaluated at, which must have ndim dimensions and the same shape
+    :param Sequence params: Parameters the model is evaluated at, which must be real scalars
+    :param int ndim: Number of dimensions of each dose array
+    :return: The kernels module, or None if the model should be evaluated with NumPy
+    """
+    if _BACKEND != "numba":
+        return None
+    if any(np.ndim(d) != ndim or np.iscomplexobj(d) for d in doses):
+        return None
+    # The kernels index every dose array by the first one's length, so leave mismatched doses for NumPy to broadcast
+    # (or reject)
+    if len({np.shape(d) for d in doses}) > 1:
+        return None
+    if any(np.ndim(p) != 0 or np.iscomplexobj(p) for p in params):
+        return None
+
+    from synergy.utils import kernels
+
+    return kernels
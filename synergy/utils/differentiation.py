@@ -0,0 +1,91 @@
+"""Numerical differentiation of model fit functions, for models without an analytic Jacobian."""
+
+from typing import Callable, Sequence
+
+import numpy as np
+
+
+def complex_step_jacobian(
+    function: Callable, xdata, params: Sequence, batched: bool = False, step: float = 1e-20
+) -> np.ndarray:
+    """Calculate the Jacobian of ``function(xdata, *params)`` with respect to params by complex-step differentiation.
+
+    For a function that is real-analytic in its parameters, Im(f(p + i * step * e_k)) / step equals df/dp_k to within
+    O(step^2). Unlike finite differences, there is no subtraction, so step can be tiny and the result is accurate to
+    rounding error.
+
+    The function must propagate complex parameters analytically, which pure NumPy arithmetic, powers, logs, and
+    linear solves do. It must not take abs() of, compare, or cast to float anything that depends on the parameters
+    (except to choose between branches, as the imaginary parts are negligible). Entries where the model itself is not
+    finite are set to 0, as in the models' analytic Jacobians. Entries that are only non-finite in complex arithmetic,
+    such as 0 ** (h + i * step) at zero doses, are instead calculated by central differences.
+
+    :param Callable function: The function to differentiate, such as a model's fit_function
+    :param xdata: The first argument of function
+    :param Sequence params: Parameters to differentiate with respect to (scalars, or arrays for batched fits)
+    :param bool batched: If True, function broadcasts over parameters passed as arrays of shape (B, 1) (see
+        ``_batch_fit_supported``), so all directions are evaluated with a single call when params are scalars
+    :param float step: Size of the imaginary perturbation
+    :return np.ndarray: The Jacobian, whose last axis holds the derivatives with respect to each parameter
+    """
+    n_params = len(params)
+    if batched and all(np.ndim(p) == 0 for p in params):
+        # Row k of directions perturbs parameter k, and parameter i is passed as the column directions[:, i]
+        directions = np.asarray(params, dtype=complex) + 1j * step * np.eye(n_params)
+        values = function(xdata, *[directions[:, i, None] for i in range(n_params)])
+        jacobian = np.moveaxis(np.imag(values) / step, 0, -1)
+    else:
+        columns = []
+        for k in range(n_params):
+            perturbed = list(params)
+            perturbed[k] = perturbed[k] + 1j * step
+            columns.append(np.imag(function(xdata, *perturbed)) / step)
+        jacobian = np.stack(columns, axis=-1)
+
+    invalid = ~np.isfinite(jacobian)
+    if invalid.any():
+        values = np.broadcast_to(function(xdata, *params)[..., None], jacobian.shape)
+        invalid &= np.isfinite(values)
+        jacobian[~np.isfinite(values)] = 0
+        for k in np.flatnonzero(invalid.reshape(-1, n_params).any(axis=0)):
+            jacobian[..., k] = np.where(
+                invalid[..., k], _central_difference(function, xdata, params, k), jacobian[..., k]
+            )
+    return jacobian
+
+
+def _central_difference(function: Callable, xdata, params: Sequence, k: int) -> np.ndarray:
+    """Calculate the derivative of ``function(xdata, *params)`` with respect to params[k] by central differences.
+
+    :param Callable function: The function to differentiate
+    :param xdata: The first argument of function
+    :param Sequence params: Parameters of function
+    :param int k: Index of the parameter to differentiate with respect to
+    :return np.ndarray: The derivative, shaped like ``function(xdata, *params)``
+    """
+    p = np.asarray(params[k], dtype=float)
+    step = np.cbrt(np.finfo(float).eps) * np.maximum(1, np.abs(p))
+    upper, lower = list(params), list(params)
+    upper[k], lower[k] = p + step, p - step
+    # Divide by the difference of the perturbed parameters as represented, rather than by 2 * step
+    return (function(xdata, *upper) - function(xdata, *lower)) / (upper[k] - lower[k])
+
+
+class ComplexStepJacobian:
+    """A jacobian_function computed from a model's fit_function by complex-step differentiation.
+
+    See ``complex_step_jacobian()`` for the requirements on the fit function.
+
+    :param Callable function: The model's fit_function
+    :param bool batched: Whether function broadcasts over parameters passed as arrays of shape (B, 1)
+    :param float step: Size of the imaginary perturbation
+    """
+
+    def __init__(self, function: Callable, batched: bool = False, step: float = 1e-20):
+        """Ctor."""
+        self.function = function
+        self.batched = batched
+        self.step = step
+
+    def __call__(self, xdata, *params) -> np.ndarray:
+        return complex_step_jacobian(self.function, xdata, params, batched=self.batched, step=self.step)
@@ -0,0 +1,383 @@
+"""Numba-compiled kernels that evaluate models and their Jacobians in a single pass over the doses.
+
+These are used by the numba backend (see ``synergy.utils.backend``), which requires numba. Each kernel computes one dose
+at a time from scalar intermediates, so it allocates only its output, and matches the NumPy implementation of the model
+to within rounding error. Doses are 1D float arrays of the same length, and parameters are real scalars. Without numba,
+this module can still be imported (e.g., to collect doctests), but its kernels are not compiled.
+"""
+
+import numpy as np
+
+from synergy.combination.generated import musyc as generated_musyc
+from synergy.combination.generated import musyc_no_gamma as generated_musyc_no_gamma
+from synergy.utils.backend import numba_installed
+
+if numba_installed:
+    import numba
+
+    _jit = numba.njit(cache=True, error_model="numpy")
+else:
+
+    def _jit(function):
+        return function
+
+
+def _doses(*doses):
+    return tuple(np.ascontiguousarray(d, dtype=float) for d in doses)
+
+
+def _params(*params):
+    return tuple(float(p) for p in params)
+
+
+@_jit
+def _xlogy(x, y):
+    """x * log(y), which is 0 if x is 0 (as scipy.special.xlogy)."""
+    if x == 0:
+        return 0.0
+    return x * np.log(y)
+
+
+@_jit
+def _zero_nan(out):
+    values = out.reshape(-1)
+    for index in range(values.size):
+        if np.isnan(values[index]):
+            values[index] = 0.0
+
+
+# Hill
+
+
+@_jit
+def _hill(d, E0, Emax, h, C):
+    out = np.empty(d.size)
+    C_pow_h = C**h
+    for i in range(d.size):
+        d_pow_h = d[i] ** h
+        out[i] = E0 + (Emax - E0) * (d_pow_h / (C_pow_h + d_pow_h))
+    return out
+
+
+@_jit
+def _hill_jacobian(d, logd, E0, Emax, logh, logC):
+    out = np.empty((d.size, 4))
+    h = np.exp(logh)
+    C_pow_h = np.exp(logC) ** h
+    for i in range(d.size):
+        d_pow_h = d[i] ** h
+        total = C_pow_h + d_pow_h
+        out[i, 0] = 1 - d_pow_h / total
+        out[i, 1] = 1 - out[i, 0]
+        out[i, 2] = (
+            (Emax - E0) * d_pow_h * h * (total * logd[i] - (logC * C_pow_h + logd[i] * d_pow_h)) / (total * total)
+        )
+        out[i, 3] = (E0 - Emax) * d_pow_h * h * C_pow_h / (total * total)
+    _zero_nan(out)
+    return out
+
+
+def hill(d, E0, Emax, h, C):
+    """Hill equation (see ``Hill._model()``)."""
+    return _hill(*_doses(d), *_params(E0, Emax, h, C))
+
+
+def hill_jacobian(d, logd, E0, Emax, logh, logC):
+    """Jacobian of the Hill equation with respect to E0, Emax, log h, and log C."""
+    return _hill_jacobian(*_doses(d, logd), *_params(E0, Emax, logh, logC))
+
+
+# MuSyC (2 drugs), from the scalar functions of the generated code
+
+_musyc_point = _jit(generated_musyc.model_point)
+_musyc_jacobian_point = _jit(generated_musyc.jacobian_point)
+_musyc_no_gamma_point = _jit(generated_musyc_no_gamma.model_point)
+_musyc_no_gamma_jacobian_point = _jit(generated_musyc_no_gamma.jacobian_point)
+
+
+@_jit
+def _musyc(d1, d2, params):
+    out = np.empty(d1.size)
+    for i in range(d1.size):
+        out[i] = _musyc_point(d1[i], d2[i], *params)
+    return out
+
+
+@_jit
+def _musyc_jacobian(d1, d2, logd1, logd2, params):
+    out = np.empty((d1.size, 12))
+    for i in range(d1.size):
+        _musyc_jacobian_point(out[i], logd1[i], logd2[i], d1[i], d2[i], *params)
+    return out
+
+
+@_jit
+def _musyc_no_gamma(d1, d2, params):
+    out = np.empty(d1.size)
+    for i in range(d1.size):
+        out[i] = _musyc_no_gamma_point(d1[i], d2[i], *params)
+    return out
+
+
+@_jit
+def _musyc_no_gamma_jacobian(d1, d2, logd1, logd2, params):
+    out = np.empty((d1.size, 10))
+    for i in range(d1.size):
+        _musyc_no_gamma_jacobian_point(out[i], logd1[i], logd2[i], d1[i], d2[i], *params)
+    return out
+
+
+def musyc(d1, d2, params, gamma: bool = True):
+    """MuSyC model, with arguments as the generated ``model()`` functions.
+
+    :param Sequence params: E0, E1, E2, E3, log h1, log h2, log C1, log C2, r1r, r2r, log alpha12, log alpha21, and
+        (if gamma) log gamma12 and log gamma21
+    :param bool gamma: Whether params include gamma
+    """
+    kernel = _musyc if gamma else _musyc_no_gamma
+    return kernel(*_doses(d1, d2), _params(*params))
+
+
+def musyc_jacobian(d1, d2, logd1, logd2, params, gamma: bool = True):
+    """Jacobian of the MuSyC model, with arguments as the generated ``jacobian()`` functions.
+
+    :param Sequence params: As for ``musyc()``
+    :param bool gamma: Whether params include gamma
+    """
+    kernel = _musyc_jacobian if gamma else _musyc_no_gamma_jacobian
+    return kernel(*_doses(d1, d2, logd1, logd2), _params(*params))
+
+
+# BRAID
+
+
+@_jit
+def _braid_max_delta_E(E0, E1, E2, E3):
+    """The largest of E1 - E0, E2 - E0, and E3 - E0 in magnitude (the first, if tied), and its index."""
+    index = 0
+    max_delta_E = E1 - E0
+    if abs(E2 - E0) > abs(max_delta_E):
+        index = 1
+        max_delta_E = E2 - E0
+    if abs(E3 - E0) > abs(max_delta_E):
+        index = 2
+        max_delta_E = E3 - E0
+    return index, max_delta_E
+
+
+@_jit
+def _braid(d1, d2, E0, E1, E2, E3, h1, h2, C1, C2, kappa, delta):
+    out = np.empty(d1.size)
+    max_delta_E = _braid_max_delta_E(E0, E1, E2, E3)[1]
+    h = np.sqrt(h1 * h2)
+    power = 1 / (delta * h)
+    for i in range(d1.size):
+        u1 = (d1[i] / C1) ** h1
+        u2 = (d2[i] / C2) ** h2
+        B1 = 1 + (1 - (E1 - E0) / max_delta_E) * u1
+        B2 = 1 + (1 - (E2 - E0) / max_delta_E) * u2
+        P1 = ((E1 - E0) / max_delta_E * u1 / B1) ** power
+        P2 = ((E2 - E0) / max_delta_E * u2 / B2) ** power
+        D = P1 + P2 + kappa * np.sqrt(P1 * P2)
+        out[i] = E0 + max_delta_E / (1 + D ** (-delta * h))
+    return out
+
+
+@_jit
+def _braid_jacobian(d1, d2, E0, E1, E2, E3, logh1, logh2, logC1, logC2, kappa, logdelta, fit_kappa, fit_delta):
+    out = np.empty((d1.size, 8 + fit_kappa + fit_delta))
+    index, M = _braid_max_delta_E(E0, E1, E2, E3)
+    h1 = np.exp(logh1)
+    h2 = np.exp(logh2)
+    C1 = np.exp(logC1)
+    C2 = np.exp(logC2)
+    delta = np.exp(logdelta)
+    h = np.sqrt(h1 * h2)
+    power = 1 / (delta * h)
+    q = delta * h
+    for i in range(d1.size):
+        u1 = (d1[i] / C1) ** h1
+        u2 = (d2[i] / C2) ** h2
+        B1 = 1 + (1 - (E1 - E0) / M) * u1
+        B2 = 1 + (1 - (E2 - E0) / M) * u2
+        D1 = (E1 - E0) / M * u1 / B1
+        D2 = (E2 - E0) / M * u2 / B2
+        P1 = D1**power
+        P2 = D2**power
+        R = np.sqrt(P1 * P2)
+        D = P1 + P2 + kappa * R
+
+        # As BRAID._jacobian()
+        F = 1 / (1 + D ** (-delta * h))
+        MG = M * F * (1 - F)
+        w1 = 0.0
+        w2 = 0.0
+        if D > 0:
+            w1 = (P1 + kappa * R / 2) / D
+            w2 = (P2 + kappa * R / 2) / D
+        T = q * np.log(D) - _xlogy(w1, D1) - _xlogy(w2, D2)
+        v1 = w1 / B1
+        v2 = w2 / B2
+        c1 = MG * v1 * (1 + u1)
+        c2 = MG * v2 * (1 + u2)
+        K = F - (c1 + c2) / M
+        g1 = c1 / (E1 - E0)
+        g2 = c2 / (E2 - E0)
+
+        out[i, 0] = 1 - g1 - g2 - K
+        out[i, 1] = g1 + K * (index == 0)
+        out[i, 2] = g2 + K * (index == 1)
+        out[i, 3] = K * (index == 2)
+        out[i, 4] = MG * (T / 2 + _xlogy(v1, u1))
+        out[i, 5] = MG * (T / 2 + _xlogy(v2, u2))
+        out[i, 6] = -MG * v1 * h1
+        out[i, 7] = -MG * v2 * h2
+        if fit_kappa:
+            out[i, 8] = MG * q * R / D
+        if fit_delta:
+            out[i, 8 + fit_kappa] = MG * T
+    _zero_nan(out)
+    return out
+
+
+def braid(d1, d2, E0, E1, E2, E3, h1, h2, C1, C2, kappa, delta):
+    """BRAID model (see ``BRAID._model()``)."""
+    return _braid(*_doses(d1, d2), *_params(E0, E1, E2, E3, h1, h2, C1, C2, kappa, delta))
+
+
+def braid_jacobian(d1, d2, E0, E1, E2, E3, logh1, logh2, logC1, logC2, kappa, logdelta, fit_kappa, fit_delta):
+    """Jacobian of the BRAID model, with columns as ``BRAID._jacobian()``.
+
+    :param bool fit_kappa: Whether to include the column of kappa
+    :param bool fit_delta: Whether to include the column of log delta
+    """
+    params = _params(E0, E1, E2, E3, logh1, logh2, logC1, logC2, kappa, logdelta)
+    return _braid_jacobian(*_doses(d1, d2), *params, int(fit_kappa), int(fit_delta))
+
+
+# Zimmer
+
+
+@_jit
+def _zimmer_terms(d1, d2, h1, h2, C1, C2, a12, a21):
+    """As Zimmer._model_terms(), at a single dose."""
+    A = d2 + C2 * (a21 + 1) + d2 * a12
+    B = d2 * C1 + C1 * C2 + a12 * d2 * C1 - d1 * (d2 + C2 * (a21 + 1))
+    C = -d1 * (d2 * C1 + C1 * C2)
+    sqrt_discriminant = np.sqrt(B * B - 4 * A * C)
+    if B > 0:
+        d1p = 2.0 * C / (-B - sqrt_discriminant)
+    else:
+        d1p = (-B + sqrt_discriminant) / (2.0 * A)
+    s = d1p / (d1p + C1)
+    d2p = d2 / (1.0 + a21 * s)
+    r1 = (d1p / C1) ** h1
+    r2 = (d2p / C2) ** h2
+    return B, sqrt_discriminant, d1p, s, r1, r2
+
+
+@_jit
+def _zimmer(d1, d2, h1, h2, C1, C2, a12, a21):
+    out = np.empty(d1.size)
+    for i in range(d1.size):
+        r1, r2 = _zimmer_terms(d1[i], d2[i], h1, h2, C1, C2, a12, a21)[4:]
+        out[i] = 1 / (1 + r1) * (1 / (1 + r2))
+    return out
+
+
+@_jit
+def _zimmer_jacobian(d1, d2, logh1, logh2, logC1, logC2, a12, a21):
+    out = np.empty((d1.size, 6))
+    dlogx1 = np.empty(4)
+    dlogx2 = np.empty(4)
+    h1 = np.exp(logh1)
+    h2 = np.exp(logh2)
+    C1 = np.exp(logC1)
+    C2 = np.exp(logC2)
+    for i in range(d1.size):
+        B, sqrt_discriminant, d1p, s, r1, r2 = _zimmer_terms(d1[i], d2[i], h1, h2, C1, C2, a12, a21)
+        C_over_d1p = (-B - sqrt_discriminant) / 2
+
+        # As Zimmer._jacobian(), with (A', B', C' / C) for log C1, log C2, a12, and a21
+        dlogx1[0] = -(C1 * (d2[i] * (1 + a12) + C2) + C_over_d1p) / sqrt_discriminant - 1
+        dlogx1[1] = (
+            -(C2 * (1 + a21) * d1p + C2 * (C1 - d1[i] * (1 + a21)) + C2 / (d2[i] + C2) * C_over_d1p) / sqrt_discriminant
+        )
+        dlogx1[2] = -(d2[i] * d1p + C1 * d2[i]) / sqrt_discriminant
+        dlogx1[3] = -(C2 * d1p - d1[i] * C2) / sqrt_discriminant
+        for k in range(4):
+            dlogx2[k] = -a21 * s * (1 - s) * dlogx1[k] / (1 + a21 * s)
+        dlogx2[1] = dlogx2[1] - 1
+        dlogx2[3] = dlogx2[3] - s / (1 + a21 * s)
+
+        E1 = 1 / (1 + r1)
+        E2 = 1 / (1 + r2)
+        m1 = E1 * r1
+        m2 = E2 * r2
+        E = E1 * E2
+        out[i, 0] = -E * _xlogy(m1, r1)
+        out[i, 1] = -E * _xlogy(m2, r2)
+        for k in range(4):
+            out[i, 2 + k] = -E * (h1 * m1 * dlogx1[k] + h2 * m2 * dlogx2[k])
+    _zero_nan(out)
+    return out
+
+
+def zimmer(d1, d2, h1, h2, C1, C2, a12, a21):
+    """Zimmer model (see ``Zimmer._model()``)."""
+    return _zimmer(*_doses(d1, d2), *_params(h1, h2, C1, C2, a12, a21))
+
+
+def zimmer_jacobian(d1, d2, logh1, logh2, logC1, logC2, a12, a21):
+    """Jacobian of the Zimmer model, with columns as ``Zimmer._jacobian()``."""
+    return _zimmer_jacobian(*_doses(d1, d2), *_params(logh1, logh2, logC1, logC2, a12, a21))
+
+
+# Schindler
+
+
+@_jit
+def _schindler(d1, d2, E1, E2, h1, h2, C1, C2):
+    out = np.empty(d1.size)
+    for i in range(d1.size):
+        m1 = d1[i] / C1
+        m2 = d2[i] / C2
+        y = (h1 * m1 + h2 * m2) / (m1 + m2)
+        u_max = (E1 * m1 + E2 * m2) / (m1 + m2)
+        power = (m1 + m2) ** y
+        out[i] = u_max * power / (1.0 + power)
+    return out
+
+
+@_jit
+def _schindler_nd(d, Emax, h, C):
+    n_points, n_drugs = d.shape
+    out = np.empty(n_points)
+    for i in range(n_points):
+        msum = 0.0
+        hsum = 0.0
+        Esum = 0.0
+        for j in range(n_drugs):
+            m = d[i, j] / C[j]
+            msum += m
+            hsum += h[j] * m
+            Esum += Emax[j] * m
+        power = msum ** (hsum / msum)
+        out[i] = Esum / msum * power / (1.0 + power)
+    return out
+
+
+def schindler(d1, d2, E1, E2, h1, h2, C1, C2):
+    """Schindler model for 2 drugs (see ``synergy.combination.Schindler._model()``)."""
+    return _schindler(*_doses(d1, d2), *_params(E1, E2, h1, h2, C1, C2))
+
+
+def schindler_nd(d, Emax, h, C):
+    """Schindler model for N drugs (see ``synergy.higher.Schindler._model()``).
+
+    :param d: Doses, shape (n_points, N)
+    :param Emax: Maximum effect of each drug relative to E0, length N
+    :param h: Hill slope of each drug, length N
+    :param C: EC50 of each drug, length N
+    """
+    return _schindler_nd(*_doses(d, Emax, h, C))
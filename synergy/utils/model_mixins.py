@@ -1,15 +1,317 @@
 """Methods used by both 2d and Nd synergy models."""
 
+import copy
 import logging
-from typing import Callable, Dict, List, Sequence, Tuple
+import os
+import threading
+import time
+import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from scipy.stats import norm
+from scipy.optimize import (
+    OptimizeWarning,
+    curve_fit,
+    least_squares,
+    leastsq,
+    lsq_linear,
+)
+from scipy.stats import beta as beta_distribution
+from scipy.stats import chi2, norm
 
 from synergy.exceptions import ModelNotFitToDataError, ModelNotParameterizedError
+from synergy.utils.differentiation import ComplexStepJacobian
 
 _LOGGER = logging.Logger(__name__)
 
+# Keyword arguments to fit() that configure bootstrapping, rather than being passed on to scipy.optimize.curve_fit()
+_BOOTSTRAP_KWARGS = (
+    "n_jobs",
+    "executor",
+    "seed",
+    "bootstrap_solver",
+    "bootstrap_tol",
+    "bootstrap_window",
+    "bootstrap_confidence_interval",
+    "bootstrap_timeout",
+    "bootstrap_max_nfev",
+    "bootstrap_fail_fast",
+)
+
+# Methods that can be used to estimate parameter confidence intervals
+CI_METHODS = ("bootstrap", "covariance", "profile")
+
+# Profiles step each parameter by this fraction of its asymptotic standard error (or by this much in fit space, if the
+# standard error is not finite)
+_PROFILE_STEP_SCALE = 0.5
+
+# Bootstrap iterations are dispatched in rounds of at most this many iterations per worker, so that stopping criteria
+# are checked regularly
+_ROUND_SIZE_PER_WORKER = 50
+
+# Bootstrapping fails fast once the upper bound of this confidence level on the success rate is too low to finish
+_FAIL_FAST_CONFIDENCE = 0.99
+
+
+class BootstrapStatus:
+    """Summary of how bootstrap resampling finished, stored as ``model.bootstrap_status``.
+
+    ``reason`` is one of:
+
+    - "complete": ``bootstrap_iterations`` iterations converged
+    - "stabilized": adaptive bootstrapping stopped because confidence intervals stabilized
+    - "max_iterations": ``max_iterations`` fits were attempted before enough converged
+    - "failure_rate": too many iterations failed for enough to converge within ``max_iterations``
+    - "timeout": ``bootstrap_timeout`` seconds elapsed
+    - "nfev_budget": ``bootstrap_max_nfev`` function evaluations were used
+
+    In all but the first two cases, ``model.bootstrap_parameters`` holds whichever iterations did converge, and
+    ``partial`` is True.
+    """
+
+    COMPLETE_REASONS = ("complete", "stabilized")
+
+    def __init__(self, reason: str, n_attempted: int, n_converged: int, nfev: int, elapsed: float):
+        """Ctor.
+
+        :param str reason: Why bootstrapping stopped
+        :param int n_attempted: Number of bootstrap fits attempted
+        :param int n_converged: Number of bootstrap fits that converged
+        :param int nfev: Number of model evaluations used by bootstrap fits
+        :param float elapsed: Wall-clock time spent bootstrapping, in seconds
+        """
+        self.reason = reason
+        self.n_attempted = n_attempted
+        self.n_converged = n_converged
+        self.nfev = nfev
+        self.elapsed = elapsed
+
+    @property
+    def partial(self) -> bool:
+        """True if bootstrapping stopped before reaching the requested number of iterations."""
+        return self.reason not in BootstrapStatus.COMPLETE_REASONS
+
+    @property
+    def failure_rate(self) -> float:
+        """Fraction of attempted bootstrap fits that failed to converge."""
+        if self.n_attempted == 0:
+            return 0.0
+        return 1.0 - self.n_converged / self.n_attempted
+
+    def __repr__(self):
+        return (
+            f"BootstrapStatus(reason={self.reason!r}, n_attempted={self.n_attempted}, "
+            f"n_converged={self.n_converged}, nfev={self.nfev}, elapsed={self.elapsed:0.3g})"
+        )
+
+
+class ProfileLikelihood:
+    r"""Profile likelihoods of each parameter of a fit model, stored as ``model.parameter_profiles``.
+
+    Each profile holds a fit-space parameter value at each step, and the residual sum of squares after re-optimizing all
+    other parameters with that parameter fixed. Profiles extend until the likelihood ratio statistic
+    :math:`n \log(RSS / RSS_{min})` crosses the :math:`\chi^2_1` threshold for ``max_confidence_interval``, or until
+    they reach the parameter's bounds, unless they are truncated (by the step limit, or a failed re-optimization). A
+    truncated side of a profile has no confidence interval bound beyond its last step.
+    """
+
+    def __init__(
+        self,
+        values: Dict[str, np.ndarray],
+        rss: Dict[str, np.ndarray],
+        rss_min: float,
+        n_data_points: int,
+        max_confidence_interval: float,
+        truncated: Optional[Dict[str, Tuple[bool, bool]]] = None,
+    ):
+        """Ctor.
+
+        :param Dict[str, np.ndarray] values: Sorted fit-space values of each profiled parameter
+        :param Dict[str, np.ndarray] rss: Residual sum of squares at each of those values
+        :param float rss_min: Residual sum of squares at the optimum
+        :param int n_data_points: Number of data points the model was fit to
+        :param float max_confidence_interval: Largest % confidence interval the profiles cover, unless truncated
+        :param Optional[Dict[str, Tuple[bool, bool]]] truncated: Whether the profile of each parameter was truncated
+            below and above the optimum before crossing the threshold for ``max_confidence_interval`` or reaching a
+            bound. By default, no profile is truncated.
+        """
+        self.values = values
+        self.rss = rss
+        self.rss_min = rss_min
+        self.n_data_points = n_data_points
+        self.max_confidence_interval = max_confidence_interval
+        self.truncated = truncated if truncated is not None else {parameter: (False, False) for parameter in values}
+
+    def statistic(self, parameter: str) -> np.ndarray:
+        """Likelihood ratio statistic along the profile of a parameter."""
+        with np.errstate(divide="ignore"):
+            return self.n_data_points * np.log(self.rss[parameter] / self.rss_min)
+
+    def interval(self, parameter: str, confidence_interval: float, lower_bound: float, upper_bound: float):
+        """Find where the profile crosses the threshold for a confidence interval on each side of the optimum.
+
+        :param str parameter: Parameter name
+        :param float confidence_interval: % confidence interval
+        :param float lower_bound: Fit-space lower bound, returned if the profile reaches it without crossing below the
+            optimum
+        :param float upper_bound: Fit-space upper bound, returned if the profile reaches it without crossing above the
+            optimum
+        :return Tuple[float, float]: Fit-space lower and upper bounds of the confidence interval. A side is nan if the
+            profile was truncated before crossing the threshold on that side.
+        """
+        threshold = chi2.ppf(confidence_interval / 100.0, 1)
+        values, statistic = self.values[parameter], self.statistic(parameter)
+        truncated_lower, truncated_upper = self.truncated[parameter]
+        best = int(np.argmin(statistic))
+        lower = _threshold_crossing(
+            values[best::-1], statistic[best::-1], threshold, np.nan if truncated_lower else lower_bound
+        )
+        upper = _threshold_crossing(
+            values[best:], statistic[best:], threshold, np.nan if truncated_upper else upper_bound
+        )
+        return lower, upper
+
+
+class FitContext:
+    """Dose-derived arrays that are constant while a model is fit.
+
+    fit() creates one context and passes it to the optimizer as xdata in place of the doses, so quantities such as
+    log(d) are calculated once per fit (including bootstrap refits), rather than on every evaluation of the model and
+    its Jacobian. Indexing a context indexes its doses, so fit functions that read d[0] and d[1] work unchanged.
+    """
+
+    def __init__(self, doses):
+        """Ctor.
+
+        :param doses: The doses as passed to fit functions: d for 1D models, or (d1, d2) for 2D models
+        """
+        self.source = doses
+        self.doses = np.asarray(doses, dtype=float)
+        self._log_doses: Optional[np.ndarray] = None
+
+    @staticmethod
+    def of(xdata) -> "FitContext":
+        """Return xdata if it is a FitContext, or a new context of the doses xdata otherwise."""
+        if isinstance(xdata, FitContext):
+            return xdata
+        return FitContext(xdata)
+
+    @property
+    def log_doses(self) -> np.ndarray:
+        """np.log(doses) (-inf where a dose is 0), calculated on first use."""
+        if self._log_doses is None:
+            with np.errstate(divide="ignore"):
+                self._log_doses = np.log(self.doses)
+        return self._log_doses
+
+    def is_for(self, doses) -> bool:
+        """True if this context was created for the same dose arrays (compared by identity)."""
+        if isinstance(doses, tuple) and isinstance(self.source, tuple):
+            return len(doses) == len(self.source) and all(a is b for a, b in zip(doses, self.source))
+        return doses is self.source
+
+    def __getitem__(self, index):
+        return self.doses[index]
+
+    def __len__(self):
+        return len(self.doses)
+
+
+class FitIntermediatesCache:
+    """Single-entry cache of intermediate quantities shared by a model's fit_function and jacobian_function.
+
+    Optimizers such as ``curve_fit()`` evaluate the Jacobian at the parameters where they last evaluated the model, so
+    caching only the most recent evaluation lets the Jacobian reuse the model's intermediates while keeping memory
+    bounded. Entries are keyed on the function, the identity of xdata, and the parameter values (including their dtype,
+    so complex-step evaluations never share intermediates with real ones).
+
+    The entry is replaced in a single assignment, so threads sharing a cache can only miss, never read another
+    thread's intermediates. The entry is not copied when the cache is pickled or deep-copied.
+    """
+
+    def __init__(self):
+        """Ctor."""
+        self._entry: Optional[Tuple[Callable, Any, np.ndarray, Any]] = None
+
+    def get(self, function: Callable, xdata, params: Sequence, *args):
+        """Return ``function(*args)``, reusing the cached value if function, xdata, and params are unchanged.
+
+        :param Callable function: Evaluates the intermediates
+        :param xdata: The doses passed to the fit function
+        :param Sequence params: The parameters passed to the fit function (scalars, or arrays for batched fits)
+        :param args: Arguments of ``function``, which must be determined by function, xdata, and params
+        :return: The intermediates
+        """
+        key = np.array(params)
+        entry = self._entry
+        if (
+            entry is not None
+            and entry[0] == function
+            and entry[1] is xdata
+            and entry[2].dtype == key.dtype
+            and entry[2].shape == key.shape
+            and (entry[2] == key).all()
+        ):
+            return entry[3]
+        value = function(*args)
+        self._entry = (function, xdata, key, value)
+        return value
+
+    def clear(self):
+        """Drop the cached intermediates."""
+        self._entry = None
+
+    def __getstate__(self):
+        return {"_entry": None}
+
+
+class EvaluationWorkspace:
+    """Scratch arrays that a model reuses between evaluations, rather than allocating temporaries on every call.
+
+    Fits evaluate a model many times at the same doses, so ``get()`` keeps the most recently requested arrays and
+    returns them again while their shape and dtype are unchanged. One caller holds them at a time: a concurrent (or
+    nested) caller gets freshly allocated arrays instead. The arrays are not copied when the workspace is pickled or
+    deep-copied.
+    """
+
+    def __init__(self):
+        """Ctor."""
+        self._buffers: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def get(self, n_arrays: int, shape: Tuple[int, ...], dtype):
+        """Lend n_arrays uninitialized arrays of the given shape and dtype, stacked in one array.
+
+        :param int n_arrays: Number of arrays
+        :param Tuple[int, ...] shape: Shape of each array
+        :param dtype: dtype of the arrays
+        """
+        acquired = self._lock.acquire(blocking=False)
+        try:
+            buffers = self._buffers if acquired else None
+            if buffers is None or buffers.shape != (n_arrays, *shape) or buffers.dtype != dtype:
+                buffers = np.empty((n_arrays, *shape), dtype=dtype)
+                if acquired:
+                    self._buffers = buffers
+            yield buffers
+        finally:
+            if acquired:
+                self._lock.release()
+
+    def clear(self):
+        """Release the scratch arrays."""
+        self._buffers = None
+
+    def __getstate__(self):
+        return {}
+
+    def __setstate__(self, state):
+        self._buffers = None
+        self._lock = threading.Lock()
+
 
 class ParametricModelMixins:
     """Utility functions for parametric models."""
@@ -88,11 +390,91 @@ class ParametricModelMixins:
         model._bounds = lower_bounds, upper_bounds
         return lower_bounds, upper_bounds
 
+    @staticmethod
+    def pop_bootstrap_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Remove options that configure bootstrapping from kwargs.
+
+        Models' fit() methods receive bootstrap options mixed in with kwargs for ``scipy.optimize.curve_fit()``. This
+        separates them so they can be passed to ``bootstrap_parameter_ranges()``.
+
+        :param Dict[str, Any] kwargs: The kwargs passed to fit(). Bootstrap options are removed in place.
+        :return Dict[str, Any]: The bootstrap options that were found in kwargs.
+        """
+        return {key: kwargs.pop(key) for key in _BOOTSTRAP_KWARGS if key in kwargs}
+
+    @staticmethod
+    def pop_use_jacobian(model, kwargs: Dict[str, Any]) -> Union[bool, str]:
+        """Remove the use_jacobian option from kwargs, and validate it.
+
+        By default, the Jacobian is used if the model has one. The Jacobian each fit uses is chosen from this option by
+        ``get_jacobian_function()``.
+
+        :param model: The model being fit
+        :param Dict[str, Any] kwargs: The kwargs passed to fit(). use_jacobian is removed in place.
+        :return Union[bool, str]: True, False, or "auto"
+        """
+        use_jacobian = kwargs.pop("use_jacobian", getattr(model, "jacobian_function", None) is not None)
+        if isinstance(use_jacobian, str) and use_jacobian != "auto":
+            raise ValueError(f'use_jacobian must be True, False, or "auto" ({use_jacobian})')
+        return use_jacobian
+
+    @staticmethod
+    def get_jacobian_function(model, use_jacobian: Union[bool, str]) -> Optional[Callable]:
+        """Return the Jacobian a fit should use, or None to approximate it with finite differences.
+
+        If use_jacobian is "auto", a model without an analytic Jacobian is differentiated by complex steps. The
+        ``ComplexStepJacobian`` is made for each fit from the model's current fit_function (so, e.g., bootstrap
+        refits count its evaluations), and the model itself is not changed.
+
+        :param model: The model being fit
+        :param Union[bool, str] use_jacobian: True, False, or "auto"
+        :return Optional[Callable]: The Jacobian function, called like ``model.fit_function``
+        """
+        if not use_jacobian:
+            return None
+        jacobian_function = getattr(model, "jacobian_function", None)
+        if jacobian_function is None and use_jacobian == "auto":
+            return ComplexStepJacobian(model.fit_function, batched=getattr(model, "_batch_fit_supported", False))
+        return jacobian_function
+
+    @staticmethod
+    @contextmanager
+    def fit_context(model, doses):
+        """Set model._fit_context to a FitContext of the doses for the body of a fit.
+
+        However the body exits, including by raising, the fit is then ended with model._end_fit(), which releases the
+        context and anything else the model caches for the duration of a fit.
+
+        :param model: The model being fit
+        :param doses: The doses as passed to fit functions: d for 1D models, or (d1, d2) for 2D models
+        """
+        model._fit_context = FitContext(doses)
+        try:
+            yield model._fit_context
+        finally:
+            model._end_fit()
+
     @staticmethod
     def bootstrap_parameter_ranges(
-        model, E, use_jacobian: bool, bootstrap_iterations: int, max_iterations: int, *args, **kwargs
+        model,
+        E,
+        use_jacobian: Union[bool, str],
+        bootstrap_iterations: int,
+        max_iterations: int,
+        *args,
+        n_jobs: int = 1,
+        executor: Union[str, Executor] = "process",
+        seed=None,
+        bootstrap_solver: str = "curve_fit",
+        bootstrap_tol: Optional[float] = None,
+        bootstrap_window: int = 50,
+        bootstrap_confidence_interval: float = 95,
+        bootstrap_timeout: Optional[float] = None,
+        bootstrap_max_nfev: Optional[int] = None,
+        bootstrap_fail_fast: bool = True,
+        **kwargs,
     ):
-        """Identify confidence intervals for parameters using bootstrap resampling.
+        r"""Identify confidence intervals for parameters using bootstrap resampling.
 
         Residuals are randomly sampled from a normal distribution with :math:`\sigma = \sqrt{\frac{RSS}{n - N}}`
         where :math:`RSS` is the residual sum of square, :math:`n` is the number of data points, and :math:`N` is the
@@ -103,21 +485,58 @@ class ParametricModelMixins:
 
         If fewer than ```bootstrap_iterations``` iterations converge, a warning is logged, but no error is raised.
 
+        If ``bootstrap_tol`` is given, bootstrapping is adaptive: after every ``bootstrap_window`` iterations the
+        ``bootstrap_confidence_interval`` confidence intervals of each parameter are recomputed, and iterations stop as
+        soon as no interval bound has moved by more than ``bootstrap_tol`` times that interval's width.
+        ``bootstrap_iterations`` is then an upper limit on the number of converged iterations.
+
+        Bootstrapping also stops early if it runs past ``bootstrap_timeout`` seconds or ``bootstrap_max_nfev`` model
+        evaluations, or (if ``bootstrap_fail_fast``) once so many iterations have failed that, even at the upper 99%
+        confidence bound of the success rate, ``bootstrap_iterations`` would not converge within ``max_iterations``.
+        Whichever iterations converged are kept, and ```model.bootstrap_status``` records why bootstrapping stopped.
+
+        Each bootstrap iteration draws its noise from an independent random stream spawned from a single
+        ``np.random.SeedSequence``, so the result depends only on ``seed`` and not on ``n_jobs`` or how iterations are
+        distributed among workers.
+
         :param model: The model to bootstrap.
         :param ArrayLike E: The observed values.
-        :param bool use_jacobian: Whether to use the Jacobian when fitting the model.
+        :param Union[bool, str] use_jacobian: Whether to use the Jacobian when fitting the model.
         :param int bootstrap_iterations: The number of bootstrap iterations to perform.
         :param int max_iterations: The maximum number of iterations to perform when fitting the model.
         :param args: Args to pass to model.E() to get model predicted values.
+        :param int n_jobs: The number of workers used to run bootstrap iterations. If 1, iterations are run serially in
+            this process. If -1, one worker is used per CPU.
+        :param Union[str, Executor] executor: Either "process" or "thread" to choose the kind of pool created when
+            ``n_jobs != 1``, or an existing ``concurrent.futures.Executor`` to submit iterations to.
+        :param seed: Seed for the random number generator. Anything accepted by ``np.random.SeedSequence``, or a
+            SeedSequence itself. If None, a seed is drawn from numpy's global random state.
+        :param str bootstrap_solver: "curve_fit" to refit each iteration separately, or "batch" to refit all iterations
+            in a chunk at once using ``synergy.utils.optimize.batch_curve_fit()``. "batch" is only available for models
+            that support it (Hill, Hill_2P, and 2D MuSyC), and otherwise falls back to "curve_fit".
+        :param Optional[float] bootstrap_tol: If given, stop once confidence intervals change by less than this
+            fraction of their width over ``bootstrap_window`` iterations.
+        :param int bootstrap_window: Number of iterations between checks of whether confidence intervals are stable.
+        :param float bootstrap_confidence_interval: % confidence interval whose stability is checked
+        :param Optional[float] bootstrap_timeout: Maximum wall-clock time to spend bootstrapping, in seconds.
+        :param Optional[int] bootstrap_max_nfev: Maximum number of model evaluations to spend bootstrapping.
+        :param bool bootstrap_fail_fast: Whether to stop once enough iterations are unlikely to converge.
         :param kwargs: Additional arguments to pass to the model's _fit method.
         """
         if bootstrap_iterations <= 0:
             model.bootstrap_parameters = None
+            model.bootstrap_status = None
             return
         if not model.is_specified:
             raise ModelNotParameterizedError()
         if not model.is_converged:
             raise ModelNotFitToDataError()
+        if bootstrap_solver not in ("curve_fit", "batch"):
+            raise ValueError(f'bootstrap_solver must be "curve_fit" or "batch" ({bootstrap_solver})')
+        batch = bootstrap_solver == "batch"
+        if batch and not getattr(model, "_batch_fit_supported", False):
+            _LOGGER.warning(f"{type(model).__name__} does not support batch fitting, using curve_fit for bootstrap.")
+            batch = False
 
         n_data_points = len(E)
         n_parameters = len(model.get_parameters())
@@ -127,31 +546,430 @@ class ParametricModelMixins:
         E_model = model.E(*args)
         bootstrap_parameters = []
 
+        adaptive = bootstrap_tol is not None
+        percentiles = [(100 - bootstrap_confidence_interval) / 2.0, 100 - (100 - bootstrap_confidence_interval) / 2.0]
+        previous_bounds = None
+
+        if seed is None:
+            # Draw entropy from the global random state, so np.random.seed() still makes bootstrapping reproducible
+            seed = np.random.randint(0, 2**32, size=4, dtype=np.uint64)
+        seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        pool, n_workers, owns_pool = _get_executor(n_jobs, executor)
+
+        start_time = time.time()
+        deadline = None if bootstrap_timeout is None else start_time + bootstrap_timeout
         count = 0
-        while len(bootstrap_parameters) < bootstrap_iterations and count < max_iterations:
-            count += 1
-            residuals_step = norm.rvs(loc=0, scale=sigma_residuals, size=n_data_points)
+        nfev = 0
+        reason = "complete"
+        try:
+            while len(bootstrap_parameters) < bootstrap_iterations:
+                if count >= max_iterations:
+                    reason = "max_iterations"
+                    break
+                if bootstrap_fail_fast and _success_is_unlikely(
+                    len(bootstrap_parameters), count, bootstrap_iterations, max_iterations
+                ):
+                    reason = "failure_rate"
+                    break
+
+                # Iteration i always uses the i'th child seed, and results are consumed in iteration order, so the
+                # accepted parameters are identical no matter how each round is split among workers.
+                round_size = min(
+                    bootstrap_iterations - len(bootstrap_parameters),
+                    max_iterations - count,
+                    _ROUND_SIZE_PER_WORKER * n_workers,
+                )
+                if adaptive:
+                    round_size = min(round_size, bootstrap_window)
+                iteration_seeds = seed_sequence.spawn(round_size)
+                chunk_args = (model, args, E_model, sigma_residuals, use_jacobian, batch, kwargs)
 
-            # Add random noise to model prediction
-            E_iteration = E_model + residuals_step
+                if pool is None:
+                    round_results, round_nfev = _bootstrap_chunk(
+                        iteration_seeds, *chunk_args, deadline, _remaining(bootstrap_max_nfev, nfev)
+                    )
+                else:
+                    chunk_size = int(np.ceil(round_size / n_workers))
+                    chunk_starts = range(0, round_size, chunk_size)
+                    # Each worker gets an equal share of the remaining function evaluation budget
+                    chunk_max_nfev = _remaining(bootstrap_max_nfev, nfev)
+                    if chunk_max_nfev is not None:
+                        chunk_max_nfev = int(np.ceil(chunk_max_nfev / len(chunk_starts)))
+                    futures = [
+                        pool.submit(
+                            _bootstrap_chunk,
+                            iteration_seeds[start : start + chunk_size],
+                            *chunk_args,
+                            deadline,
+                            chunk_max_nfev,
+                        )
+                        for start in chunk_starts
+                    ]
+                    chunk_results = [future.result() for future in futures]
+                    round_results = [popt for results, _ in chunk_results for popt in results]
+                    round_nfev = sum(chunk_nfev for _, chunk_nfev in chunk_results)
 
-            # Fit noisy data
-            with np.errstate(divide="ignore", invalid="ignore"):
-                popt1 = model._fit(*args, E_iteration, use_jacobian=use_jacobian, **kwargs)
+                nfev += round_nfev
+                for popt1 in round_results:
+                    count += 1
+                    if popt1 is not None:
+                        bootstrap_parameters.append(popt1)
 
-            if popt1 is not None:
-                bootstrap_parameters.append(popt1)
+                if len(bootstrap_parameters) >= bootstrap_iterations:
+                    break
+                if deadline is not None and time.time() >= deadline:
+                    reason = "timeout"
+                    break
+                if bootstrap_max_nfev is not None and nfev >= bootstrap_max_nfev:
+                    reason = "nfev_budget"
+                    break
 
-        if len(bootstrap_parameters) < bootstrap_iterations:
+                if bootstrap_tol is not None and len(bootstrap_parameters) >= bootstrap_window:
+                    bounds = np.percentile(np.vstack(bootstrap_parameters), percentiles, axis=0)
+                    if previous_bounds is not None and _intervals_are_stable(previous_bounds, bounds, bootstrap_tol):
+                        reason = "stabilized"
+                        break
+                    previous_bounds = bounds
+        finally:
+            if owns_pool:
+                pool.shutdown()  # type: ignore
+
+        status = BootstrapStatus(reason, count, len(bootstrap_parameters), nfev, time.time() - start_time)
+        model.bootstrap_status = status
+        if status.reason == "stabilized":
+            _LOGGER.info(f"Bootstrap confidence intervals stabilized after {count} iterations.")
+        elif status.reason == "max_iterations":
             _LOGGER.warning(
                 f"Bootstrap reached max_iterations={max_iterations} before converging {bootstrap_iterations} times."
             )
+        elif status.partial:
+            _LOGGER.warning(
+                f"Bootstrap stopped early ({status.reason}) after {count} iterations, with "
+                f"{len(bootstrap_parameters)} of {bootstrap_iterations} converged."
+            )
         if len(bootstrap_parameters) > 0:
             model.bootstrap_parameters = np.vstack(bootstrap_parameters)
         else:
             _LOGGER.warning("No bootstrap iterations successfully converged.")
             model.bootstrap_parameters = None
 
+    @staticmethod
+    def parameter_covariance(model, xdata, E, use_jacobian: Union[bool, str]) -> np.ndarray:
+        r"""Estimate the asymptotic covariance of the fit parameters from the Jacobian at the optimum.
+
+        The covariance is :math:`s^2 (J^T J)^{-1}` where :math:`J` is the Jacobian of the model with respect to the
+        parameters in fit space (e.g., logh, logC) and :math:`s^2 = \frac{RSS}{n - N}`. This is the same estimate as
+        the ``pcov`` returned by ``scipy.optimize.curve_fit()``.
+
+        :param model: A model that has been fit to data
+        :param xdata: The doses, as passed to ``model.fit_function()``
+        :param ArrayLike E: The observed values
+        :param Union[bool, str] use_jacobian: Which Jacobian to use (see ``get_jacobian_function()``). If none, the
+            Jacobian is approximated with forward differences.
+        :return np.ndarray: Covariance matrix of the fit-space parameters, shape (n_parameters, n_parameters). If the
+            Jacobian is singular, all entries are inf.
+        """
+        popt = _fit_space_parameters(model)
+        n_data_points, n_parameters = len(E), len(popt)
+
+        jacobian_function = ParametricModelMixins.get_jacobian_function(model, use_jacobian)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            if jacobian_function is not None:
+                jacobian = np.asarray(jacobian_function(xdata, *popt), dtype=float)
+            else:
+                jacobian = _finite_difference_jacobian(model.fit_function, xdata, popt)
+
+        sigma_squared = model.sum_of_squares_residuals / (n_data_points - n_parameters)
+        try:
+            if not np.isfinite(jacobian).all():
+                raise np.linalg.LinAlgError("Jacobian is not finite")
+            return sigma_squared * np.linalg.inv(jacobian.T @ jacobian)
+        except np.linalg.LinAlgError:
+            return np.full((n_parameters, n_parameters), np.inf)
+
+    @staticmethod
+    def get_ci_method(model, ci_method: Optional[str]) -> str:
+        """Choose how to calculate confidence intervals for a fit model.
+
+        :param model: The model
+        :param Optional[str] ci_method: "bootstrap", "covariance", "profile", or None to use whichever is available (in
+            that order of preference)
+        :return str: The method to use
+        """
+        if ci_method is None:
+            if model.bootstrap_parameters is not None:
+                ci_method = "bootstrap"
+            elif model.parameter_profiles is not None:
+                ci_method = "profile"
+            else:
+                ci_method = "covariance"
+        if ci_method not in CI_METHODS:
+            raise ValueError(f"ci_method must be one of {CI_METHODS} ({ci_method})")
+        if ci_method == "bootstrap" and model.bootstrap_parameters is None:
+            raise ValueError(
+                "Model must have been fit with bootstrap_iterations > 0 to get bootstrap confidence intervals"
+            )
+        if ci_method == "covariance" and model.parameter_covariance is None:
+            raise ValueError(
+                'Model must have been fit with bootstrap_iterations > 0 or ci_method="covariance" to get parameter '
+                "confidence intervals"
+            )
+        if ci_method == "profile" and model.parameter_profiles is None:
+            raise ValueError('Model must have been fit with ci_method="profile" to get profile likelihood intervals')
+        return ci_method
+
+    @staticmethod
+    def covariance_confidence_intervals(model, confidence_interval: float) -> np.ndarray:
+        """Calculate asymptotic (Laplace) confidence intervals from ``model.parameter_covariance``.
+
+        Intervals are symmetric in fit space, clipped to the fit bounds, and transformed back to linear space, so (for
+        instance) intervals for h and C are symmetric in log-space.
+
+        :param model: A model fit with ``ci_method="covariance"``
+        :param float confidence_interval: % confidence interval
+        :return np.ndarray: Lower and upper bounds of each parameter, shape (n_parameters, 2)
+        """
+        popt = _fit_space_parameters(model)
+        half_width = _normal_quantile(confidence_interval) * np.sqrt(np.diag(model.parameter_covariance))
+        lower_bounds, upper_bounds = model._bounds
+        lower = np.clip(popt - half_width, lower_bounds, upper_bounds)
+        upper = np.clip(popt + half_width, lower_bounds, upper_bounds)
+        return _transform_intervals_from_fit(model, lower, upper)
+
+    @staticmethod
+    def profile_likelihood(
+        model,
+        xdata,
+        E,
+        use_jacobian: Union[bool, str],
+        profile_confidence_interval: float = 99,
+        n_jobs: int = 1,
+        executor: Union[str, Executor] = "process",
+        max_steps: int = 30,
+        **kwargs,
+    ) -> None:
+        r"""Calculate the profile likelihood of every parameter, and store it as ```model.parameter_profiles```.
+
+        Each parameter is stepped away from the optimum in both directions. At each step, all other parameters are
+        re-optimized starting from the optimum of the previous step, until the likelihood ratio statistic crosses the
+        :math:`\chi^2_1` threshold for ``profile_confidence_interval``. Steps are sized by the asymptotic standard error
+        from ```model.parameter_covariance``` (which must already be set), and parameters are profiled in parallel.
+
+        If a profile takes ``max_steps`` steps (or a re-optimization fails) before crossing the threshold or reaching
+        the parameter's bound, a warning is logged, and confidence intervals are nan on that side.
+
+        :param model: A model that has been fit to data
+        :param xdata: The doses, as passed to ``model.fit_function()``
+        :param ArrayLike E: The observed values
+        :param Union[bool, str] use_jacobian: Whether to use the Jacobian when re-optimizing
+        :param float profile_confidence_interval: Largest % confidence interval the profiles must cover
+        :param int n_jobs: The number of workers used to profile parameters. If -1, one worker is used per CPU.
+        :param Union[str, Executor] executor: "process", "thread", or an existing ``concurrent.futures.Executor``
+        :param int max_steps: Maximum number of steps to take in each direction
+        :param kwargs: Additional arguments to pass to ``scipy.optimize.curve_fit()``
+        """
+        if max_steps < 1:
+            raise ValueError(f"max_steps must be at least 1 ({max_steps})")
+        popt = _fit_space_parameters(model)
+        with np.errstate(invalid="ignore"):
+            standard_error = np.sqrt(np.diag(model.parameter_covariance))
+        steps = np.where(np.isfinite(standard_error) & (standard_error > 0), _PROFILE_STEP_SCALE * standard_error, 0.1)
+        threshold = chi2.ppf(profile_confidence_interval / 100.0, 1)
+        kwargs.pop("p0", None)
+
+        task_args = (model, xdata, E, popt, use_jacobian, threshold, max_steps, kwargs)
+        pool, _, owns_pool = _get_executor(n_jobs, executor)
+        try:
+            if pool is None:
+                profiles = [_profile_parameter(idx, steps[idx], *task_args) for idx in range(len(popt))]
+            else:
+                futures = [pool.submit(_profile_parameter, idx, steps[idx], *task_args) for idx in range(len(popt))]
+                profiles = [future.result() for future in futures]
+        finally:
+            if owns_pool:
+                pool.shutdown()  # type: ignore
+
+        names = model._parameter_names
+        for name, (_, _, truncated) in zip(names, profiles):
+            for side, is_truncated in zip(("below", "above"), truncated):
+                if is_truncated:
+                    _LOGGER.warning(
+                        f"The profile likelihood of {name} stopped {side} the optimum before crossing the threshold "
+                        f"for a {profile_confidence_interval}% confidence interval, so its confidence intervals are "
+                        "nan on that side. Increase profile_max_steps to extend it."
+                    )
+        model.parameter_profiles = ProfileLikelihood(
+            values={name: values for name, (values, _, _) in zip(names, profiles)},
+            rss={name: rss for name, (_, rss, _) in zip(names, profiles)},
+            rss_min=model.sum_of_squares_residuals,
+            n_data_points=len(E),
+            max_confidence_interval=profile_confidence_interval,
+            truncated={name: truncated for name, (_, _, truncated) in zip(names, profiles)},
+        )
+
+    @staticmethod
+    def profile_confidence_intervals(model, confidence_interval: float) -> np.ndarray:
+        """Calculate profile likelihood confidence intervals from ``model.parameter_profiles``.
+
+        :param model: A model fit with ``ci_method="profile"``
+        :param float confidence_interval: % confidence interval, which can be at most the
+            ``profile_confidence_interval`` the model was fit with
+        :return np.ndarray: Lower and upper bounds of each parameter, shape (n_parameters, 2)
+        """
+        profiles = model.parameter_profiles
+        if confidence_interval > profiles.max_confidence_interval:
+            raise ValueError(
+                f"Profiles were only calculated for confidence intervals up to {profiles.max_confidence_interval}%. "
+                f"Refit with profile_confidence_interval >= {confidence_interval}."
+            )
+        lower_bounds, upper_bounds = model._bounds
+        intervals = np.asarray(
+            [
+                profiles.interval(name, confidence_interval, lower_bounds[idx], upper_bounds[idx])
+                for idx, name in enumerate(model._parameter_names)
+            ]
+        )
+        return _transform_intervals_from_fit(model, intervals[:, 0], intervals[:, 1])
+
+    @staticmethod
+    def delta_method_interval(model, function: Callable, confidence_interval: float) -> np.ndarray:
+        """Calculate an asymptotic confidence interval for a quantity derived from the parameters.
+
+        The variance of ``function`` is propagated from ``model.parameter_covariance`` using its gradient with respect
+        to the fit-space parameters (the delta method).
+
+        :param model: A model fit with ``ci_method="covariance"``
+        :param Callable function: Maps a list of the model's parameters (in linear space) to the derived quantity
+        :param float confidence_interval: % confidence interval
+        :return np.ndarray: The lower and upper bound of the derived quantity
+        """
+        popt = _fit_space_parameters(model)
+
+        def function_of_fit_params(params):
+            return function(np.asarray(model._transform_params_from_fit(params), dtype=float))
+
+        value = function_of_fit_params(popt)
+        gradient = np.zeros(len(popt))
+        for idx in range(len(popt)):
+            step = 1e-6 * max(1.0, abs(popt[idx]))
+            params_up, params_down = popt.copy(), popt.copy()
+            params_up[idx] += step
+            params_down[idx] -= step
+            gradient[idx] = (function_of_fit_params(params_up) - function_of_fit_params(params_down)) / (2 * step)
+
+        standard_error = np.sqrt(gradient @ model.parameter_covariance @ gradient)
+        half_width = _normal_quantile(confidence_interval) * standard_error
+        return np.asarray([value - half_width, value + half_width])
+
+    @staticmethod
+    def variable_projection_fit(model, xdata, E, use_jacobian: Union[bool, str], **kwargs) -> np.ndarray:
+        """Fit a model whose linear parameters are solved in closed form inside each nonlinear iteration.
+
+        For fixed nonlinear parameters θ, the model is ``A(θ) @ linear_parameters + offset(θ)``, so the linear
+        parameters minimizing the residuals are found by linear least squares (or by bounded linear least squares, if
+        any of their bounds are finite). Only θ is optimized with ``scipy.optimize.least_squares()``, using the
+        variable projection functional. This shrinks the nonlinear search space, which typically takes far fewer
+        iterations and converges more reliably.
+
+        The model must define ``_linear_parameter_indices`` (indices of the linear parameters in fit space) and
+        ``_design_matrix(xdata, *nonlinear_params)``, which returns ``(A, offset)``. When ``use_jacobian`` selects a
+        Jacobian (see ``get_jacobian_function()``), it is projected onto the nonlinear parameters (Kaufman's
+        approximation).
+
+        :param model: The model to fit
+        :param xdata: Doses, as passed to ``model.fit_function``
+        :param ArrayLike E: Observed effects
+        :param Union[bool, str] use_jacobian: Whether to use the model's jacobian, rather than finite differences
+        :param kwargs: ``p0`` (in fit space), and ``max_nfev`` (or ``maxfev``), ``ftol``, ``xtol``, and ``gtol`` for
+            ``scipy.optimize.least_squares()``. Other ``curve_fit()`` options are ignored.
+        :return np.ndarray: The optimal parameters in fit space
+        :raises RuntimeError: If the optimization fails, like ``scipy.optimize.curve_fit()``
+        """
+        E = np.asarray(E, dtype=float)
+        p0 = np.asarray(kwargs["p0"], dtype=float)
+        jacobian_function = ParametricModelMixins.get_jacobian_function(model, use_jacobian)
+        lower, upper = (np.asarray(bound, dtype=float) for bound in model._bounds)
+        is_linear = np.zeros(len(p0), dtype=bool)
+        is_linear[list(model._linear_parameter_indices)] = True
+        linear_bounds = (lower[is_linear], upper[is_linear])
+        nonlinear_bounds = (lower[~is_linear], upper[~is_linear])
+        bounded = not (np.all(np.isneginf(linear_bounds[0])) and np.all(np.isposinf(linear_bounds[1])))
+
+        # least_squares() evaluates the jacobian at the point whose residuals it just calculated, so remember the
+        # linear solution there rather than solving for it again
+        cache: Dict[str, Any] = {}
+
+        def solve(theta):
+            if cache.get("theta") is None or not np.array_equal(cache["theta"], theta):
+                A, offset = model._design_matrix(xdata, *theta)
+                A = np.where(np.isfinite(A), A, 0)
+                offset = np.where(np.isfinite(offset), offset, 0)
+                linear, free, A_pinv = _solve_linear_parameters(A, E - offset, linear_bounds, bounded)
+                cache.update(
+                    theta=np.array(theta, copy=True), A=A, offset=offset, linear=linear, free=free, A_pinv=A_pinv
+                )
+            return cache
+
+        def full_parameters(theta, linear):
+            params = np.empty(len(p0))
+            params[is_linear] = linear
+            params[~is_linear] = theta
+            return params
+
+        def residuals(theta):
+            state = solve(theta)
+            return state["A"] @ state["linear"] + state["offset"] - E
+
+        jacobian = None
+        if jacobian_function is not None:
+
+            def jacobian(theta):
+                state = solve(theta)
+                full_jacobian = np.asarray(jacobian_function(xdata, *full_parameters(theta, state["linear"])))
+                J = np.reshape(full_jacobian, (len(E), len(p0)))[:, ~is_linear]
+                J[~np.isfinite(J)] = 0
+                A_free = state["A"][:, state["free"]]
+                if A_free.shape[1] > 0:
+                    J = J - A_free @ (state["A_pinv"] @ J)
+                return J
+
+        solver_kwargs = {key: kwargs[key] for key in ["ftol", "xtol", "gtol"] if kwargs.get(key) is not None}
+        max_nfev = kwargs.get("max_nfev", kwargs.get("maxfev"))
+        if max_nfev is not None:
+            solver_kwargs["max_nfev"] = max_nfev
+        unbounded = np.all(np.isneginf(nonlinear_bounds[0])) and np.all(np.isposinf(nonlinear_bounds[1]))
+
+        theta0 = np.clip(p0[~is_linear], *nonlinear_bounds)
+        # Both solvers size their first trust region from |theta0|, so a start that is zero up to round-off (e.g. log h
+        # for h == 1) would take vanishingly small steps and stop at p0. At exactly zero they start from a unit region.
+        theta0[np.abs(theta0) < np.sqrt(np.finfo(float).eps)] = 0
+        if unbounded and len(E) >= len(theta0):
+            # Like curve_fit(), call MINPACK directly when the nonlinear parameters are unbounded
+            if "max_nfev" in solver_kwargs:
+                solver_kwargs["maxfev"] = solver_kwargs.pop("max_nfev")
+            theta, _, _, message, status = leastsq(
+                residuals,
+                theta0,
+                Dfun=jacobian,
+                full_output=True,
+                **solver_kwargs,
+            )
+            if status not in [1, 2, 3, 4]:
+                raise RuntimeError("Optimal parameters not found: " + message)
+        else:
+            result = least_squares(
+                residuals,
+                theta0,
+                jac=jacobian if jacobian is not None else "2-point",
+                bounds=nonlinear_bounds,
+                method="trf",
+                **solver_kwargs,
+            )
+            if result.status <= 0:
+                raise RuntimeError("Optimal parameters not found: " + result.message)
+            theta = result.x
+        return full_parameters(theta, solve(theta)["linear"])
+
     @staticmethod
     def make_summary_row(
         key: str,
@@ -251,3 +1069,325 @@ class ParametricModelMixins:
         if not candidates:
             return ""
         return max(candidates, key=len)
+
+
+def _solve_linear_parameters(
+    A, y, bounds: Tuple[np.ndarray, np.ndarray], bounded: bool
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Solve for the linear parameters of a separable model, used by variable projection.
+
+    Bounded least squares is only needed when the unconstrained solution violates a bound, since otherwise (the
+    problem being convex) it is also the constrained solution.
+
+    :param A: Design matrix, shape (M, L)
+    :param y: Observations minus the model's offset, shape (M,)
+    :param Tuple[np.ndarray, np.ndarray] bounds: Lower and upper bounds of the linear parameters
+    :param bool bounded: Whether any bounds are finite
+    :return Tuple[np.ndarray, np.ndarray, np.ndarray]: The linear parameters, a mask of those not pinned at a bound,
+        and the pseudo-inverse of the columns of A for those parameters
+    """
+    A_pinv = np.linalg.pinv(A)
+    linear = A_pinv @ y
+    free = np.ones(A.shape[1], dtype=bool)
+    if bounded and np.any((linear < bounds[0]) | (linear > bounds[1])):
+        result = lsq_linear(A, y, bounds=bounds, method="bvls")
+        linear, free = result.x, result.active_mask == 0
+        A_pinv = np.linalg.pinv(A[:, free])
+    return linear, free, A_pinv
+
+
+def _get_executor(n_jobs: int, executor: Union[str, Executor]) -> Tuple[Optional[Executor], int, bool]:
+    """Get the executor used to distribute bootstrap iterations.
+
+    :param int n_jobs: Number of workers. 1 runs serially, -1 uses one worker per CPU.
+    :param Union[str, Executor] executor: "process", "thread", or an existing Executor.
+    :return Tuple[Optional[Executor], int, bool]: The executor (None to run serially), the number of workers to split
+        work among, and whether the executor was created here (and so must be shut down by the caller).
+    """
+    n_workers = n_jobs if n_jobs > 0 else (os.cpu_count() or 1)
+    if isinstance(executor, Executor):
+        return executor, n_workers, False
+    if n_workers == 1:
+        return None, 1, False
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=n_workers), n_workers, True
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=n_workers), n_workers, True
+    raise ValueError(f'executor must be "process", "thread", or a concurrent.futures.Executor ({executor})')
+
+
+def _fit_space_parameters(model) -> np.ndarray:
+    """Get a model's current parameters, transformed to the scale used for fitting."""
+    return np.asarray(
+        model._transform_params_to_fit([getattr(model, name) for name in model._parameter_names]), dtype=float
+    )
+
+
+def _transform_intervals_from_fit(model, lower, upper) -> np.ndarray:
+    """Transform lower and upper bounds of each parameter from fit space to linear space, shape (n_parameters, 2)."""
+    with np.errstate(over="ignore"):
+        return np.column_stack(
+            [
+                np.asarray(model._transform_params_from_fit(lower), dtype=float),
+                np.asarray(model._transform_params_from_fit(upper), dtype=float),
+            ]
+        )
+
+
+def _threshold_crossing(values: np.ndarray, statistic: np.ndarray, threshold: float, default: float) -> float:
+    """Linearly interpolate where a profile, ordered moving away from the optimum, first exceeds the threshold.
+
+    :return float: The interpolated crossing, or default if the profile never exceeds the threshold
+    """
+    above = np.where(statistic > threshold)[0]
+    if len(above) == 0:
+        return default
+    i = above[0]
+    if i == 0:
+        return values[0]
+    fraction = (threshold - statistic[i - 1]) / (statistic[i] - statistic[i - 1])
+    return values[i - 1] + fraction * (values[i] - values[i - 1])
+
+
+def _profile_parameter(
+    idx: int,
+    step: float,
+    model,
+    xdata,
+    E,
+    popt: np.ndarray,
+    use_jacobian: Union[bool, str],
+    threshold: float,
+    max_steps: int,
+    kwargs: Dict[str, Any],
+) -> Tuple[np.ndarray, np.ndarray, Tuple[bool, bool]]:
+    """Profile the likelihood of one parameter.
+
+    This is defined at module level so that it can be sent to a ProcessPoolExecutor.
+
+    :param int idx: Index of the parameter to profile
+    :param float step: Fit-space step size
+    :param model: The fit model
+    :param xdata: The doses, as passed to ``model.fit_function()``
+    :param ArrayLike E: The observed values
+    :param np.ndarray popt: Fit-space parameters at the optimum
+    :param Union[bool, str] use_jacobian: Whether to use the Jacobian when re-optimizing
+    :param float threshold: Stop stepping once the likelihood ratio statistic exceeds this
+    :param int max_steps: Maximum number of steps to take in each direction
+    :param Dict[str, Any] kwargs: Additional arguments to pass to ``scipy.optimize.curve_fit()``
+    :return Tuple[np.ndarray, np.ndarray, Tuple[bool, bool]]: Sorted fit-space parameter values, the residual sum of
+        squares at each, and whether the profile was truncated below and above the optimum (stopping before it crossed
+        the threshold or reached a bound)
+    """
+    lower_bounds, upper_bounds = (np.broadcast_to(np.asarray(b, dtype=float), popt.shape) for b in model._bounds)
+    free = np.arange(len(popt)) != idx
+    rss_min = model.sum_of_squares_residuals
+    values, rss = [popt[idx]], [rss_min]
+    truncated = []
+
+    for direction in (-1, 1):
+        p_free = popt[free]
+        finished = False
+        for i in range(1, max_steps + 1):
+            value = np.clip(popt[idx] + direction * i * step, lower_bounds[idx], upper_bounds[idx])
+            p_free = _fit_with_fixed_parameter(model, xdata, E, idx, value, p_free, use_jacobian, kwargs)
+            if p_free is None:
+                break
+            with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+                residuals = E - model.fit_function(xdata, *np.insert(p_free, idx, value))
+            step_rss = np.sum(residuals**2)
+            if not np.isfinite(step_rss):
+                break
+            values.append(value)
+            rss.append(step_rss)
+            if len(E) * np.log(step_rss / rss_min) > threshold:
+                finished = True
+                break
+            if value <= lower_bounds[idx] or value >= upper_bounds[idx]:
+                finished = True
+                break
+        truncated.append(not finished)
+
+    order = np.argsort(values)
+    return np.asarray(values)[order], np.asarray(rss)[order], (truncated[0], truncated[1])
+
+
+def _fit_with_fixed_parameter(
+    model, xdata, E, idx: int, value: float, p0, use_jacobian: Union[bool, str], kwargs: Dict[str, Any]
+) -> Optional[np.ndarray]:
+    """Optimize all fit-space parameters except one, which is held at value.
+
+    :return Optional[np.ndarray]: The optimized free parameters, or None if the optimizer failed
+    """
+    lower_bounds, upper_bounds = (
+        np.delete(np.broadcast_to(np.asarray(b, dtype=float), len(p0) + 1), idx) for b in model._bounds
+    )
+
+    def fit_function(x, *free_params):
+        return model.fit_function(x, *np.insert(free_params, idx, value))
+
+    jacobian_function = ParametricModelMixins.get_jacobian_function(model, use_jacobian)
+    jac = None
+    if jacobian_function is not None:
+
+        def jac(x, *free_params):
+            return np.delete(jacobian_function(x, *np.insert(free_params, idx, value)), idx, axis=-1)
+
+    try:
+        # The covariance of the free parameters is not needed, so ignore warnings that it could not be estimated
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", OptimizeWarning)
+            p_free = curve_fit(
+                fit_function,
+                xdata,
+                E,
+                p0=np.clip(p0, lower_bounds, upper_bounds),
+                bounds=(lower_bounds, upper_bounds),
+                jac=jac,
+                **kwargs,
+            )[0]
+    except (RuntimeError, ValueError):
+        return None
+    if np.isnan(p_free).any():
+        return None
+    return p_free
+
+
+def _normal_quantile(confidence_interval: float) -> float:
+    """Number of standard deviations spanned by each half of a two-sided % confidence interval."""
+    return norm.ppf(0.5 + confidence_interval / 200.0)
+
+
+def _finite_difference_jacobian(function: Callable, xdata, params: np.ndarray) -> np.ndarray:
+    """Approximate the Jacobian of function(xdata, *params) with respect to params using forward differences."""
+    f0 = np.asarray(function(xdata, *params), dtype=float)
+    columns = []
+    for idx in range(len(params)):
+        step = 1e-8 * max(1.0, abs(params[idx]))
+        params_step = params.copy()
+        params_step[idx] += step
+        columns.append((np.asarray(function(xdata, *params_step), dtype=float) - f0) / step)
+    return np.column_stack(columns)
+
+
+def _remaining(budget: Optional[int], used: int) -> Optional[int]:
+    """Get how much of a budget remains, or None if there is no budget."""
+    if budget is None:
+        return None
+    return max(budget - used, 0)
+
+
+def _success_is_unlikely(n_converged: int, n_attempted: int, n_required: int, max_attempts: int) -> bool:
+    """Check whether too many bootstrap iterations have failed for enough to converge within the remaining attempts.
+
+    Uses the Clopper-Pearson upper bound on the success rate, so this only triggers when finishing is unlikely even if
+    the true success rate is much better than has been observed so far.
+
+    :param int n_converged: Number of iterations that have converged so far
+    :param int n_attempted: Number of iterations attempted so far
+    :param int n_required: Total number of converged iterations needed
+    :param int max_attempts: Total number of iterations that may be attempted
+    :return bool: True if finishing is statistically unlikely
+    """
+    if n_attempted == 0 or n_converged == n_attempted:
+        return False
+    success_rate_upper_bound = beta_distribution.ppf(_FAIL_FAST_CONFIDENCE, n_converged + 1, n_attempted - n_converged)
+    return (n_required - n_converged) > success_rate_upper_bound * (max_attempts - n_attempted)
+
+
+def _intervals_are_stable(previous_bounds: np.ndarray, bounds: np.ndarray, tol: float) -> bool:
+    """Check whether confidence interval bounds have moved by less than tol times the width of each interval.
+
+    :param np.ndarray previous_bounds: Lower and upper bounds from the previous check, shape (2, n_parameters)
+    :param np.ndarray bounds: Current lower and upper bounds, shape (2, n_parameters)
+    :param float tol: Allowed change, relative to interval width
+    :return bool: True if every bound has moved by no more than the allowed change
+    """
+    width = np.abs(bounds[1] - bounds[0])
+    change = np.abs(bounds - previous_bounds)
+    return bool(np.all(change <= tol * width))
+
+
+def _bootstrap_chunk(
+    iteration_seeds: Sequence[np.random.SeedSequence],
+    model,
+    args: Sequence[Any],
+    E_model,
+    sigma_residuals: float,
+    use_jacobian: Union[bool, str],
+    batch: bool,
+    kwargs: Dict[str, Any],
+    deadline: Optional[float] = None,
+    max_nfev: Optional[int] = None,
+) -> Tuple[List[Any], int]:
+    """Run a contiguous block of bootstrap iterations.
+
+    This is defined at module level so that it can be sent to a ProcessPoolExecutor.
+
+    If the deadline passes or max_nfev model evaluations are used, the remaining iterations are skipped, so fewer
+    results than iteration_seeds may be returned.
+
+    :param Sequence[np.random.SeedSequence] iteration_seeds: One seed per iteration to run
+    :param model: The model to refit
+    :param Sequence[Any] args: Doses to pass to model._fit()
+    :param ArrayLike E_model: The model's predicted values at the doses
+    :param float sigma_residuals: Standard deviation of noise added to E_model
+    :param Union[bool, str] use_jacobian: Whether to use the Jacobian when fitting the model
+    :param bool batch: Whether to refit all iterations at once with ``model._fit_batch()``
+    :param Dict[str, Any] kwargs: Additional arguments to pass to the model's _fit method
+    :param Optional[float] deadline: Time (as given by ``time.time()``) after which to stop starting iterations
+    :param Optional[int] max_nfev: Number of model evaluations after which to stop starting iterations
+    :return Tuple[List[Any], int]: The fit parameters for each iteration that was run, or None for iterations that
+        failed to converge, and the number of model evaluations used
+    """
+    # Count model evaluations on a shallow copy, so the count is private to this chunk even when threads share a model
+    model = copy.copy(model)
+    fit_function = _CountingFunction(model.fit_function)
+    model.fit_function = fit_function
+
+    # Add random noise to model prediction
+    E_iterations = [
+        E_model + np.random.default_rng(iteration_seed).normal(loc=0, scale=sigma_residuals, size=len(E_model))
+        for iteration_seed in iteration_seeds
+    ]
+
+    # Fit noisy data
+    results: List[Any] = []
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        if batch:
+            if deadline is None or time.time() < deadline:
+                popt = model._fit_batch(*args, np.vstack(E_iterations), use_jacobian=use_jacobian, **kwargs)
+                results = [None if np.isnan(row).any() else row for row in popt]
+            return results, fit_function.count
+
+        for E_iteration in E_iterations:
+            if deadline is not None and time.time() >= deadline:
+                break
+            if max_nfev is not None and fit_function.count >= max_nfev:
+                break
+            results.append(_fit_or_none(model, args, E_iteration, use_jacobian, kwargs))
+    return results, fit_function.count
+
+
+def _fit_or_none(model, args: Sequence[Any], E, use_jacobian: Union[bool, str], kwargs: Dict[str, Any]):
+    """Fit the model, returning None if the optimizer gave up (e.g., it exhausted max_nfev)."""
+    try:
+        return model._fit(*args, E, use_jacobian=use_jacobian, **kwargs)
+    except RuntimeError:
+        return None
+
+
+class _CountingFunction:
+    """Wrap a model's fit_function to count the number of model evaluations.
+
+    Batched evaluations (with parameters of shape (B, 1)) count as B evaluations.
+    """
+
+    def __init__(self, function: Callable):
+        self.function = function
+        self.count = 0
+
+    def __call__(self, *args):
+        values = self.function(*args)
+        self.count += np.shape(values)[0] if np.ndim(values) > 1 else 1
+        return values
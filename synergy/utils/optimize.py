@@ -0,0 +1,216 @@
+"""Optimizers used to fit many datasets to the same parametric model at once."""
+
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def batch_levenberg_marquardt(
+    fun: Callable,
+    jac: Callable,
+    p0,
+    bounds: Tuple[Sequence[float], Sequence[float]],
+    max_nfev: int = 200,
+    ftol: float = 1e-8,
+    xtol: float = 1e-8,
+    gtol: float = 1e-8,
+    damping: float = 1e-3,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Minimize B independent least squares problems simultaneously using Levenberg-Marquardt.
+
+    Every iteration evaluates the residuals of all active problems with one batched call to ``fun``, and the Jacobian
+    of all problems whose last step was accepted with one batched call to ``jac``. Each problem keeps its own damping
+    factor, and stops being updated once it has converged.
+
+    Bounds are enforced by projecting each step onto the feasible box.
+
+    :param Callable fun: ``fun(p, rows)`` returns residuals of shape (len(rows), M) for parameters p of shape
+        (len(rows), P), where rows are the indices of the problems being evaluated.
+    :param Callable jac: ``jac(p, rows)`` returns the Jacobian of the residuals, shape (len(rows), M, P)
+    :param ArrayLike p0: Initial guesses, shape (B, P)
+    :param Tuple[Sequence[float], Sequence[float]] bounds: Lower and upper bounds, each broadcastable to (B, P)
+    :param int max_nfev: Maximum number of iterations for each problem
+    :param float ftol: Converge when a step reduces the cost by less than this relative amount
+    :param float xtol: Converge when a step changes the parameters by less than this relative amount
+    :param float gtol: Converge when the largest gradient component is below this value
+    :param float damping: Initial damping factor
+    :return Tuple[np.ndarray, np.ndarray]: The optimized parameters (B, P), with rows of nan for problems that did not
+        converge, and a boolean array (B,) indicating which problems converged
+    """
+    p = np.array(p0, dtype=float, copy=True)
+    n_problems = p.shape[0]
+    lower = np.broadcast_to(np.asarray(bounds[0], dtype=float), p.shape)
+    upper = np.broadcast_to(np.asarray(bounds[1], dtype=float), p.shape)
+    p = np.clip(p, lower, upper)
+
+    all_rows = np.arange(n_problems)
+    lam = np.full(n_problems, damping)
+    converged = np.zeros(n_problems, dtype=bool)
+    active = np.ones(n_problems, dtype=bool)
+
+    residuals = _finite_or_nan(fun(p, all_rows))
+    cost = _cost(residuals)
+    jacobian = _finite_or_zero(jac(p, all_rows))
+    active &= np.isfinite(cost)
+
+    for _ in range(max_nfev):
+        rows = np.where(active)[0]
+        if len(rows) == 0:
+            break
+
+        J = jacobian[rows]
+        JtJ = np.einsum("bmi,bmj->bij", J, J)
+        gradient = np.einsum("bmi,bm->bi", J, residuals[rows])
+
+        # Converged to a stationary point, ignoring gradient components that point out of the feasible region
+        at_lower = (p[rows] <= lower[rows]) & (gradient > 0)
+        at_upper = (p[rows] >= upper[rows]) & (gradient < 0)
+        free = ~(at_lower | at_upper)
+        done = np.max(np.abs(np.where(free, gradient, 0)), axis=1) < gtol
+        converged[rows[done]] = True
+        active[rows[done]] = False
+        rows, JtJ, gradient, free = rows[~done], JtJ[~done], gradient[~done], free[~done]
+        if len(rows) == 0:
+            break
+
+        # Solve for the step in the free variables only, holding variables pinned at a bound fixed
+        diagonal = np.maximum(np.einsum("bii->bi", JtJ), 1e-12)
+        A = (JtJ + lam[rows, None, None] * _batch_diag(diagonal)) * (free[:, :, None] & free[:, None, :])
+        A += _batch_diag(~free)
+        step = _batch_solve(A, -np.where(free, gradient, 0))
+        p_trial = np.clip(p[rows] + step, lower[rows], upper[rows])
+        step = p_trial - p[rows]
+
+        residuals_trial = _finite_or_nan(fun(p_trial, rows))
+        cost_trial = _cost(residuals_trial)
+
+        accepted = cost_trial < cost[rows]
+        accepted_rows = rows[accepted]
+        rejected_rows = rows[~accepted]
+
+        # Check convergence of accepted steps before updating state
+        small_cost_change = cost[accepted_rows] - cost_trial[accepted] <= ftol * cost[accepted_rows]
+        step_norm = np.linalg.norm(step[accepted], axis=1)
+        small_step = step_norm <= xtol * (xtol + np.linalg.norm(p[accepted_rows], axis=1))
+
+        p[accepted_rows] = p_trial[accepted]
+        residuals[accepted_rows] = residuals_trial[accepted]
+        cost[accepted_rows] = cost_trial[accepted]
+        lam[accepted_rows] = np.maximum(lam[accepted_rows] / 10.0, 1e-12)
+        lam[rejected_rows] *= 10.0
+
+        done_rows = accepted_rows[small_cost_change | small_step]
+        converged[done_rows] = True
+        active[done_rows] = False
+
+        # Problems that cannot find a downhill step even with heavy damping have stalled at a minimum
+        stalled_rows = rejected_rows[lam[rejected_rows] > 1e12]
+        converged[stalled_rows] = True
+        active[stalled_rows] = False
+
+        refresh_rows = accepted_rows[active[accepted_rows]]
+        if len(refresh_rows) > 0:
+            jacobian[refresh_rows] = _finite_or_zero(jac(p[refresh_rows], refresh_rows))
+
+    p[~converged] = np.nan
+    return p, converged
+
+
+def batch_curve_fit(f: Callable, xdata, ydata, p0, bounds, jac: Optional[Callable] = None, **kwargs):
+    """Fit a model to every row of ydata simultaneously, analogous to ``scipy.optimize.curve_fit()``.
+
+    The model function and Jacobian use the same signatures as for ``curve_fit()``, but each parameter is passed as an
+    array of shape (B, 1) so that it broadcasts against xdata. Models built from numpy ufuncs support this without
+    modification, as long as the Jacobian is stacked along the last axis.
+
+    :param Callable f: ``f(xdata, *params)``, the model to fit
+    :param xdata: The independent variable(s), shared by all datasets
+    :param ArrayLike ydata: Observed values, shape (B, M)
+    :param ArrayLike p0: Initial guess, shape (P,) or (B, P)
+    :param bounds: Lower and upper bounds for each parameter
+    :param Optional[Callable] jac: ``jac(xdata, *params)``, the Jacobian of f. If None, forward differences are used.
+    :param kwargs: ``max_nfev`` (or ``maxfev``), ``ftol``, ``xtol``, and ``gtol`` are passed to
+        ``batch_levenberg_marquardt()``. Other ``curve_fit()`` options are ignored.
+    :return Tuple[np.ndarray, np.ndarray]: The optimized parameters (B, P) with rows of nan for datasets that failed to
+        converge, and a boolean array (B,) indicating which converged
+    """
+    ydata = np.asarray(ydata, dtype=float)
+    n_problems = ydata.shape[0]
+    p0 = np.broadcast_to(np.asarray(p0, dtype=float), (n_problems, len(bounds[0])))
+
+    def residuals(p, rows):
+        return f(xdata, *p.T[:, :, None]) - ydata[rows]
+
+    if jac is None:
+
+        def jacobian(p, rows):
+            return batch_finite_difference_jacobian(residuals, p, rows, bounds=bounds)
+
+    else:
+
+        def jacobian(p, rows):
+            return jac(xdata, *p.T[:, :, None])
+
+    solver_kwargs = {key: kwargs[key] for key in ["ftol", "xtol", "gtol"] if kwargs.get(key) is not None}
+    max_nfev = kwargs.get("max_nfev", kwargs.get("maxfev"))
+    if max_nfev is not None:
+        solver_kwargs["max_nfev"] = max_nfev
+
+    return batch_levenberg_marquardt(residuals, jacobian, p0, bounds, **solver_kwargs)
+
+
+def batch_finite_difference_jacobian(fun: Callable, p, rows, bounds: Optional[Tuple] = None, step: float = 1e-8):
+    """Approximate the Jacobian of a batched residual function with forward differences.
+
+    :param Callable fun: ``fun(p, rows)`` as described in ``batch_levenberg_marquardt()``
+    :param ArrayLike p: Parameters, shape (len(rows), P)
+    :param ArrayLike rows: Indices of the problems being evaluated
+    :param Optional[Tuple] bounds: Lower and upper bounds, each broadcastable to the shape of p. If a forward step
+        would exceed the upper bound, a backward step is taken instead.
+    :param float step: Relative step size
+    :return np.ndarray: The Jacobian, shape (len(rows), M, P)
+    """
+    f0 = fun(p, rows)
+    h = step * np.maximum(1.0, np.abs(p))
+    if bounds is not None:
+        upper = np.broadcast_to(np.asarray(bounds[1], dtype=float), p.shape)
+        h = np.where(p + h > upper, -h, h)
+    columns = []
+    for idx in range(p.shape[1]):
+        p_step = np.array(p, copy=True)
+        p_step[:, idx] += h[:, idx]
+        columns.append((fun(p_step, rows) - f0) / h[:, idx, None])
+    return np.stack(columns, axis=-1)
+
+
+def _cost(residuals) -> np.ndarray:
+    """Half the sum of squared residuals of each problem, with nan treated as infinitely bad."""
+    cost = 0.5 * np.sum(residuals * residuals, axis=1)
+    cost[~np.isfinite(cost)] = np.inf
+    return cost
+
+
+def _finite_or_nan(values) -> np.ndarray:
+    values = np.array(values, dtype=float)
+    values[~np.isfinite(values)] = np.nan
+    return values
+
+
+def _finite_or_zero(values) -> np.ndarray:
+    values = np.array(values, dtype=float)
+    values[~np.isfinite(values)] = 0
+    return values
+
+
+def _batch_diag(diagonal) -> np.ndarray:
+    """Convert an array of shape (B, P) into a stack of diagonal matrices of shape (B, P, P)."""
+    n_parameters = diagonal.shape[1]
+    return diagonal[:, :, None] * np.eye(n_parameters)[None, :, :]
+
+
+def _batch_solve(A, b) -> np.ndarray:
+    """Solve a stack of linear systems, falling back to least squares for any that are singular."""
+    try:
+        return np.linalg.solve(A, b[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        return np.stack([np.linalg.lstsq(A_i, b_i, rcond=None)[0] for A_i, b_i in zip(A, b)])
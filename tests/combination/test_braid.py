@@ -10,6 +10,7 @@ from unittest import TestCase
 import numpy as np
 
 from synergy.combination import BRAID
+from synergy.exceptions import ModelNotParameterizedError
 from synergy.testing_utils import assertions as synergy_assertions
 from synergy.testing_utils.test_data_loader import load_test_data
 from synergy.utils import dose_utils
@@ -116,6 +117,43 @@ class BRAIDTests(TestCase):
             reference = model.E_reference(d1, d2)
             self.assertTrue((E > reference).all())
 
+    def test_jacobian(self):
+        """Ensure the analytic Jacobian matches finite differences in every mode and for every choice of max_delta_E"""
+        d1, d2 = dose_utils.make_dose_grid(1e-3, 1e2, 1e-3, 1e2, n_points1=8, n_points2=8, include_zero=True)
+        d = (d1, d2)
+        step = 1e-6
+        synergy_params = {"kappa": [0.7], "delta": [np.log(1.6)], "both": [-0.5, np.log(0.7)]}
+
+        # max_delta_E is chosen from E3, E1, and E2, respectively
+        for Es in [(1, 0.3, 0.5, 0.1), (1, 0.1, 0.5, 0.2), (1, 0.5, 0.2, 0.4)]:
+            for mode, synergy_param in synergy_params.items():
+                model = BRAID(mode=mode)
+                params = np.hstack([Es, np.log([1.3, 0.8, 0.5, 2.0]), synergy_param])
+
+                jacobian = model.jacobian_function(d, *params)
+                finite_differences = np.stack(
+                    [
+                        (model.fit_function(d, *(params + step * e)) - model.fit_function(d, *(params - step * e)))
+                        / (2 * step)
+                        for e in np.eye(len(params))
+                    ],
+                    axis=-1,
+                )
+
+                self.assertEqual(jacobian.shape, (len(d1), len(params)))
+                np.testing.assert_allclose(jacobian, finite_differences, atol=1e-7)
+
+    def test_E_grid(self):
+        """Ensure E_grid() matches E() on the corresponding dose grid"""
+        d1 = np.append(0, np.logspace(-3, 2, 6))
+        d2 = np.append(0, np.logspace(-2, 1, 4))
+        D1, D2 = np.meshgrid(d1, d2)
+        model = BRAID(E0=1, E1=0.5, E2=0.3, E3=0.1, h1=1.2, h2=0.8, C1=0.1, C2=1, kappa=1, delta=1.5, mode="both")
+        np.testing.assert_allclose(model.E_grid(d1, d2), model.E(D1.ravel(), D2.ravel()).reshape(D1.shape))
+
+        with self.assertRaises(ModelNotParameterizedError):
+            BRAID().E_grid(d1, d2)
+
 
 class BRAIDFitTests(TestCase):
     """Tests requiring fitting the 2D BRAID synergy model."""
@@ -4,15 +4,18 @@ import os
 import sys
 import unittest
 from copy import deepcopy
-from typing import Dict
+from typing import Any, Dict, List
 from unittest import TestCase
 
 import numpy as np
 
-from synergy.combination import MuSyC
+from synergy.combination import MuSyC, Zimmer
+from synergy.combination.generated import musyc as generated_musyc
+from synergy.combination.generated import musyc_no_gamma as generated_musyc_no_gamma
 from synergy.testing_utils import assertions as synergy_assertions
 from synergy.testing_utils.test_data_loader import load_test_data
 from synergy.utils import dose_utils
+from synergy.utils.model_mixins import EvaluationWorkspace
 
 MAX_FLOAT = sys.float_info.max
 
@@ -171,6 +174,96 @@ class MuSyCTests(TestCase):
             reference = model.E_reference(d1, d2)
             self.assertTrue((E > reference).all())
 
+    def test_generated_code(self):
+        """Ensure the generated model and Jacobian match MuSyC._model and its finite differences"""
+        d1, d2 = dose_utils.make_dose_grid(1e-3, 1e2, 1e-3, 1e2, n_points1=8, n_points2=8, include_zero=True)
+        model = MuSyC(fit_gamma=True)
+        rng = np.random.default_rng(0)
+        step = 1e-6
+        for _ in range(10):
+            E = rng.uniform(0, 1, 4)
+            logparams = rng.normal(0, 1, 8)
+            params = np.hstack([E, logparams])
+
+            def generated_args(p):
+                return [d1, d2, *p[:8], model.r1r, model.r2r, *p[8:]]
+
+            def generated_model(p):
+                return generated_musyc.model(*generated_args(p))
+
+            E_generated = generated_model(params)
+            jacobian = generated_musyc.jacobian(*generated_args(params))
+            finite_differences = np.stack(
+                [
+                    (generated_model(params + step * e) - generated_model(params - step * e)) / (2 * step)
+                    for e in np.eye(len(params))
+                ],
+                axis=-1,
+            )
+            model_args = [d1, d2, *E, *np.exp(logparams[:4]), model.r1r, model.r2r, *np.exp(logparams[4:])]
+            E_expected = model._model(*model_args)
+
+            np.testing.assert_allclose(E_generated, E_expected, rtol=1e-12, atol=1e-14)
+            np.testing.assert_allclose(jacobian, finite_differences, atol=1e-7)
+
+    def test_generated_code_no_gamma(self):
+        """Ensure the gamma-free generated code matches the full generated code with gamma fixed at 1"""
+        d1, d2 = dose_utils.make_dose_grid(1e-3, 1e2, 1e-3, 1e2, n_points1=8, n_points2=8, include_zero=True)
+        model = MuSyC(fit_gamma=False)
+        rng = np.random.default_rng(1)
+        for _ in range(10):
+            params = np.hstack([rng.uniform(0, 1, 4), rng.normal(0, 1, 6)])
+            args = [d1, d2, *params[:8], model.r1r, model.r2r, *params[8:]]
+            args_gamma_one = args + [0, 0]  # log(gamma12), log(gamma21)
+
+            np.testing.assert_allclose(
+                generated_musyc_no_gamma.model(*args), generated_musyc.model(*args_gamma_one), rtol=1e-12, atol=1e-14
+            )
+            np.testing.assert_allclose(
+                generated_musyc_no_gamma.jacobian(*args),
+                generated_musyc.jacobian(*args_gamma_one)[..., :-2],
+                rtol=1e-10,
+                atol=1e-14,
+            )
+
+    def test_E_grid(self):
+        """Ensure E_grid() matches E() on the corresponding dose grid, with and without gamma"""
+        d1 = np.append(0, np.logspace(-3, 2, 6))
+        d2 = np.append(0, np.logspace(-2, 1, 4))
+        D1, D2 = np.meshgrid(d1, d2)
+        params: Dict[str, Any] = dict(
+            E0=1, E1=0.5, E2=0.3, E3=0.1, h1=1.2, h2=0.8, C1=0.1, C2=1, alpha12=2, alpha21=0.5
+        )
+        for model in [MuSyC(gamma12=1.5, gamma21=0.7, **params), MuSyC(fit_gamma=False, **params)]:
+            E = model.E_grid(d1, d2)
+            self.assertEqual(E.shape, (len(d2), len(d1)))
+            np.testing.assert_allclose(E, model.E(D1, D2), rtol=1e-12)
+
+        with self.assertRaises(ValueError):
+            model.E_grid(D1, D2)
+
+    def test_state_occupancy_workspace(self):
+        """Ensure state occupancies are the same with or without a reused workspace, and sum to 1"""
+        d1, d2 = dose_utils.make_dose_grid(1e-3, 1e2, 1e-3, 1e2, n_points1=8, n_points2=8, include_zero=True)
+        model = MuSyC(
+            E0=1, E1=0.5, E2=0.3, E3=0.1, h1=1.2, h2=0.8, C1=0.1, C2=1, alpha12=2, alpha21=0.5, gamma12=1.5, gamma21=0.7
+        )
+        args = (d1, d2, 1.2, 0.8, 0.1, 1, 1, 1, 2, 0.5, 1.5, 0.7)
+        expected = model._state_occupancy(*args)
+        np.testing.assert_allclose(np.sum(expected, axis=0), 1)
+
+        workspace = EvaluationWorkspace()
+        for _ in range(2):
+            occupancy = model._state_occupancy(*args, workspace=workspace)
+            for state, expected_state in zip(occupancy, expected):
+                np.testing.assert_array_equal(state, expected_state)
+        self.assertIsNotNone(workspace._buffers)
+
+        # Scalar doses
+        occupancy = model._state_occupancy(0.5, 0.2, *args[2:], workspace=workspace)
+        self.assertEqual(np.shape(occupancy[0]), ())
+        np.testing.assert_allclose(np.sum(occupancy), 1)
+
 
 class MuSyCFitTests(TestCase):
     """Tests requiring fitting the 2D MuSyC synergy model."""
@@ -326,6 +419,94 @@ class MuSyCFitTests(TestCase):
                 confidence_intervals_50, confidence_intervals_95
             )
 
+    def test_musyc_fit_covariance(self):
+        """Ensure asymptotic confidence intervals contain the true parameters, including beta."""
+        for fname in ["synthetic_musyc_efficacy_1.csv", "synthetic_musyc_potency_1.csv"]:
+            expected_parameters = deepcopy(self.EXPECTED_PARAMETERS[fname])
+            expected_parameters["beta"] = MuSyC._get_beta(
+                expected_parameters["E0"],
+                expected_parameters["E1"],
+                expected_parameters["E2"],
+                expected_parameters["E3"],
+            )
+
+            d1, d2, E = load_test_data(os.path.join(TEST_DATA_DIR, fname))
+            model = MuSyC(fit_gamma=False)
+            model.fit(d1, d2, E, ci_method="covariance")
+
+            self.assertIsNone(model.bootstrap_parameters)
+            confidence_intervals = model.get_confidence_intervals()
+            self.assertIn("beta", confidence_intervals)
+            synergy_assertions.assert_dict_values_in_intervals(
+                expected_parameters, confidence_intervals, err_msg=fname, tol=0.05
+            )
+
+    def test_musyc_fit_profile(self):
+        """Ensure profile likelihood confidence intervals contain the true parameters."""
+        fname = "synthetic_musyc_potency_1.csv"
+        expected_parameters = deepcopy(self.EXPECTED_PARAMETERS[fname])
+        expected_parameters["beta"] = MuSyC._get_beta(
+            expected_parameters["E0"],
+            expected_parameters["E1"],
+            expected_parameters["E2"],
+            expected_parameters["E3"],
+        )
+
+        d1, d2, E = load_test_data(os.path.join(TEST_DATA_DIR, fname))
+        model = MuSyC(fit_gamma=False)
+        model.fit(d1, d2, E, ci_method="profile")
+
+        confidence_intervals = model.get_confidence_intervals()
+        self.assertIn("beta", confidence_intervals)
+        synergy_assertions.assert_dict_values_in_intervals(
+            expected_parameters, confidence_intervals, err_msg=fname, tol=0.05
+        )
+
+    def test_musyc_fit_bootstrap_batch_solver(self):
+        """Ensure the batched bootstrap solver gives confidence intervals containing the true parameters."""
+        fname = "synthetic_musyc_potency_1.csv"
+        expected_parameters = deepcopy(self.EXPECTED_PARAMETERS[fname])
+        expected_parameters["beta"] = MuSyC._get_beta(
+            expected_parameters["E0"],
+            expected_parameters["E1"],
+            expected_parameters["E2"],
+            expected_parameters["E3"],
+        )
+
+        d1, d2, E = load_test_data(os.path.join(TEST_DATA_DIR, fname))
+        model = MuSyC(fit_gamma=False)
+        model.fit(d1, d2, E, bootstrap_iterations=100, seed=24309184, bootstrap_solver="batch")
+
+        self.assertEqual(model.bootstrap_parameters.shape, (100, 10))
+        synergy_assertions.assert_dict_values_in_intervals(
+            expected_parameters, model.get_confidence_intervals(), err_msg=fname, tol=0.05
+        )
+
+    def test_musyc_fit_variable_projection(self):
+        """Ensure variable projection finds the same optimum as fitting all parameters, with and without E bounds."""
+        fname = "synthetic_musyc_efficacy_1.csv"
+        d1, d2, E = load_test_data(os.path.join(TEST_DATA_DIR, fname))
+        kwargs_list: List[Dict[str, Any]] = [{}, {"E_bounds": (0, 1)}]
+        for kwargs in kwargs_list:
+            reference = MuSyC(fit_gamma=False, **kwargs)
+            reference.fit(d1, d2, E)
+            model = MuSyC(fit_gamma=False, **kwargs)
+            model.fit(d1, d2, E, variable_projection=True)
+
+            self.assertTrue(model.is_converged)
+            synergy_assertions.assert_dict_allclose(
+                model.get_parameters(), reference.get_parameters(), rtol=1e-3, atol=1e-4
+            )
+            self.assertLessEqual(model.sum_of_squares_residuals, reference.sum_of_squares_residuals * (1 + 1e-6))
+            self.assertIsNone(model._fit_workspace._buffers)
+
+    def test_variable_projection_unsupported(self):
+        """Ensure models without linear parameters reject variable projection."""
+        d1, d2, E = load_test_data(os.path.join(TEST_DATA_DIR, "synthetic_musyc_efficacy_1.csv"))
+        model = Zimmer()
+        with self.assertRaises(ValueError):
+            model.fit(d1, d2, E, variable_projection=True)
+
 
 if __name__ == "__main__":
     unittest.main()
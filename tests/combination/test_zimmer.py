@@ -105,6 +105,44 @@ class EffectiveDoseModelTests(TestCase):
             reference = model.E_reference(d1, d2)
             self.assertTrue((E > reference).all())
 
+    def test_jacobian(self):
+        """Ensure the analytic Jacobian matches finite differences, including at zero dose and for large a12 and a21"""
+        d1, d2 = dose_utils.make_dose_grid(1e-3, 1e2, 1e-3, 1e2, n_points1=8, n_points2=8, include_zero=True)
+        d = (d1, d2)
+        model = Zimmer()
+        step = 1e-6
+        for a12, a21 in [(0, 0), (0.5, -0.3), (-0.4, 2), (50, 30), (-0.9, 100)]:
+            params = np.hstack([np.log([1.3, 0.7, 0.5, 2.0]), a12, a21])
+
+            jacobian = model.jacobian_function(d, *params)
+            finite_differences = np.stack(
+                [
+                    (model.fit_function(d, *(params + step * e)) - model.fit_function(d, *(params - step * e)))
+                    / (2 * step)
+                    for e in np.eye(len(params))
+                ],
+                axis=-1,
+            )
+
+            np.testing.assert_allclose(jacobian, finite_differences, atol=1e-7)
+
+    def test_effective_dose_small_d1(self):
+        """Ensure the effective dose of drug 1 is accurate when d1 is orders of magnitude below C1"""
+        d1 = np.logspace(-14, -8, 4)
+        d2 = np.ones_like(d1)
+        for a12 in [0, 50]:
+            # As d1 -> 0, d1p -> d1 / (1 + a12 * d2 / (d2 + C2))
+            d1p = Zimmer._model_terms(d1, d2, 1, 1, 0.5, 2, a12, 0)["d1p"]
+            np.testing.assert_allclose(d1p, d1 / (1 + a12 / 3), rtol=1e-6)
+
+    def test_E_grid(self):
+        """Ensure E_grid() matches E() on the corresponding dose grid"""
+        d1 = np.append(0, np.logspace(-3, 2, 6))
+        d2 = np.append(0, np.logspace(-2, 1, 4))
+        D1, D2 = np.meshgrid(d1, d2)
+        model = Zimmer(h1=1.2, h2=0.8, C1=0.1, C2=1, a12=0.5, a21=-0.3)
+        np.testing.assert_allclose(model.E_grid(d1, d2), model.E(D1.ravel(), D2.ravel()).reshape(D1.shape))
+
 
 class ZimmerFitTests(TestCase):
     """Tests requiring fitting the 2D Zimmer synergy model."""
@@ -60,6 +60,17 @@ class ZIPTests(TestCase):
         self.assertTrue((synergy[combo_mask] < 0).all())
         np.testing.assert_almost_equal(synergy[single_mask], 0)
 
+    def test_variable_projection(self):
+        """Ensure ZIP gives the same synergy with and without variable projection for its Hill slice fits."""
+        np.random.seed(81924)
+        d1, d2, E = MuSyCDataGenerator.get_2drug_combination(
+            E0=1, E1=0.5, E2=0.3, E3=0.15, alpha12=2, alpha21=2, E_noise=0, d_noise=0
+        )
+
+        synergy = ZIP().fit(d1, d2, E)
+        synergy_varpro = ZIP(variable_projection=True).fit(d1, d2, E)
+        np.testing.assert_allclose(synergy_varpro, synergy, atol=1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()
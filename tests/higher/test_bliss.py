@@ -1,6 +1,6 @@
 import os
 import unittest
-from unittest import TestCase
+from unittest import TestCase, mock
 
 import numpy as np
 
@@ -37,6 +37,26 @@ class BlissTests(TestCase):
         synergy = model.fit(d, E)
         np.testing.assert_allclose(synergy, np.zeros(len(synergy)))
 
+    def test_memory_budget(self):
+        """Ensure the reference is evaluated in chunks of rows when the dose matrix exceeds the memory budget"""
+        drugs = [
+            Hill(E0=1.0, Emax=0.1, h=1.0, C=1.0),
+            Hill(E0=1.0, Emax=0.3, h=1.0, C=1.0),
+            Hill(E0=1.0, Emax=0.2, h=2.0, C=1.0),
+        ]
+        d, E = MultiplicativeSurvivalReferenceDataGenerator.get_ND_combination(
+            drugs, [1e-2] * 3, [1e2] * 3, [5] * 3, E_noise=0, d_noise=0
+        )
+        expected = Bliss(single_drug_models=drugs).fit(d, E)
+
+        model = Bliss(single_drug_models=drugs)
+        model.memory_budget = 10 * model._bytes_per_dose_row()
+        with mock.patch.object(model, "E_reference", wraps=model.E_reference) as E_reference:
+            synergy = model.fit(d, E)
+        self.assertEqual(E_reference.call_count, 13)
+        self.assertTrue(all(len(call.args[0]) <= 10 for call in E_reference.call_args_list))
+        np.testing.assert_allclose(synergy, expected)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,14 @@
+import copy
 import os
 import sys
 import unittest
-from typing import Dict
-from unittest import TestCase
+from typing import Any, Dict
+from unittest import TestCase, mock
 
 import numpy as np
 
 from synergy.higher import MuSyC
+from synergy.higher.musyc import MuSyCTopology
 from synergy.testing_utils import assertions as synergy_assertions
 from synergy.testing_utils.test_data_loader import load_nd_test_data
 
@@ -137,6 +139,35 @@ class MuSyCNDUnitTests(TestCase):
         print(json.dumps(edge_indices, indent=4))
         # TODO make test
 
+    def test_topology(self):
+        """Ensure each drug's edges pair every state lacking that drug with the state reached by adding it"""
+        N = 3
+        topology = MuSyCTopology(N)
+        for drug in range(N):
+            np.testing.assert_array_equal(topology.upper[drug] - topology.lower[drug], 2**drug)
+            self.assertEqual(sorted(np.concatenate([topology.lower[drug], topology.upper[drug]])), list(range(2**N)))
+            for start, end, param in zip(topology.lower[drug], topology.upper[drug], topology.edge_param[drug]):
+                self.assertEqual(param, topology.edge_index[(start, end)] if start > 0 else -1)
+
+        # Every state has one outgoing transition per drug
+        self.assertEqual(topology.diagonal_index.shape, (2**N, N))
+        self.assertEqual(len(np.unique(topology.diagonal_index)), 2**N * N)
+
+        self.assertEqual(topology.state_names[0b101], "1,3")
+        self.assertEqual(topology.parameter_names[topology.alpha][0], "alpha_1_3")
+        self.assertEqual(len(topology.parameter_names[topology.gamma]), 9)
+
+    def test_topology_is_shared(self):
+        """Ensure topologies are computed once per number of drugs, and cannot be modified"""
+        topology = MuSyCTopology(3)
+        self.assertIs(MuSyCTopology(3), topology)
+        self.assertIs(MuSyC(num_drugs=3)._topology, topology)
+        self.assertIs(copy.deepcopy(topology), topology)
+        with self.assertRaises(AttributeError):
+            topology.n = 4
+        with self.assertRaises(ValueError):
+            topology.lower[0, 0] = 1
+
     def test_get_drug_string_from_state(self):
         """Ensure drug strings are calculated correctly
 
@@ -195,7 +226,7 @@ class MuSyCNDUnitTests(TestCase):
 
     def test_initialize_with_bounds(self):
         """Ensure MuSyC model can be instantiated with proper fitting bounds"""
-        params = {
+        params: Dict[str, Any] = {
             "E_0_bounds": (0.95, 1.05),
             "E_1,2,3_bounds": (0.0, 0.1),
             "E_bounds": (0.0, 1.0),
@@ -237,7 +268,7 @@ class MuSyCNDUnitTests(TestCase):
 
     def test_infer_single_drug_bounds(self):
         """Ensure the model can infer single drug bounds"""
-        params = {
+        params: Dict[str, Any] = {
             "E_0_bounds": (0.95, 1.05),
             "E_1_bounds": (0.45, 0.55),
             "E_2_bounds": (0.6, 0.7),
@@ -285,7 +316,7 @@ class MuSyCNDModelTests(TestCase):
 
     def test_asymptotic_limits(self):
         """Ensure the asymptotic dose limits work correctly"""
-        params = {
+        params: Dict[str, Any] = {
             "E_0": 1.0,
             "E_1": 0.6,
             "E_2": 0.5,
@@ -364,6 +395,128 @@ class MuSyCNDModelTests(TestCase):
         )
         np.testing.assert_allclose(E, expected, atol=1e-4)
 
+    def test_sparse_solver(self):
+        """Ensure the sparse and dense steady-state solvers agree"""
+        N = 4
+        dense_model = MuSyC(num_drugs=N, fit_gamma=True, solver="dense")
+        sparse_model = MuSyC(num_drugs=N, fit_gamma=True, solver="sparse")
+        rng = np.random.default_rng(0)
+        args = rng.normal(scale=0.5, size=2 * N + 2 * dense_model._num_alpha_params)
+        d = rng.uniform(0, 5, size=(20, N))
+        d[0] = 0
+        d[1] = 1e6
+
+        occupancy = sparse_model._state_occupancy(d, *args)
+        np.testing.assert_allclose(occupancy, dense_model._state_occupancy(d, *args), atol=1e-12)
+        np.testing.assert_allclose(occupancy.sum(axis=1), 1)
+
+    def test_jacobian(self):
+        """Ensure the analytic Jacobian matches central finite differences, for both solvers"""
+        N = 3
+        rng = np.random.default_rng(0)
+        d = rng.uniform(0, 4, size=(20, N))
+        d[0] = 0
+        d[1, 0] = 0
+        for fit_gamma in [False, True]:
+            for solver in ["dense", "sparse"]:
+                model = MuSyC(num_drugs=N, fit_gamma=fit_gamma, solver=solver, r_r=2.0)
+                n_params = len(model._parameter_names)
+                params = np.concatenate([rng.uniform(0, 1, 2**N), rng.normal(scale=0.4, size=n_params - 2**N)])
+
+                jacobian = model.jacobian_function(d, *params)
+                step = 1e-6
+                expected = np.column_stack(
+                    [
+                        (model.fit_function(d, *(params + step * e)) - model.fit_function(d, *(params - step * e)))
+                        / (2 * step)
+                        for e in np.eye(n_params)
+                    ]
+                )
+                np.testing.assert_allclose(
+                    jacobian, expected, atol=1e-7, err_msg=f"fit_gamma={fit_gamma}, solver={solver}"
+                )
+
+    def test_memory_budget(self):
+        """Ensure large dose matrices are evaluated in chunks that stay within the memory budget, for both solvers"""
+        N = 3
+        rng = np.random.default_rng(0)
+        d = rng.uniform(0, 4, size=(50, N))
+        d_unique = [np.logspace(-2, 2, 5), np.logspace(-1, 1, 4), np.logspace(-3, 1, 3)]
+        for solver in ["dense", "sparse"]:
+            model = MuSyC(num_drugs=N, fit_gamma=True, solver=solver)
+            n_params = len(model._parameter_names)
+            params = np.concatenate([rng.uniform(0, 1, 2**N), np.exp(rng.normal(scale=0.4, size=n_params - 2**N))])
+            for name, value in zip(model._parameter_names, params):
+                setattr(model, name, value)
+            fit_params = model._transform_params_to_fit(params)
+            expected = (model.E(d), model.jacobian_function(d, *fit_params), model.E_grid(*d_unique))
+
+            model.memory_budget = 7 * model._bytes_per_dose_row(adjoint=True)
+            with mock.patch.object(model, "_solve_steady_state", wraps=model._solve_steady_state) as solve:
+                results = (model.E(d), model.jacobian_function(d, *fit_params), model.E_grid(*d_unique))
+            self.assertTrue(all(len(call.args[0]) <= 14 for call in solve.call_args_list))
+            self.assertGreater(solve.call_count, 3 + 8 + 5)
+            for result, value in zip(results, expected):
+                np.testing.assert_allclose(result, value, rtol=1e-12, err_msg=solver)
+
+    def test_solver_selection(self):
+        """Ensure the sparse solver is chosen automatically for large combinations"""
+        self.assertFalse(MuSyC(num_drugs=3)._use_sparse_solver(10**6))
+        self.assertFalse(MuSyC(num_drugs=6)._use_sparse_solver(100))
+        self.assertTrue(MuSyC(num_drugs=6)._use_sparse_solver(10**5))
+        self.assertTrue(MuSyC(num_drugs=9)._use_sparse_solver(1))
+        self.assertTrue(MuSyC(num_drugs=3, solver="sparse")._use_sparse_solver(1))
+        with self.assertRaises(ValueError):
+            MuSyC(num_drugs=3, solver="lu")
+
+    def test_E_solver_selection(self):
+        """Ensure E() chooses the solver from every dose row, rather than from chunks of them"""
+        N = 6
+        model = MuSyC(num_drugs=N)
+        rng = np.random.default_rng(0)
+        n_params = len(model._parameter_names)
+        params = np.concatenate([rng.uniform(0, 1, 2**N), np.exp(rng.normal(scale=0.4, size=n_params - 2**N))])
+        for name, value in zip(model._parameter_names, params):
+            setattr(model, name, value)
+        # Small enough that 400 rows need the sparse solver, while chunks of dense-sized rows would not
+        model.memory_budget = 2**20
+        d = rng.uniform(0, 4, size=(400, N))
+        self.assertTrue(model._use_sparse_solver(len(d)))
+        self.assertFalse(model._use_sparse_solver(model.memory_budget // model._bytes_per_dose_row(sparse=False)))
+
+        with mock.patch.object(
+            model, "_solve_steady_state_sparse", wraps=model._solve_steady_state_sparse
+        ) as sparse, mock.patch.object(
+            model, "_solve_steady_state_dense", wraps=model._solve_steady_state_dense
+        ) as dense:
+            E = model.E(d)
+        self.assertGreater(sparse.call_count, 0)
+        self.assertEqual(dense.call_count, 0)
+        np.testing.assert_allclose(E, MuSyC(num_drugs=N, solver="dense", **model.get_parameters()).E(d), rtol=1e-10)
+
+    def test_E_grid(self):
+        """Ensure E_grid() matches E() on the corresponding dose grid, for both solvers"""
+        N = 3
+        rng = np.random.default_rng(0)
+        d_unique = [np.append(0, np.logspace(-2, 2, 4)), np.logspace(-1, 1, 3), np.append(0, np.logspace(-3, 1, 5))]
+        d = np.column_stack([grid.ravel() for grid in np.meshgrid(*d_unique)])
+        for fit_gamma in [False, True]:
+            for solver in ["dense", "sparse"]:
+                model = MuSyC(num_drugs=N, fit_gamma=fit_gamma, solver=solver)
+                n_params = len(model._parameter_names)
+                params = np.concatenate(
+                    [rng.uniform(0, 1, 2**N), np.exp(rng.normal(scale=0.4, size=n_params - 2**N))]
+                )
+                for name, value in zip(model._parameter_names, params):
+                    setattr(model, name, value)
+
+                E = model.E_grid(*d_unique)
+                self.assertEqual(E.shape, (3, 5, 6))
+                np.testing.assert_allclose(E.ravel(), model.E(d), rtol=1e-12, err_msg=f"{fit_gamma}, {solver}")
+
+        with self.assertRaises(ValueError):
+            model.E_grid(*d_unique[:2])
+
 
 class MuSyC3DFittingTests(TestCase):
     """Tests for fitting the n-dimensional MuSyC model"""
@@ -492,6 +645,24 @@ class MuSyC3DFittingTests(TestCase):
             expected, confidence_intervals_95, tol=3e-3, log_keys=log_keys
         )
 
+    def test_fit_variable_projection(self):
+        """Ensure variable projection (solving E parameters by linear least squares) finds the usual optimum."""
+        fname = "synthetic_musyc3_high_order_efficacy_synergy.csv"
+        d, E = load_nd_test_data(os.path.join(TEST_DATA_DIR, fname))
+
+        np.random.seed(218902184)
+        reference = MuSyC(num_drugs=3, E_bounds=(0, 1))
+        reference.fit(d, E)
+        np.random.seed(218902184)
+        model = MuSyC(num_drugs=3, E_bounds=(0, 1))
+        model.fit(d, E, variable_projection=True)
+
+        self.assertTrue(model.is_converged)
+        self.assertLessEqual(model.sum_of_squares_residuals, reference.sum_of_squares_residuals * (1 + 1e-4))
+        synergy_assertions.assert_dict_allclose(
+            model.get_parameters(), self._get_expected_parameters(fname), rtol=5e-2, atol=5e-2, err_msg=fname
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -258,6 +258,59 @@ class TestHillFit(TestCase):
         )
         np.testing.assert_allclose(observed["C"], expected["C"], atol=0.2 * scale)
 
+    def test_fit_variable_projection(self):
+        """Ensure variable projection finds the usual optimum, including when a bound on E is active."""
+        fname = "synthetic_hill_1.csv"
+        d, E = load_test_data(os.path.join(TEST_DATA_DIR, fname))
+        if self.MODEL is not Hill:
+            with self.assertRaises(ValueError):
+                self.MODEL(**self.INIT_KWARGS).fit(d, E, variable_projection=True)
+            return
+
+        # The true Emax is 0, so the lower bound on Emax is active in the second case
+        for kwargs in [{}, {"Emax_bounds": (0.1, 1.0)}]:
+            reference = self.MODEL(**kwargs)
+            reference.fit(d, E)
+            model = self.MODEL(**kwargs)
+            model.fit(d, E, variable_projection=True)
+
+            self.assertTrue(model.is_converged)
+            synergy_assertions.assert_dict_allclose(
+                model.get_parameters(), reference.get_parameters(), rtol=1e-3, atol=1e-4
+            )
+
+    def test_fit_many(self):
+        """Ensure fit_many() fits every curve at once, matching fit(), and records curves that fail."""
+        fname = "synthetic_hill_1.csv"
+        d, E = load_test_data(os.path.join(TEST_DATA_DIR, fname))
+        expected = self.EXPECTED_PARAMETERS[fname]
+        scale = 1e6
+
+        # Group "b" uses different dose units, and group "c" can't be fit
+        all_d = np.concatenate([d, d * scale, d[:5]])
+        all_E = np.concatenate([E, E, np.full(5, np.nan)])
+        groups = np.repeat(["a", "b", "c"], [len(d), len(d), 5])
+
+        result = self.MODEL.fit_many(all_d, all_E, groups, **self.INIT_KWARGS)
+        self.assertEqual(len(result), 3)
+        self.assertListEqual(list(result.groups), ["a", "b", "c"])
+        self.assertListEqual(list(result.converged), [True, True, False])
+        np.testing.assert_allclose(result.parameters["C"][:2], [expected["C"], expected["C"] * scale], rtol=0.2)
+
+        model = self.MODEL(**self.INIT_KWARGS)
+        model.fit(d, E)
+        hydrated = result["a"]
+        self.assertIsInstance(hydrated, self.MODEL)
+        self.assertTrue(hydrated.is_fit)
+        self.assertTrue(hydrated.is_converged)
+        synergy_assertions.assert_dict_allclose(hydrated.get_parameters(), model.get_parameters(), rtol=1e-3)
+        np.testing.assert_allclose(result["b"].E(d * scale), hydrated.E(d), atol=1e-4)
+        self.assertGreater(hydrated.r_squared, 0.9)
+
+        failed = result["c"]
+        self.assertFalse(failed.is_converged)
+        self.assertFalse(failed.is_specified)
+
 
 class TestHill_2P(TestHill):
     """Tests for 1D Hill_2P dose-response models."""
@@ -0,0 +1,124 @@
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import numpy as np
+
+from synergy import batch
+from synergy.combination import MuSyC
+from synergy.combination.bliss import Bliss
+from synergy.higher import Bliss as BlissND
+from synergy.higher import MuSyC as MuSyCND
+from synergy.testing_utils.test_data_loader import load_nd_test_data
+from synergy.utils import dose_utils
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), "higher", "data")
+
+
+def _make_plate(n_blocks=4, noise=0.01, seed=0):
+    """Stack several noisy 2D MuSyC blocks into one grouped dataset, with a different alpha12 in each block."""
+    rng = np.random.default_rng(seed)
+    d1, d2 = dose_utils.make_dose_grid(1e-2, 10, 1e-2, 10, 6, 6)
+    all_d1, all_d2, all_E, groups = [], [], [], []
+    for idx in range(n_blocks):
+        model = MuSyC(
+            E0=1, E1=0.5, E2=0.3, E3=0, h1=1, h2=1.5, C1=1, C2=0.5, alpha12=2.0**idx, alpha21=1, fit_gamma=False
+        )
+        all_d1.append(d1)
+        all_d2.append(d2)
+        all_E.append(model.E(d1, d2) + noise * rng.standard_normal(len(d1)))
+        groups.append(np.full(len(d1), f"block_{idx}"))
+    return np.concatenate(all_d1), np.concatenate(all_d2), np.concatenate(all_E), np.concatenate(groups)
+
+
+class TestFitBlocks(TestCase):
+    """Tests for synergy.batch.fit_blocks()."""
+
+    def test_parametric_2d(self):
+        """Ensure every block of a 2D parametric model is fit, scored, and matches fitting it individually."""
+        d1, d2, E, groups = _make_plate()
+        result = batch.fit_blocks(MuSyC, (d1, d2), E, groups, model_kwargs=dict(E_bounds=(0, 1.5)))
+
+        self.assertEqual(len(result), 4)
+        self.assertListEqual(list(result.groups), [f"block_{idx}" for idx in range(4)])
+        self.assertTrue(result.converged.all())
+        self.assertDictEqual(result.failures, {})
+        for column in list(MuSyC()._parameter_names) + ["r_squared", "aic", "bic"]:
+            self.assertEqual(result[column].shape, (4,))
+            self.assertTrue(np.isfinite(result[column]).all(), column)
+
+        mask = groups == "block_2"
+        model = MuSyC(E_bounds=(0, 1.5))
+        model.fit(d1[mask], d2[mask], E[mask])
+        for name, value in model.get_parameters().items():
+            np.testing.assert_allclose(result[name][2], value, rtol=1e-6)
+        np.testing.assert_allclose(result["r_squared"][2], model.r_squared, rtol=1e-6)
+
+    def test_failures_are_recorded(self):
+        """Ensure errors in one block are recorded, and do not prevent other blocks from being fit."""
+        d1, d2, E, groups = _make_plate(n_blocks=2)
+        E[groups == "block_1"] = np.nan
+        result = batch.fit_blocks(MuSyC, (d1, d2), E, groups)
+
+        self.assertListEqual(list(result.converged), [True, False])
+        self.assertIn("block_1", result.failures)
+        self.assertNotIn("block_0", result.failures)
+        self.assertTrue(np.isnan(result["alpha12"][1]))
+
+    def test_parallel_matches_serial(self):
+        """Ensure chunked parallel dispatch gives the same table as fitting serially."""
+        d1, d2, E, groups = _make_plate()
+        serial = batch.fit_blocks(MuSyC, (d1, d2), E, groups)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            parallel = batch.fit_blocks(MuSyC, (d1, d2), E, groups, n_jobs=2, executor=pool, chunk_size=3)
+        processes = batch.fit_blocks(MuSyC, (d1, d2), E, groups, n_jobs=2, executor="process")
+
+        for other in [parallel, processes]:
+            self.assertListEqual(list(other.columns), list(serial.columns))
+            for column in serial.columns:
+                if serial[column].dtype.kind not in "bf":
+                    self.assertListEqual(list(other[column]), list(serial[column]))
+                else:
+                    np.testing.assert_allclose(other[column], serial[column])
+
+    def test_dose_dependent_2d(self):
+        """Ensure dose-dependent synergy is returned aligned with the input rows."""
+        d1, d2, E, groups = _make_plate(n_blocks=2)
+        result = batch.fit_blocks(Bliss(), (d1, d2), E, groups)
+
+        self.assertTrue(result.converged.all())
+        self.assertEqual(result.synergy.shape, E.shape)
+        mask = groups == "block_1"
+        model = Bliss()
+        np.testing.assert_allclose(result.synergy[mask], model.fit(d1[mask], d2[mask], E[mask]))
+        np.testing.assert_allclose(result.reference[mask], model.reference)
+
+    def test_higher(self):
+        """Ensure N-drug models are supported."""
+        d, E = load_nd_test_data(os.path.join(TEST_DATA_DIR, "synthetic_musyc3_reference_1.csv"))
+        d = np.vstack([d, d])
+        E = np.concatenate([E, E])
+        groups = np.repeat([0, 1], len(E) // 2)
+
+        result = batch.fit_blocks(BlissND, d, E, groups)
+        self.assertTrue(result.converged.all())
+        np.testing.assert_allclose(result.synergy[groups == 0], result.synergy[groups == 1])
+
+        np.random.seed(0)
+        result = batch.fit_blocks(MuSyCND, d, E, groups, model_kwargs=dict(num_drugs=3, E_bounds=(0, 1)))
+        self.assertTrue(result.converged.all())
+        self.assertIn("alpha_1_2", result.columns)
+        self.assertTrue(np.isfinite(result["r_squared"]).all())
+
+    def test_invalid_inputs(self):
+        """Ensure malformed datasets are rejected before any fitting."""
+        d1, d2, E, groups = _make_plate(n_blocks=1)
+        with self.assertRaises(ValueError):
+            batch.fit_blocks(MuSyC, (d1, d2[:-1]), E, groups)
+        with self.assertRaises(ValueError):
+            batch.fit_blocks(MuSyC(), (d1, d2), E, groups, model_kwargs=dict(fit_gamma=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+from unittest import TestCase, mock
+
+import numpy as np
+
+import synergy
+from synergy.combination import BRAID, MuSyC, Schindler, Zimmer
+from synergy.higher import Schindler as SchindlerND
+from synergy.single import Hill, Hill_2P
+from synergy.utils import backend, dose_utils
+
+
+class TestSetBackend(TestCase):
+    """Tests for selecting the backend"""
+
+    def tearDown(self):
+        synergy.set_backend("numpy")
+
+    def test_default(self):
+        """Ensure models are evaluated with NumPy by default"""
+        self.assertEqual(synergy.get_backend(), "numpy")
+        self.assertIsNone(backend.numba_kernels((np.ones(3),), (1.0,)))
+
+    def test_invalid_backend(self):
+        """Ensure unknown backends raise ValueError"""
+        with self.assertRaises(ValueError):
+            synergy.set_backend("jax")
+        self.assertEqual(synergy.get_backend(), "numpy")
+
+    @unittest.skipIf(backend.numba_installed, "numba is installed")
+    def test_numba_not_installed(self):
+        """Ensure selecting numba without it raises ImportError"""
+        with self.assertRaises(ImportError):
+            synergy.set_backend("numba")
+        self.assertEqual(synergy.get_backend(), "numpy")
+
+
+@unittest.skipIf(not backend.numba_installed, "numba is not installed")
+class TestNumbaBackend(TestCase):
+    """Tests that the numba backend matches the NumPy backend"""
+
+    d1: np.ndarray
+    d2: np.ndarray
+
+    @classmethod
+    def setUpClass(cls):
+        cls.d1, cls.d2 = dose_utils.make_dose_grid(1e-3, 1e2, 1e-3, 1e2, n_points1=8, n_points2=8, include_zero=True)
+
+    def tearDown(self):
+        synergy.set_backend("numpy")
+
+    def assert_backends_match(self, function, *args):
+        """Ensure function(*args) is the same with either backend, and that the numba kernels were used"""
+        synergy.set_backend("numpy")
+        expected = function(*args)
+        synergy.set_backend("numba")
+        kernels_used = []
+        numba_kernels = backend.numba_kernels
+
+        def spy(*spy_args, **spy_kwargs):
+            kernels = numba_kernels(*spy_args, **spy_kwargs)
+            kernels_used.append(kernels is not None)
+            return kernels
+
+        with mock.patch.object(backend, "numba_kernels", spy):
+            result = function(*args)
+        self.assertTrue(any(kernels_used))
+        np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-12)
+
+    def test_numba_kernels(self):
+        """Ensure kernels are only used for array doses and real scalar parameters"""
+        synergy.set_backend("numba")
+        self.assertEqual(synergy.get_backend(), "numba")
+        self.assertIsNotNone(backend.numba_kernels((np.ones(3),), (1.0, 2)))
+        self.assertIsNone(backend.numba_kernels((1.0,), (1.0,)))
+        self.assertIsNone(backend.numba_kernels((np.ones(3),), (1j,)))
+        self.assertIsNone(backend.numba_kernels((np.ones(3),), (np.ones((2, 1)),)))
+        self.assertIsNone(backend.numba_kernels((np.ones(3), np.ones(2)), (1.0,)))
+
+    def test_mismatched_doses(self):
+        """Ensure doses of different lengths raise the same error with either backend"""
+        model = Zimmer(h1=1.2, h2=0.8, C1=0.1, C2=1, a12=0.5, a21=-0.3)
+        for name in backend.BACKENDS:
+            synergy.set_backend(name)
+            with self.assertRaises(ValueError):
+                model.E(self.d1, self.d2[:-1])
+
+    def test_hill(self):
+        """Ensure Hill and Hill_2P match with either backend"""
+        d = np.logspace(-3, 2, 20)
+        d[0] = 0
+        model = Hill(E0=1, Emax=0.2, h=1.5, C=0.3)
+        self.assert_backends_match(model.E, d)
+        self.assert_backends_match(model.jacobian_function, d, 1, 0.2, 0.3, -0.4)
+        self.assert_backends_match(Hill_2P(E0=1, Emax=0.2).jacobian_function, d, 0.3, -0.4)
+
+    def test_musyc(self):
+        """Ensure MuSyC matches with either backend, with and without gamma"""
+        model = MuSyC(
+            E0=1, E1=0.5, E2=0.3, E3=0.1, h1=1.2, h2=0.8, C1=0.1, C2=1, alpha12=2, alpha21=0.5, gamma12=1.5, gamma21=0.7
+        )
+        self.assert_backends_match(model.E, self.d1, self.d2)
+
+        d = (self.d1, self.d2)
+        params = [1, 0.5, 0.3, 0.1, 0.2, -0.3, -0.5, 0.6, 0.5, 0.2, 0.1, -0.1]
+        for fit_gamma in [True, False]:
+            model = MuSyC(fit_gamma=fit_gamma)
+            n_params = len(model._parameter_names)
+            self.assert_backends_match(model.fit_function, d, *params[:n_params])
+            self.assert_backends_match(model.jacobian_function, d, *params[:n_params])
+
+    def test_braid(self):
+        """Ensure BRAID matches with either backend, in every mode and for each E that differs most from E0"""
+        d = (self.d1, self.d2)
+        for mode in ["kappa", "delta", "both"]:
+            model = BRAID(mode=mode)
+            for Es in [[1, 0.2, 0.5, 0.4], [1, 0.5, 0.2, 0.4], [1, 0.5, 0.4, 0.2]]:
+                params = Es + [0.2, -0.3, -0.5, 0.6] + [0.5, 0.3][: len(model._parameter_names) - 8]
+                self.assert_backends_match(model.fit_function, d, *params)
+                self.assert_backends_match(model.jacobian_function, d, *params)
+
+        model = BRAID(E0=1, E1=0.5, E2=0.3, E3=0.1, h1=1.2, h2=0.8, C1=0.1, C2=1, kappa=1, delta=1.5)
+        self.assert_backends_match(model.E, self.d1, self.d2)
+
+    def test_zimmer(self):
+        """Ensure Zimmer matches with either backend"""
+        model = Zimmer(h1=1.2, h2=0.8, C1=0.1, C2=1, a12=0.5, a21=-0.3)
+        self.assert_backends_match(model.E, self.d1, self.d2)
+
+        params = [0.2, -0.3, -0.5, 0.6, 0.4, -0.2]
+        self.assert_backends_match(model.fit_function, (self.d1, self.d2), *params)
+        self.assert_backends_match(model.jacobian_function, (self.d1, self.d2), *params)
+
+    def test_schindler(self):
+        """Ensure 2D and ND Schindler match with either backend"""
+        model = Schindler(drug1_model=Hill(E0=1, Emax=0.2, h=1.2, C=0.1), drug2_model=Hill(E0=1, Emax=0.4, h=0.8, C=1))
+        self.assert_backends_match(model.E_reference, self.d1, self.d2)
+
+        d = dose_utils.make_dose_grid_multi((1e-3, 1e-3, 1e-3), (1e2, 1e2, 1e2), (4, 4, 4))
+        drug_models = [
+            Hill(E0=1, Emax=0.2, h=1.2, C=0.1),
+            Hill(E0=1, Emax=0.4, h=0.8, C=1),
+            Hill(E0=1, Emax=0, h=1, C=3),
+        ]
+        model_nd = SchindlerND(single_drug_models=drug_models)
+        self.assert_backends_match(model_nd.E_reference, d)
+
+
+if __name__ == "__main__":
+    unittest.main()
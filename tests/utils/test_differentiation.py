@@ -0,0 +1,110 @@
+import unittest
+from typing import Any, List, Tuple
+from unittest import TestCase
+
+import numpy as np
+
+from synergy.combination import BRAID, MuSyC, Zimmer
+from synergy.higher import MuSyC as MuSyCND
+from synergy.single import Hill
+from synergy.utils import dose_utils
+from synergy.utils.differentiation import ComplexStepJacobian, complex_step_jacobian
+from synergy.utils.model_mixins import ParametricModelMixins, _CountingFunction
+
+
+class TestComplexStepJacobian(TestCase):
+    """Tests for complex-step differentiation of model fit functions"""
+
+    def test_matches_analytic_jacobians(self):
+        """Ensure complex-step Jacobians match the analytic Jacobians of the models, including at zero doses"""
+        d1, d2 = dose_utils.make_dose_grid(1e-3, 1e2, 1e-3, 1e2, n_points1=6, n_points2=6, include_zero=True)
+        d = dose_utils.make_dose_grid_multi((1e-3, 1e-3, 1e-3), (1e2, 1e2, 1e2), (3, 3, 3), include_zero=True)
+        rng = np.random.default_rng(0)
+        braid_params = [1, 0.3, 0.5, 0.1, 0.1, -0.2, -0.3, 0.4]
+        cases: List[Tuple[Any, Any, Any]] = [
+            (Hill(), np.hstack([0, np.logspace(-2, 2, 10)]), [1, 0.1, 0.3, -0.2]),
+            (Zimmer(), (d1, d2), [0.2, -0.3, -0.5, 0.6, 0.4, -0.2]),
+            (MuSyC(), (d1, d2), [1, 0.3, 0.5, 0.1, 0.2, -0.3, -0.5, 0.6, 0.5, 0.2, 0.1, -0.1]),
+            (MuSyCND(num_drugs=3, solver="dense"), d, np.hstack([np.linspace(1, 0, 8), rng.normal(0, 0.3, 15)])),
+            (MuSyCND(num_drugs=3, solver="sparse"), d, np.hstack([np.linspace(1, 0, 8), rng.normal(0, 0.3, 15)])),
+            # At zero doses, BRAID is only nan in complex arithmetic (0 ** complex)
+            (BRAID(mode="kappa"), (d1, d2), braid_params + [0.5]),
+            (BRAID(mode="delta"), (d1, d2), braid_params + [0.3]),
+            (BRAID(mode="both"), (d1, d2), braid_params + [0.5, 0.3]),
+        ]
+        for model, xdata, params in cases:
+            expected = model.jacobian_function(xdata, *params)
+            for batched in [False, model._batch_fit_supported]:
+                jacobian = complex_step_jacobian(model.fit_function, xdata, params, batched=batched)
+                np.testing.assert_allclose(jacobian, expected, atol=1e-12, err_msg=type(model).__name__)
+
+    def test_batched_parameters(self):
+        """Ensure parameters of batched fits, shape (B, 1), give Jacobians of shape (B, M, P)"""
+        model = Hill()
+        d = np.logspace(-2, 2, 10)
+        params = [np.array([[1.0], [0.9]]), np.array([[0.1], [0.0]]), np.array([[0.3], [0.5]]), np.array([[-0.2], [0]])]
+        jacobian = ComplexStepJacobian(model.fit_function, batched=True)(d, *params)
+        self.assertEqual(jacobian.shape, (2, 10, 4))
+        np.testing.assert_allclose(jacobian, model.jacobian_function(d, *params), atol=1e-12)
+
+    def test_nan_only_in_complex_arithmetic(self):
+        """Ensure entries that are nan only in complex arithmetic are calculated, and others are set to 0"""
+
+        def function(d, a, b):
+            return np.float_power(d, a) * b * (d - 1) / (d - 1)
+
+        d = np.array([0.0, 0.5, 1.0, 2.0])
+        # The function is 0 / 0 at d = 1, where its derivatives are set to 0
+        expected = np.array(
+            [[0, 0], [np.log(0.5) * 0.5**1.5 * 3, 0.5**1.5], [0, 0], [np.log(2) * 2**1.5 * 3, 2**1.5]]
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            np.testing.assert_allclose(complex_step_jacobian(function, d, [1.5, 3.0]), expected, atol=1e-8)
+
+            batched = [np.array([[1.5], [1.5]]), np.array([[3.0], [3.0]])]
+            jacobian = complex_step_jacobian(function, d, batched, batched=True)
+            np.testing.assert_allclose(jacobian, [expected, expected], atol=1e-8)
+
+    def test_use_jacobian_auto(self):
+        """Ensure use_jacobian="auto" fits models without an analytic Jacobian with a complex-step Jacobian"""
+        d1, d2 = dose_utils.make_dose_grid(1e-2, 1e2, 1e-2, 1e2, n_points1=8, n_points2=8)
+        truth = Zimmer(h1=1.2, h2=0.8, C1=0.5, C2=2, a12=0.4, a21=-0.3)
+        E = truth.E(d1, d2)
+
+        model = Zimmer()
+        model.jacobian_function = None
+        model.fit(d1, d2, E, use_jacobian="auto")
+        for key, value in truth.get_parameters().items():
+            self.assertAlmostEqual(model.get_parameters()[key], value, places=5)
+        # The complex-step Jacobian is chosen per fit, and not kept by the model
+        self.assertIsNone(model.jacobian_function)
+        self.assertIsInstance(ParametricModelMixins.get_jacobian_function(model, "auto"), ComplexStepJacobian)
+        self.assertIsNone(ParametricModelMixins.get_jacobian_function(model, True))
+
+        # Models with an analytic Jacobian keep it
+        model = Zimmer()
+        jacobian_function = model.jacobian_function
+        model.fit(d1, d2, E, use_jacobian="auto")
+        self.assertIs(model.jacobian_function, jacobian_function)
+
+        with self.assertRaises(ValueError):
+            Zimmer().fit(d1, d2, E, use_jacobian="always")
+
+    def test_use_jacobian_auto_bootstrap_nfev(self):
+        """Ensure bootstrap nfev counts the evaluations of complex-step Jacobians"""
+        d1, d2 = dose_utils.make_dose_grid(1e-2, 1e2, 1e-2, 1e2, n_points1=6, n_points2=6)
+        E = Zimmer(h1=1.2, h2=0.8, C1=0.5, C2=2, a12=0.4, a21=-0.3).E(d1, d2)
+        E = E + np.random.default_rng(0).normal(0, 0.01, len(E))
+
+        evaluations = []
+        for bootstrap_iterations in [0, 3]:
+            model = Zimmer()
+            model.jacobian_function = None
+            model.fit_function = _CountingFunction(model.fit_function)
+            model.fit(d1, d2, E, use_jacobian="auto", bootstrap_iterations=bootstrap_iterations, seed=0)
+            evaluations.append(model.fit_function.count)
+        self.assertEqual(model.bootstrap_status.nfev, evaluations[1] - evaluations[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
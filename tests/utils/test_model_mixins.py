@@ -1,9 +1,22 @@
+import pickle
 import unittest
-from unittest import TestCase
+from typing import Any, List, Tuple
+from unittest import TestCase, mock
 
 import numpy as np
+from scipy.optimize import curve_fit
+from scipy.stats import chi2
 
-from synergy.utils.model_mixins import ParametricModelMixins
+from synergy.combination import MuSyC
+from synergy.single import Hill
+from synergy.testing_utils.synthetic_data_generators import MuSyCDataGenerator
+from synergy.utils import model_mixins
+from synergy.utils.model_mixins import (
+    EvaluationWorkspace,
+    FitContext,
+    FitIntermediatesCache,
+    ParametricModelMixins,
+)
 
 
 class MagicMock:
@@ -117,5 +130,398 @@ class TestParametricModelMixins(TestCase):
         )
 
 
+class TestBootstrapParameterRanges(TestCase):
+    """Tests for bootstrap resampling shared by all parametric models"""
+
+    d: np.ndarray
+    E: np.ndarray
+
+    @classmethod
+    def setUpClass(cls):
+        cls.d = np.logspace(-2, 2, 12)
+        cls.E = Hill(E0=1.0, Emax=0.0, h=1.0, C=1.0).E(cls.d) + np.random.default_rng(0).normal(0, 0.05, 12)
+
+    def _bootstrap(self, **kwargs):
+        model = Hill()
+        model.fit(self.d, self.E, bootstrap_iterations=20, **kwargs)
+        return model.bootstrap_parameters
+
+    def test_seed_is_reproducible(self):
+        """Ensure the same seed gives the same bootstrap parameters"""
+        np.testing.assert_array_equal(self._bootstrap(seed=1), self._bootstrap(seed=1))
+        self.assertFalse(np.array_equal(self._bootstrap(seed=1), self._bootstrap(seed=2)))
+
+    def test_results_independent_of_workers(self):
+        """Ensure bootstrap parameters do not depend on how iterations are split among workers"""
+        serial = self._bootstrap(seed=1)
+        self.assertEqual(serial.shape, (20, 4))
+        np.testing.assert_array_equal(serial, self._bootstrap(seed=1, n_jobs=3, executor="thread"))
+        np.testing.assert_array_equal(serial, self._bootstrap(seed=1, n_jobs=2, executor="process"))
+
+    def test_invalid_executor(self):
+        """Ensure an unknown executor raises an error"""
+        with self.assertRaises(ValueError):
+            self._bootstrap(n_jobs=2, executor="gpu")
+
+    def test_batch_solver_matches_curve_fit(self):
+        """Ensure the batched solver finds the same parameters as refitting each iteration with curve_fit"""
+        batch = self._bootstrap(seed=1, bootstrap_solver="batch")
+        self.assertEqual(batch.shape, (20, 4))
+        np.testing.assert_allclose(batch, self._bootstrap(seed=1), rtol=1e-3, atol=1e-4)
+
+    def test_adaptive_stopping(self):
+        """Ensure adaptive bootstrapping stops early with confidence intervals close to a full bootstrap"""
+        adaptive = Hill()
+        adaptive.fit(self.d, self.E, bootstrap_iterations=2000, seed=1, bootstrap_tol=0.05, bootstrap_window=50)
+        full = Hill()
+        full.fit(self.d, self.E, bootstrap_iterations=2000, seed=1)
+
+        self.assertLess(len(adaptive.bootstrap_parameters), 2000)
+        self.assertEqual(len(adaptive.bootstrap_parameters) % 50, 0)
+        # Adaptive refits are not capped, so they keep the same resamples as the full bootstrap
+        np.testing.assert_array_equal(
+            adaptive.bootstrap_parameters, full.bootstrap_parameters[: len(adaptive.bootstrap_parameters)]
+        )
+        adaptive_ci = adaptive.get_confidence_intervals()
+        for key, (lb, ub) in full.get_confidence_intervals().items():
+            np.testing.assert_allclose(adaptive_ci[key], (lb, ub), atol=0.2 * (ub - lb), err_msg=key)
+
+    def test_adaptive_confidence_interval(self):
+        """Ensure adaptive bootstrapping checks the stability of the requested confidence interval"""
+        checked_bounds = []
+
+        def intervals_are_stable(previous_bounds, bounds, tol):
+            checked_bounds.append(bounds)
+            return False
+
+        model = Hill()
+        with mock.patch.object(model_mixins, "_intervals_are_stable", intervals_are_stable):
+            model.fit(
+                self.d,
+                self.E,
+                bootstrap_iterations=200,
+                seed=1,
+                bootstrap_tol=0.05,
+                bootstrap_window=50,
+                bootstrap_confidence_interval=80,
+            )
+        self.assertEqual(len(checked_bounds), 2)  # After 100 and 150 iterations
+        np.testing.assert_allclose(checked_bounds[0], np.percentile(model.bootstrap_parameters[:100], [10, 90], axis=0))
+
+    def test_status_complete(self):
+        """Ensure a successful bootstrap reports that it completed"""
+        model = Hill()
+        model.fit(self.d, self.E, bootstrap_iterations=20, seed=1)
+        self.assertEqual(model.bootstrap_status.reason, "complete")
+        self.assertFalse(model.bootstrap_status.partial)
+        self.assertEqual(model.bootstrap_status.n_converged, 20)
+        self.assertGreater(model.bootstrap_status.nfev, 0)
+
+    def test_nfev_budget_keeps_partial_results(self):
+        """Ensure running out of function evaluations keeps the iterations that converged"""
+        model = Hill()
+        model.fit(self.d, self.E, bootstrap_iterations=1000, seed=1, bootstrap_max_nfev=200)
+        self.assertEqual(model.bootstrap_status.reason, "nfev_budget")
+        self.assertTrue(model.bootstrap_status.partial)
+        self.assertEqual(len(model.bootstrap_parameters), model.bootstrap_status.n_converged)
+        self.assertLess(len(model.bootstrap_parameters), 1000)
+
+    def test_timeout(self):
+        """Ensure bootstrapping stops once the wall-clock budget is used"""
+        model = Hill()
+        model.fit(self.d, self.E, bootstrap_iterations=10**6, max_iterations=10**6, bootstrap_timeout=0.2)
+        self.assertEqual(model.bootstrap_status.reason, "timeout")
+        self.assertLess(model.bootstrap_status.elapsed, 5)
+
+    def test_fail_fast(self):
+        """Ensure bootstrapping gives up early when iterations keep failing"""
+        model = Hill()
+        model.fit(self.d, self.E)
+        p0 = model._transform_params_to_fit([model.E0, model.Emax, model.h, model.C])
+        # Too few function evaluations for any iteration to converge
+        ParametricModelMixins.bootstrap_parameter_ranges(model, self.E, True, 100, 10000, self.d, p0=p0, maxfev=3)
+        self.assertEqual(model.bootstrap_status.reason, "failure_rate")
+        self.assertLess(model.bootstrap_status.n_attempted, 1000)
+        self.assertEqual(model.bootstrap_status.failure_rate, 1.0)
+        self.assertIsNone(model.bootstrap_parameters)
+
+    def test_invalid_bootstrap_solver(self):
+        """Ensure an unknown bootstrap solver raises an error"""
+        with self.assertRaises(ValueError):
+            self._bootstrap(bootstrap_solver="newton")
+
+
+class TestCovarianceConfidenceIntervals(TestCase):
+    """Tests for asymptotic confidence intervals estimated from the parameter covariance"""
+
+    d: np.ndarray
+    E: np.ndarray
+
+    @classmethod
+    def setUpClass(cls):
+        cls.d = np.logspace(-2, 2, 12)
+        cls.E = Hill(E0=1.0, Emax=0.0, h=1.0, C=1.0).E(cls.d) + np.random.default_rng(0).normal(0, 0.05, 12)
+
+    def test_docstring_math(self):
+        """Ensure LaTeX in the docstring is not mangled into escape characters"""
+        self.assertIn(r"\frac{RSS}{n - N}", ParametricModelMixins.parameter_covariance.__doc__)
+
+    def test_matches_curve_fit_covariance(self):
+        """Ensure the covariance is the same as estimated by scipy.optimize.curve_fit()"""
+        model = Hill()
+        model.fit(self.d, self.E, ci_method="covariance")
+        p0 = model._transform_params_to_fit([model.E0, model.Emax, model.h, model.C])
+        _, pcov = curve_fit(model.fit_function, self.d, self.E, p0=p0)
+        np.testing.assert_allclose(model.parameter_covariance, pcov, rtol=1e-3)
+
+    def test_intervals_are_transformed_from_fit_space(self):
+        """Ensure intervals for log-scaled parameters are symmetric in log space"""
+        model = Hill()
+        model.fit(self.d, self.E, ci_method="covariance")
+        ci = model.get_confidence_intervals()
+        lb, ub = ci["C"]
+        self.assertAlmostEqual(np.log(model.C) - np.log(lb), np.log(ub) - np.log(model.C))
+        lb, ub = ci["E0"]
+        self.assertAlmostEqual(model.E0 - lb, ub - model.E0)
+
+    def test_close_to_bootstrap(self):
+        """Ensure asymptotic intervals are similar to bootstrap intervals for a well determined fit"""
+        model = Hill()
+        model.fit(self.d, self.E, ci_method="covariance", bootstrap_iterations=500, seed=0)
+        bootstrap_ci = model.get_confidence_intervals()
+        covariance_ci = model.get_confidence_intervals(ci_method="covariance")
+        for key, (lb, ub) in bootstrap_ci.items():
+            np.testing.assert_allclose(covariance_ci[key], (lb, ub), atol=0.2 * (ub - lb), err_msg=key)
+
+    def test_invalid_ci_method(self):
+        """Ensure unknown or unavailable CI methods raise errors"""
+        model = Hill()
+        with self.assertRaises(ValueError):
+            model.fit(self.d, self.E, ci_method="jackknife")
+        model.fit(self.d, self.E)
+        with self.assertRaises(ValueError):
+            model.get_confidence_intervals(ci_method="covariance")
+
+
+class TestProfileLikelihoodConfidenceIntervals(TestCase):
+    """Tests for profile likelihood confidence intervals"""
+
+    d: np.ndarray
+    E: np.ndarray
+    model: Hill
+
+    @classmethod
+    def setUpClass(cls):
+        cls.d = np.logspace(-2, 2, 12)
+        cls.E = Hill(E0=1.0, Emax=0.0, h=1.0, C=1.0).E(cls.d) + np.random.default_rng(0).normal(0, 0.05, 12)
+        cls.model = Hill()
+        cls.model.fit(cls.d, cls.E, ci_method="profile")
+
+    def test_profiles_cross_threshold(self):
+        """Ensure each profile is minimized at the optimum and rises past the chi-square threshold on both sides"""
+        profiles = self.model.parameter_profiles
+        threshold = chi2.ppf(0.99, 1)
+        for name in self.model._parameter_names:
+            statistic = profiles.statistic(name)
+            best = np.argmin(statistic)
+            self.assertAlmostEqual(statistic[best], 0)
+            self.assertGreater(statistic[0], threshold, msg=name)
+            self.assertGreater(statistic[-1], threshold, msg=name)
+
+    def test_close_to_covariance(self):
+        """Ensure profile intervals are similar to asymptotic intervals for a well determined fit"""
+        profile_ci = self.model.get_confidence_intervals()
+        covariance_ci = self.model.get_confidence_intervals(ci_method="covariance")
+        for key, (lb, ub) in covariance_ci.items():
+            self.assertLess(profile_ci[key][0], getattr(self.model, key), msg=key)
+            self.assertGreater(profile_ci[key][1], getattr(self.model, key), msg=key)
+            np.testing.assert_allclose(profile_ci[key], (lb, ub), atol=0.25 * (ub - lb), err_msg=key)
+
+    def test_parallel_profiles_match_serial(self):
+        """Ensure profiling parameters in parallel gives the same intervals"""
+        model = Hill()
+        model.fit(self.d, self.E, ci_method="profile", n_jobs=2, executor="thread")
+        for key, interval in self.model.get_confidence_intervals().items():
+            np.testing.assert_allclose(model.get_confidence_intervals()[key], interval, err_msg=key)
+
+    def test_truncated_profiles(self):
+        """Ensure profiles stopped by the step limit warn, and give nan rather than the bounds of the parameters"""
+        model = Hill()
+        with mock.patch.object(model_mixins._LOGGER, "warning") as warning:
+            model.fit(self.d, self.E, ci_method="profile", profile_max_steps=1)
+        self.assertEqual(warning.call_count, 2 * len(model._parameter_names))
+        for name in model._parameter_names:
+            self.assertEqual(model.parameter_profiles.truncated[name], (True, True))
+            self.assertEqual(len(model.parameter_profiles.values[name]), 3)
+            self.assertTrue(np.isnan(model.get_confidence_intervals()[name]).all(), msg=name)
+
+        # Profiles that cross the threshold are not truncated
+        for name in self.model._parameter_names:
+            self.assertEqual(self.model.parameter_profiles.truncated[name], (False, False))
+
+    def test_confidence_interval_beyond_profile(self):
+        """Ensure asking for a wider interval than the profiles cover raises an error"""
+        with self.assertRaises(ValueError):
+            self.model.get_confidence_intervals(confidence_interval=99.9)
+
+
+class TestFitContext(TestCase):
+    """Tests for the dose-derived arrays shared by every evaluation of a fit"""
+
+    def test_log_doses(self):
+        """Ensure log doses are calculated once, and are -inf at zero dose"""
+        d1, d2 = np.array([0.0, 1.0, 10.0]), np.array([2.0, 0.0, 1.0])
+        context = FitContext((d1, d2))
+        np.testing.assert_array_equal(context.log_doses, np.log([[0.0, 1.0, 10.0], [2.0, 0.0, 1.0]]))
+        self.assertIs(context.log_doses, context.log_doses)
+        np.testing.assert_array_equal(context[0], d1)
+        np.testing.assert_array_equal(context[1], d2)
+
+    def test_is_for(self):
+        """Ensure contexts are matched to doses by identity"""
+        d1, d2 = np.arange(3.0), np.arange(3.0)
+        context = FitContext((d1, d2))
+        self.assertTrue(context.is_for((d1, d2)))
+        self.assertFalse(context.is_for((d1, d2.copy())))
+        self.assertIs(FitContext.of(context), context)
+        self.assertFalse(FitContext.of((d1, d2)) is context)
+
+    def test_fit_evaluates_one_context(self):
+        """Ensure every evaluation of a fit (including bootstrap refits) receives the same context"""
+        model = Hill()
+        contexts = []
+        fit_function, jacobian_function = model.fit_function, model.jacobian_function
+
+        def recording_fit_function(d, *params):
+            contexts.append(d)
+            return fit_function(d, *params)
+
+        def recording_jacobian_function(d, *params):
+            contexts.append(d)
+            return jacobian_function(d, *params)
+
+        model.fit_function = recording_fit_function
+        model.jacobian_function = recording_jacobian_function
+        d = np.logspace(-2, 2, 12)
+        E = Hill(E0=1, Emax=0, h=1, C=1).E(d) + np.random.default_rng(0).normal(0, 0.01, len(d))
+        model.fit(d, E, bootstrap_iterations=3, seed=0)
+
+        self.assertTrue(model.is_converged)
+        self.assertIsInstance(contexts[0], FitContext)
+        self.assertTrue(all(context is contexts[0] for context in contexts))
+        self.assertIsNone(model._fit_context)
+
+    def test_context_released_when_fit_raises(self):
+        """Ensure 1D and 2D models release their fit context when fitting raises"""
+        d = np.logspace(-2, 2, 12)
+        E = Hill(E0=1, Emax=0, h=1, C=1).E(d)
+        d1, d2, E_2d = MuSyCDataGenerator.get_2drug_combination(E_noise=0, d_noise=0)
+        cases: List[Tuple[Any, Tuple[np.ndarray, ...]]] = [(Hill(), (d, E)), (MuSyC(), (d1, d2, E_2d))]
+        for model, args in cases:
+            with self.subTest(model=type(model).__name__):
+                with mock.patch.object(model, "_fit", side_effect=RuntimeError("failed")):
+                    with self.assertRaises(RuntimeError):
+                        model.fit(*args)
+                self.assertIsNone(model._fit_context)
+
+
+class TestFitIntermediatesCache(TestCase):
+    """Tests for the single-entry cache shared by fit and Jacobian functions"""
+
+    def setUp(self):
+        self.calls = 0
+        self.cache = FitIntermediatesCache()
+        self.xdata = np.arange(5.0)
+
+    def _intermediates(self, x, a):
+        self.calls += 1
+        return x**a
+
+    def test_reuses_last_evaluation(self):
+        """Ensure repeated evaluations at the same xdata and parameters are computed once"""
+        first = self.cache.get(self._intermediates, self.xdata, (2.0,), self.xdata, 2.0)
+        second = self.cache.get(self._intermediates, self.xdata, (2.0,), self.xdata, 2.0)
+        self.assertIs(first, second)
+        self.assertEqual(self.calls, 1)
+
+    def test_recomputes_when_key_changes(self):
+        """Ensure new parameters, new xdata, or a cleared cache are recomputed"""
+        self.cache.get(self._intermediates, self.xdata, (2.0,), self.xdata, 2.0)
+        np.testing.assert_array_equal(
+            self.cache.get(self._intermediates, self.xdata, (3.0,), self.xdata, 3.0), self.xdata**3
+        )
+        self.assertEqual(self.calls, 2)
+
+        xdata = self.xdata.copy()
+        self.cache.get(self._intermediates, xdata, (3.0,), xdata, 3.0)
+        self.assertEqual(self.calls, 3)
+
+        self.cache.clear()
+        self.cache.get(self._intermediates, xdata, (3.0,), xdata, 3.0)
+        self.assertEqual(self.calls, 4)
+
+    def test_batched_parameters(self):
+        """Ensure parameters passed as arrays (for batched fits) are compared by value"""
+        a = np.array([[1.0], [2.0]])
+        self.cache.get(self._intermediates, self.xdata, (a,), self.xdata, a)
+        self.cache.get(self._intermediates, self.xdata, (a.copy(),), self.xdata, a)
+        self.assertEqual(self.calls, 1)
+        self.cache.get(self._intermediates, self.xdata, (a[:1],), self.xdata, a[:1])
+        self.assertEqual(self.calls, 2)
+
+    def test_complex_parameters(self):
+        """Ensure complex-step evaluations do not reuse intermediates of real parameters, or vice versa"""
+        self.cache.get(self._intermediates, self.xdata, (2.0,), self.xdata, 2.0)
+        value = self.cache.get(self._intermediates, self.xdata, (2.0 + 1e-20j,), self.xdata, 2.0 + 1e-20j)
+        self.assertEqual(self.calls, 2)
+        self.assertTrue(np.iscomplexobj(value))
+
+        self.cache.get(self._intermediates, self.xdata, (2.0,), self.xdata, 2.0)
+        self.assertEqual(self.calls, 3)
+
+    def test_pickle_drops_entry(self):
+        """Ensure pickled caches start empty"""
+        self.cache.get(self._intermediates, self.xdata, (2.0,), self.xdata, 2.0)
+        self.assertIsNone(pickle.loads(pickle.dumps(self.cache))._entry)
+
+
+class TestEvaluationWorkspace(TestCase):
+    """Tests for the scratch arrays models reuse between evaluations"""
+
+    def test_reuse(self):
+        """Ensure arrays are reused only while their shape and dtype are unchanged"""
+        workspace = EvaluationWorkspace()
+        with workspace.get(3, (4,), np.float64) as buffers:
+            self.assertEqual(buffers.shape, (3, 4))
+        with workspace.get(3, (4,), np.float64) as reused:
+            self.assertIs(reused, buffers)
+        with workspace.get(3, (5,), np.float64) as resized:
+            self.assertEqual(resized.shape, (3, 5))
+        with workspace.get(3, (5,), np.complex128) as complex_buffers:
+            self.assertEqual(complex_buffers.dtype, np.complex128)
+        workspace.clear()
+        with workspace.get(3, (5,), np.complex128) as cleared:
+            self.assertIsNot(cleared, complex_buffers)
+
+    def test_nested(self):
+        """Ensure a caller does not get arrays that another caller is using"""
+        workspace = EvaluationWorkspace()
+        with workspace.get(2, (), np.float64) as outer:
+            with workspace.get(2, (), np.float64) as inner:
+                self.assertIsNot(inner, outer)
+        with workspace.get(2, (), np.float64) as buffers:
+            self.assertIs(buffers, outer)
+
+    def test_pickle_drops_arrays(self):
+        """Ensure pickled workspaces start empty and usable"""
+        workspace = EvaluationWorkspace()
+        with workspace.get(2, (3,), np.float64):
+            pass
+        unpickled = pickle.loads(pickle.dumps(workspace))
+        self.assertIsNone(unpickled._buffers)
+        with unpickled.get(2, (3,), np.float64) as buffers:
+            self.assertEqual(buffers.shape, (2, 3))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from typing import List, Tuple
+from unittest import TestCase
+
+import numpy as np
+from scipy.optimize import curve_fit
+
+from synergy.utils.optimize import batch_curve_fit, batch_finite_difference_jacobian
+
+
+def _exponential(x, a, k):
+    return a * np.exp(-k * x)
+
+
+def _exponential_jacobian(x, a, k):
+    return np.stack(np.broadcast_arrays(np.exp(-k * x), -a * x * np.exp(-k * x)), axis=-1)
+
+
+class TestBatchCurveFit(TestCase):
+    """Tests for the batched Levenberg-Marquardt solver"""
+
+    x: np.ndarray
+    true_params: np.ndarray
+    y: np.ndarray
+    bounds: Tuple[List[float], List[float]]
+
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(0)
+        cls.x = np.linspace(0, 4, 20)
+        cls.true_params = np.column_stack([rng.uniform(0.5, 2, 8), rng.uniform(0.2, 3, 8)])
+        cls.y = _exponential(cls.x, *cls.true_params.T[:, :, None]) + rng.normal(0, 0.02, (8, 20))
+        cls.bounds = ([0.0, 0.0], [np.inf, np.inf])
+
+    def test_matches_curve_fit(self):
+        """Ensure each row converges to the same optimum as scipy.optimize.curve_fit()"""
+        popt, converged = batch_curve_fit(
+            _exponential, self.x, self.y, [1.0, 1.0], self.bounds, jac=_exponential_jacobian
+        )
+        self.assertTrue(converged.all())
+        for row, y in zip(popt, self.y):
+            expected, _ = curve_fit(_exponential, self.x, y, p0=[1.0, 1.0], bounds=self.bounds)
+            np.testing.assert_allclose(row, expected, rtol=1e-4)
+
+    def test_finite_difference_jacobian(self):
+        """Ensure the solver converges without an analytic Jacobian"""
+        popt, converged = batch_curve_fit(_exponential, self.x, self.y, [1.0, 1.0], self.bounds)
+        self.assertTrue(converged.all())
+        np.testing.assert_allclose(popt, self.true_params, rtol=0.1)
+
+    def test_bounds_are_respected(self):
+        """Ensure parameters never leave the feasible region"""
+        bounds = ([0, 0], [1.0, np.inf])
+        popt, _ = batch_curve_fit(_exponential, self.x, self.y, [0.5, 1.0], bounds, jac=_exponential_jacobian)
+        self.assertTrue((popt[:, 0] <= 1.0).all())
+
+    def test_unconverged_rows_are_nan(self):
+        """Ensure rows that run out of iterations are reported as failures"""
+        popt, converged = batch_curve_fit(
+            _exponential, self.x, self.y, [1.0, 1.0], self.bounds, jac=_exponential_jacobian, max_nfev=1
+        )
+        self.assertFalse(converged.all())
+        self.assertTrue(np.isnan(popt[~converged]).all())
+
+    def test_finite_difference_matches_analytic(self):
+        """Ensure the batched finite difference Jacobian approximates the analytic Jacobian"""
+        rows = np.arange(len(self.true_params))
+
+        def residuals(p, rows):
+            return _exponential(self.x, *p.T[:, :, None]) - self.y[rows]
+
+        numeric = batch_finite_difference_jacobian(residuals, self.true_params, rows)
+        analytic = _exponential_jacobian(self.x, *self.true_params.T[:, :, None])
+        np.testing.assert_allclose(numeric, analytic, atol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()
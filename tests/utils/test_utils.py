@@ -123,3 +123,12 @@ a;boo;c  ;d
 """
     table = utils.format_table(rows, col_sep=";")
     assert table == expected[1:-1]
+
+
+def test_aic_arrays():
+    """Ensure AIC scores arrays of fits elementwise, including the small-sample correction"""
+    sum_of_squares_residuals = np.asarray([0.5, 2.0])
+    n_samples = np.asarray([10, 400])
+    aic = utils.AIC(sum_of_squares_residuals, 4, n_samples)
+    expected = [utils.AIC(ssr, 4, n) for ssr, n in zip(sum_of_squares_residuals, n_samples)]
+    np.testing.assert_allclose(aic, expected)